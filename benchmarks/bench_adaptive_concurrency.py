@@ -0,0 +1,90 @@
+"""
+Fixed vs adaptive concurrency against an endpoint with limited capacity.
+
+Usage:
+    python benchmarks/bench_adaptive_concurrency.py [--calls 2000]
+                                                    [--capacity 32]
+
+Calls a fake endpoint `--calls` times through `alcall`, with retries.
+The endpoint serves up to `--capacity` calls at once at a steady
+latency; beyond that, latency grows with the overload and each extra
+call may be rejected with a 429. Compares fixed `max_concurrent`
+values below, at and far above the capacity with an
+`AdaptiveConcurrencyLimiter`, reporting throughput, 429s and the final
+adaptive limit.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from lion.libs.concurrency import AdaptiveConcurrencyLimiter
+from lion.libs.func import alcall
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class _Endpoint:
+    def __init__(self, capacity: int, latency: float = 0.01) -> None:
+        self.capacity = capacity
+        self.latency = latency
+        self.in_flight = 0
+        self.rejected = 0
+
+    async def call(self, x: int) -> int:
+        self.in_flight += 1
+        try:
+            overload = self.in_flight / self.capacity
+            if overload > 1 and random.random() < 1 - 1 / overload:
+                self.rejected += 1
+                await asyncio.sleep(self.latency / 10)
+                raise RateLimitError("429 Too Many Requests")
+            await asyncio.sleep(self.latency * max(overload, 1.0))
+            return x
+        finally:
+            self.in_flight -= 1
+
+
+async def _run(args, max_concurrent) -> tuple[float, int]:
+    endpoint = _Endpoint(args.capacity)
+    start = time.perf_counter()
+    await alcall(
+        range(args.calls),
+        endpoint.call,
+        max_concurrent=max_concurrent,
+        num_retries=20,
+        retry_delay=0.01,
+        backoff_factor=1.5,
+        verbose_retry=False,
+    )
+    return time.perf_counter() - start, endpoint.rejected
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--capacity", type=int, default=32)
+    args = parser.parse_args()
+    random.seed(0)
+
+    print(f"{'limit':<20}{'calls/s':>10}{'429s':>8}")
+    for fixed in (args.capacity // 4, args.capacity, args.capacity * 8):
+        elapsed, rejected = asyncio.run(_run(args, fixed))
+        name = f"fixed {fixed}"
+        print(f"{name:<20}{args.calls / elapsed:>10,.0f}{rejected:>8}")
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+    elapsed, rejected = asyncio.run(_run(args, limiter))
+    print(f"{'adaptive':<20}{args.calls / elapsed:>10,.0f}{rejected:>8}")
+    stats = limiter.stats()
+    print(
+        f"final limit {stats['limit']} (capacity {args.capacity}), "
+        f"{stats['decreases']} decreases"
+    )
+
+
+if __name__ == "__main__":
+    main()
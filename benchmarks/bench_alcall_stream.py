@@ -0,0 +1,76 @@
+"""
+alcall vs the streaming alcall_iter on a long input.
+
+Usage:
+    python benchmarks/bench_alcall_stream.py [--inputs 100000] [--window 256]
+
+Maps a short async function over `--inputs` integers with `alcall`,
+which creates every coroutine up front and returns a list, and with
+`alcall_iter`, which keeps at most `--window` calls in flight, in order
+and unordered. Reports wall time, time to the first result and peak
+traced memory.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from lion.libs.func import alcall, alcall_iter
+
+
+async def _work(x: int) -> int:
+    await asyncio.sleep(0)
+    return x * 2
+
+
+async def _measure(consume) -> tuple[float, float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = await consume()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, first - start, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--inputs", type=int, default=100_000)
+    parser.add_argument("--window", type=int, default=256)
+    args = parser.parse_args()
+
+    async def batch() -> float:
+        await alcall(list(range(args.inputs)), _work)
+        return time.perf_counter()
+
+    def stream(ordered: bool):
+        async def consume() -> float:
+            first = None
+            async for _ in alcall_iter(
+                range(args.inputs),
+                _work,
+                max_concurrent=args.window,
+                ordered=ordered,
+            ):
+                first = first or time.perf_counter()
+            return first
+
+        return consume
+
+    rows = {
+        "alcall": batch,
+        "alcall_iter ordered": stream(True),
+        "alcall_iter unordered": stream(False),
+    }
+    print(f"{args.inputs} inputs, window {args.window}")
+    for name, consume in rows.items():
+        elapsed, first, peak = asyncio.run(_measure(consume))
+        print(
+            f"{name:<24}{elapsed * 1e3:>10.1f} ms"
+            f"{first * 1e3:>10.1f} ms to first{peak / 2**20:>10.1f} MB peak"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Forking a long branch: eager clone vs copy-on-write.
+
+Usage:
+    python benchmarks/bench_branch_fork.py [--messages 500] [--forks 100]
+
+Builds a branch with `--messages` messages and forks it `--forks` times
+with `Branch.clone()` (every message cloned) and with
+`Branch.clone(copy_on_write=True)` (messages shared until modified).
+Reports total time and the memory retained by the forks.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from lion import Branch
+
+
+def _build(messages: int) -> Branch:
+    branch = Branch()
+    for i in range(messages // 2):
+        branch.msgs.add_message(
+            instruction=f"Question {i}",
+            context={"section": i, "text": "lorem ipsum " * 20},
+        )
+        branch.msgs.add_message(assistant_response=f"Answer {i}. " * 10)
+    return branch
+
+
+def _fork(branch: Branch, forks: int, copy_on_write: bool):
+    tracemalloc.start()
+    start = time.perf_counter()
+    children = [branch.clone(copy_on_write=copy_on_write) for _ in range(forks)]
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return children, elapsed, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--forks", type=int, default=100)
+    args = parser.parse_args()
+
+    branch = _build(args.messages)
+    print(f"{len(branch.msgs.messages)} messages, {args.forks} forks")
+    for name, cow in (("clone", False), ("copy-on-write", True)):
+        children, elapsed, retained = _fork(branch, args.forks, cow)
+        print(
+            f"{name:<16}{elapsed * 1e3:>10.1f} ms"
+            f"{elapsed / args.forks * 1e3:>10.2f} ms/fork"
+            f"{retained / 2**20:>10.1f} MB"
+        )
+        del children
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Latency and allocations of serializing a 200-message Branch.
+
+Usage:
+    python benchmarks/bench_branch_serialize.py [--turns 100] [--runs 20]
+
+Builds a Branch with `--turns` instruction/response pairs, the responses
+carrying a model_response in their metadata, and reports the median time
+and peak traced memory of dumping every message with `to_dict()`. For
+reference it also times the deep copies the previous serializers made
+per message (`Note` content, then `RoledMessage` content again), which
+the current serializers no longer perform.
+"""
+
+import argparse
+import copy
+import statistics
+import time
+import tracemalloc
+
+from lion import Branch
+
+
+def _model_response(i: int) -> dict:
+    return {
+        "id": f"chatcmpl-{i}",
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": f"Answer {i}. " * 40},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 900 + i, "completion_tokens": 120},
+    }
+
+
+def _build(turns: int) -> Branch:
+    branch = Branch()
+    for i in range(turns):
+        branch.msgs.add_message(
+            instruction=f"Question {i}: summarize section {i}.",
+            context=[{"section": i, "text": "lorem ipsum dolor " * 30}],
+            guidance="Answer in two sentences.",
+        )
+        branch.msgs.add_message(
+            assistant_response={
+                "content": f"Answer {i}. " * 40,
+                "model_response": _model_response(i),
+            }
+        )
+    return branch
+
+
+def _measure(fn, runs: int) -> tuple[float, float]:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(times) * 1e3, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    branch = _build(args.turns)
+    messages = list(branch.msgs.messages)
+
+    def dump():
+        return [m.to_dict() for m in messages]
+
+    def legacy_copies():
+        for m in messages:
+            copy.deepcopy(m.content.content)
+            copy.deepcopy(m.content.content)
+            copy.deepcopy(m.metadata.content)
+
+    print(f"{len(messages)} messages")
+    for name, fn in {
+        "to_dict (all messages)": dump,
+        "previous deep copies": legacy_copies,
+    }.items():
+        ms, mb = _measure(fn, args.runs)
+        print(f"{name:<26}{ms:>9.2f} ms{mb:>9.2f} MB peak")
+
+
+if __name__ == "__main__":
+    main()
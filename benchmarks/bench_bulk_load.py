@@ -0,0 +1,78 @@
+"""
+Loading serialized messages one by one vs in bulk.
+
+Usage:
+    python benchmarks/bench_bulk_load.py [--messages 20000]
+
+Serializes a mix of system, instruction, assistant response and action
+messages, checks that a pile of them round-trips through
+`Pile.from_dict`, then reports records per second for
+`RoledMessage.from_dict` in a loop, `RoledMessage.from_dicts` and
+`Pile.from_records`.
+"""
+
+import argparse
+import time
+
+from lion.core.communication import (
+    ActionRequest,
+    ActionResponse,
+    AssistantResponse,
+    Instruction,
+    RoledMessage,
+    System,
+)
+from lion.core.generic import Pile
+
+
+def _rate(fn, count: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=20_000)
+    args = parser.parse_args()
+
+    messages = [System(system="You are a careful analyst.")]
+    for i in range(args.messages // 4):
+        request = ActionRequest(
+            function="lookup",
+            arguments={"section": i},
+            sender="assistant",
+            recipient="user",
+        )
+        messages += [
+            Instruction(
+                instruction=f"Question {i}",
+                context={"section": i},
+                sender="user",
+            ),
+            request,
+            ActionResponse(action_request=request, output=f"Section {i}"),
+            AssistantResponse(
+                assistant_response={"content": f"Answer {i}"},
+                sender="assistant",
+                recipient="user",
+            ),
+        ]
+    records = [m.to_dict() for m in messages]
+    count = len(records)
+
+    loaded = Pile.from_dict(Pile(messages).to_dict())
+    if [m.to_dict() for m in loaded] != records:
+        raise AssertionError("Pile.from_dict did not round-trip the messages")
+
+    rows = {
+        "from_dict loop": lambda: [RoledMessage.from_dict(r) for r in records],
+        "from_dicts": lambda: RoledMessage.from_dicts(records),
+        "Pile.from_records": lambda: Pile.from_records(records),
+    }
+    for name, fn in rows.items():
+        print(f"{name:<20}{_rate(fn, count):>12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Rendering a conversation for the model on every call.
+
+Usage:
+    python benchmarks/bench_chat_msgs.py [--turns 200] [--runs 20]
+
+Builds a Branch with `--turns` instruction/response pairs and reports
+the median time of `MessageManager.to_chat_msgs()` with the per-message
+chat cache warm, against rendering every message from scratch as the
+previous implementation did. The last row replays the conversation turn
+by turn, rendering the history before each new instruction, which is
+the pattern `Branch.chat` follows.
+"""
+
+import argparse
+import statistics
+import time
+
+from lion import Branch
+
+
+def _add_turn(branch: Branch, i: int) -> None:
+    branch.msgs.add_message(
+        instruction=f"Question {i}: summarize section {i}.",
+        context=[{"section": i, "text": "lorem ipsum dolor " * 30}],
+        guidance="Answer in two sentences.",
+    )
+    branch.msgs.add_message(assistant_response=f"Answer {i}. " * 20)
+
+
+def _median_ms(fn, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    branch = Branch()
+    for i in range(args.turns):
+        _add_turn(branch, i)
+    branch.msgs.to_chat_msgs()
+
+    def uncached():
+        return [m._render_chat_msg() for m in branch.msgs.messages]
+
+    def replay():
+        replayed = Branch()
+        for i in range(args.turns):
+            replayed.msgs.to_chat_msgs()
+            _add_turn(replayed, i)
+
+    print(f"{len(branch.msgs.messages)} messages")
+    rows = {
+        "to_chat_msgs (cached)": _median_ms(branch.msgs.to_chat_msgs, args.runs),
+        "render every message": _median_ms(uncached, args.runs),
+        "replay conversation": _median_ms(replay, max(args.runs // 10, 1)),
+    }
+    for name, ms in rows.items():
+        print(f"{name:<24}{ms:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
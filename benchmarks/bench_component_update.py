@@ -0,0 +1,75 @@
+"""
+Cost of attribute assignment on a Component.
+
+Usage:
+    python benchmarks/bench_component_update.py [--count 100000]
+
+Compares the previous per-assignment bookkeeping (a tz-aware timestamp
+written into `metadata["last_updated"]` through `Note.set`, reproduced
+in `_legacy_touch`) with the deferred tracker, for single assignments
+and for two and five assignments with and without `batch_update()`.
+"""
+
+import argparse
+import time
+
+from lion.core.generic import Component
+from lion.libs.utils import time as lion_time
+
+
+def _legacy_touch(component: Component, field_name: str) -> None:
+    component.metadata.set(["last_updated", field_name], lion_time())
+
+
+def _per_op(fn, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        fn(i)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    comp = Component()
+
+    def legacy(i):
+        object.__setattr__(comp, "content", i)
+        _legacy_touch(comp, "content")
+
+    def assign(i):
+        comp.content = i
+
+    def assign_pair(i):
+        comp.content = i
+        comp.embedding = []
+
+    def batched_pair(i):
+        with comp.batch_update():
+            comp.content = i
+            comp.embedding = []
+
+    def assign_five(i):
+        for _ in range(5):
+            comp.content = i
+
+    def batched_five(i):
+        with comp.batch_update():
+            for _ in range(5):
+                comp.content = i
+
+    rows = {
+        "legacy assignment": _per_op(legacy, args.count),
+        "assignment": _per_op(assign, args.count),
+        "2 assignments": _per_op(assign_pair, args.count),
+        "2 in batch_update": _per_op(batched_pair, args.count),
+        "5 assignments": _per_op(assign_five, args.count),
+        "5 in batch_update": _per_op(batched_five, args.count),
+    }
+    for name, us in rows.items():
+        print(f"{name:<24}{us:>10.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
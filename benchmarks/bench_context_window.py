@@ -0,0 +1,74 @@
+"""
+Choosing the context window of a long conversation.
+
+Usage:
+    python benchmarks/bench_context_window.py [--turns 1000] [--budget 8000]
+                                              [--runs 20]
+
+Builds a Branch with `--turns` instruction/response pairs and reports
+the median time and estimated prompt tokens of the full history
+(`to_chat_msgs`) against a `--budget`-token window (`to_context_msgs`),
+both dropping and summarizing older turns. The first window call counts
+every message; later calls reuse the per-message token counts.
+"""
+
+import argparse
+import statistics
+import time
+
+from lion import Branch
+from lion.libs.tokenizer import count_chat_tokens
+from lion.protocols.configs import ContextWindowConfig
+
+
+def _median_ms(fn, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=1000)
+    parser.add_argument("--budget", type=int, default=8000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    branch = Branch(system="You are a careful analyst.")
+    for i in range(args.turns):
+        branch.msgs.add_message(
+            instruction=f"Question {i}: summarize section {i}.",
+            context=[{"section": i, "text": "lorem ipsum dolor " * 30}],
+        )
+        branch.msgs.add_message(assistant_response=f"Answer {i}. " * 20)
+    msgs = branch.msgs
+
+    start = time.perf_counter()
+    msgs.context_tokens()
+    print(
+        f"{len(msgs.messages)} messages, counted in "
+        f"{(time.perf_counter() - start) * 1e3:.1f} ms"
+    )
+
+    rows = {"full history": msgs.to_chat_msgs}
+    for overflow in ("drop", "summarize"):
+        config = ContextWindowConfig(max_tokens=args.budget, overflow=overflow)
+
+        def window(config=config):
+            msgs.context_window = config
+            return msgs.to_context_msgs()
+
+        rows[f"window ({overflow})"] = window
+
+    for name, fn in rows.items():
+        ms = _median_ms(fn, args.runs)
+        sent = fn()
+        tokens = sum(count_chat_tokens(m) for m in sent)
+        print(f"{name:<20}{ms:>10.2f} ms{len(sent):>8} msgs{tokens:>10} tokens")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Log entries created per second: validated constructor vs `fast_new`.
+
+Usage:
+    python benchmarks/bench_element_construction.py [--count 20000]
+
+Compares the `Log` constructor with `Log.fast_new` on the same
+already-valid field values, and times `RoledMessage.to_log` and
+`ObservableAction.to_log`, which build their Log with `fast_new`.
+"""
+
+import argparse
+import time
+
+from lion.core.action import FunctionCalling, Tool
+from lion.core.communication import Instruction
+from lion.core.generic import Log
+from lion.core.typing import ID, Note
+
+
+def _rate(fn, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return count / (time.perf_counter() - start)
+
+
+def _add(a: int, b: int) -> int:
+    return a + b
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    sender, recipient = ID.id(), ID.id()
+    ins = Instruction(
+        instruction="Summarize the report",
+        context={"pages": 12},
+        sender=sender,
+        recipient=recipient,
+    )
+    call = FunctionCalling(func_tool=Tool(function=_add), arguments={"a": 1, "b": 2})
+    log_content = Note(**ins.to_dict()["content"])
+    log_info = Note(lion_class="Instruction", sender=sender)
+
+    slow_rate = _rate(lambda: Log(content=log_content, loginfo=log_info), args.count)
+    fast_rate = _rate(
+        lambda: Log.fast_new(content=log_content, loginfo=log_info), args.count
+    )
+    print(f"{'class':<24}{'constructor':>16}{'fast_new':>16}{'speedup':>10}")
+    print(
+        f"{'Log':<24}{slow_rate:>12,.0f} /s{fast_rate:>12,.0f} /s"
+        f"{fast_rate / slow_rate:>9.1f}x"
+    )
+    for name, to_log in (
+        ("Instruction.to_log", ins.to_log),
+        ("FunctionCalling.to_log", call.to_log),
+    ):
+        print(f"{name:<24}{_rate(to_log, args.count):>12,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Throughput of Lion ID generation.
+
+Usage:
+    python benchmarks/bench_id_generation.py [--count 100000]
+
+Compares the hashing path (`ID._id` with a per-call config dump, as
+`ID.id` used to do), the buffered generator behind `ID.id`, batch
+`ID.ids(n)` and the k-sortable layout.
+"""
+
+import argparse
+import time
+
+from lion.core.typing import ID, IDGenerator
+from lion.settings import LionIDConfig, Settings
+
+
+def _rate(fn, count: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    count = args.count
+    config = Settings.Config.ID
+    sortable = IDGenerator(LionIDConfig(**config.clean_dump(), sortable=True))
+
+    rows = {
+        "hashing (legacy)": lambda: [
+            ID._id(**config.clean_dump()) for _ in range(count)
+        ],
+        "ID.id": lambda: [ID.id() for _ in range(count)],
+        "ID.ids(n)": lambda: ID.ids(count),
+        "sortable": lambda: [sortable.new() for _ in range(count)],
+    }
+    for name, fn in rows.items():
+        rate = _rate(fn, count)
+        print(f"{name:<20}{rate / 1e6:>8.2f} M ids/s{1e6 / rate:>10.2f} us/id")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Per-call cost of Lion ID validation.
+
+Usage:
+    python benchmarks/bench_id_validation.py [--ids 10000] [--repeat 10]
+
+Compares the previous per-call implementation of `ID.get_id` (copied
+below as `_legacy_get_id`) with the compiled validator, on its own and
+through `ID.get_id`, with `ID.is_id` on invalid input and with
+`ID.validate_many`.
+"""
+
+import argparse
+import time
+
+from lion.core.typing import ID, IDError, IDValidator, Observable
+from lion.settings import Settings
+
+
+def _legacy_get_id(item, config=Settings.Config.ID):
+    item_id = item.ln_id if isinstance(item, Observable) else item
+    check = isinstance(item_id, str)
+    if check:
+        id_len = (
+            (len(config.prefix) if config.prefix else 0)
+            + config.n
+            + config.num_hyphens
+            + (len(config.postfix) if config.postfix else 0)
+        )
+        if len(item_id) != id_len:
+            check = False
+    if check and config.prefix:
+        if item_id.startswith(config.prefix):
+            item_id = item_id[len(config.prefix) :]  # noqa
+        else:
+            check = False
+    if check and config.postfix:
+        if item_id.endswith(config.postfix):
+            item_id = item_id[: -len(config.postfix)]
+        else:
+            check = False
+    if check and config.num_hyphens:
+        if config.num_hyphens != item_id.count("-"):
+            check = False
+    if check and config.hyphen_start_index:
+        idx = config.hyphen_start_index - len(config.prefix)
+        if idx > 0 and "-" in item_id[:idx]:
+            check = False
+    if check:
+        return config.prefix + item_id + config.postfix
+    raise IDError("invalid")
+
+
+def _legacy_is_id(item) -> bool:
+    try:
+        _legacy_get_id(item)
+        return True
+    except IDError:
+        return False
+
+
+def _per_call(fn, items, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for i in items:
+            fn(i)
+    return (time.perf_counter() - start) / (len(items) * repeat) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ids", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    ids = [ID.id() for _ in range(args.ids)]
+    invalid = [f"not-an-id-{i}" for i in range(args.ids)]
+    validator = IDValidator.for_config(Settings.Config.ID)
+
+    rows = {
+        "legacy get_id": _per_call(_legacy_get_id, ids, args.repeat),
+        "compiled is_valid": _per_call(validator.is_valid, ids, args.repeat),
+        "ID.get_id": _per_call(ID.get_id, ids, args.repeat),
+        "legacy is_id invalid": _per_call(_legacy_is_id, invalid, args.repeat),
+        "ID.is_id invalid": _per_call(ID.is_id, invalid, args.repeat),
+    }
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        ID.validate_many(ids)
+    rows["ID.validate_many"] = (
+        (time.perf_counter() - start) / (len(ids) * args.repeat) * 1e9
+    )
+
+    for name, ns in rows.items():
+        print(f"{name:<28}{ns:>10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Import-time and memory regression check for `import lion`.
+
+Usage:
+    python benchmarks/bench_import_footprint.py [--runs 5]
+                                                [--max-ms 1500]
+                                                [--max-rss-mb 250]
+
+Imports `lion` and `lion.core.generic` in fresh interpreters and reports
+the median wall time and peak RSS of each. Exits non-zero if either
+import loads pandas, numpy or litellm (they are deferred until first
+use), or if a median exceeds `--max-ms` / `--max-rss-mb`.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MODULES = ("lion", "lion.core.generic")
+DEFERRED = ("pandas", "numpy", "litellm")
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss //= 1024
+print(json.dumps({{
+    "ms": elapsed * 1e3,
+    "rss_mb": rss / 1024,
+    "loaded": [m for m in {deferred!r} if m in sys.modules],
+}}))
+"""
+
+
+def _probe(module: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, deferred=DEFERRED)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=1500.0)
+    parser.add_argument("--max-rss-mb", type=float, default=250.0)
+    args = parser.parse_args()
+
+    failures = []
+    for module in MODULES:
+        runs = [_probe(module) for _ in range(args.runs)]
+        ms = statistics.median(r["ms"] for r in runs)
+        rss = statistics.median(r["rss_mb"] for r in runs)
+        loaded = sorted({m for r in runs for m in r["loaded"]})
+        print(f"{module:<20}{ms:>10.1f} ms{rss:>10.1f} MB  eager: {loaded or '-'}")
+
+        if loaded:
+            failures.append(f"{module} imports {', '.join(loaded)} eagerly")
+        if ms > args.max_ms:
+            failures.append(f"{module} took {ms:.1f} ms (> {args.max_ms} ms)")
+        if rss > args.max_rss_mb:
+            failures.append(f"{module} peaked at {rss:.1f} MB (> {args.max_rss_mb} MB)")
+
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Cold-start import time, measured with `python -X importtime`.
+
+Usage:
+    python benchmarks/bench_import_time.py [--module lion] [--runs 5]
+                                           [--top 15]
+
+Each run imports `--module` in a fresh interpreter with `-X importtime`
+and reads the cumulative time of every module from stderr. Reports the
+median total, the median time of `lion.core._class_registry`, and the
+slowest modules. Runs share an empty `LION_CACHE_DIR`, so the first
+one builds the class manifest (cold) and the rest reuse it (warm);
+delete `lion/core/_class_manifest.json` first if the package directory
+is writable and already holds one.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+def _import_times(module: str, env: dict) -> dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")  # noqa
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="lion")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = {**os.environ, "LION_CACHE_DIR": cache_dir}
+        runs = [_import_times(args.module, env) for _ in range(args.runs)]
+
+    cold, warm = runs[0], runs[1:] or runs
+    registry = "lion.core._class_registry"
+
+    def median(name: str) -> float:
+        return statistics.median(r.get(name, 0) for r in warm) / 1e3
+
+    for name in (args.module, registry):
+        print(
+            f"{name}: cold {cold.get(name, 0) / 1e3:.1f} ms, "
+            f"warm median {median(name):.1f} ms"
+        )
+    print("\nslowest modules (warm median, cumulative):")
+    names = sorted(warm[0], key=median, reverse=True)[: args.top]
+    for name in names:
+        print(f"{median(name):>10.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Nested access on Note, on message-content shapes.
+
+Usage:
+    python benchmarks/bench_note_access.py [--count 200000]
+
+For paths into instruction, assistant-response, action-request and
+model-response content, compares the previous `Note.get`/`Note.set`
+path (normalize with `to_list`, then `nget`/`nset`/`ninsert`,
+reproduced below) with the current `Note` methods and with a
+precompiled `NotePath`.
+"""
+
+import argparse
+import time
+
+from lion.core.typing import Note, NotePath
+from lion.libs.parse import nget, ninsert, nset, to_list
+
+CONTENT = {
+    "instruction": "Summarize the attached report in three bullet points.",
+    "context": [{"page": i, "text": "lorem ipsum " * 20} for i in range(4)],
+    "guidance": "Be concise.",
+    "images": [],
+    "assistant_response": {"content": "The report covers Q3 revenue."},
+    "action_request": {
+        "function": "multiply",
+        "arguments": {"a": 3, "b": 4},
+    },
+    "model_response": {
+        "choices": [{"message": {"role": "assistant", "content": "..."}}],
+        "usage": {"prompt_tokens": 812, "completion_tokens": 96},
+    },
+}
+
+PATHS = {
+    "instruction": "instruction",
+    "assistant_response.content": ["assistant_response", "content"],
+    "action_request.arguments.a": ["action_request", "arguments", "a"],
+    "choices.0.message.content": [
+        "model_response",
+        "choices",
+        0,
+        "message",
+        "content",
+    ],
+}
+
+
+def _legacy_get(note: Note, indices):
+    return nget(note.content, to_list(indices, flatten=True, dropna=True))
+
+
+def _legacy_set(note: Note, indices, value) -> None:
+    indices = to_list(indices, flatten=True, dropna=True)
+    if nget(note.content, to_list(indices, flatten=True, dropna=True), None) is None:
+        ninsert(note.content, indices, value)
+    else:
+        nset(note.content, indices, value)
+
+
+def _ns(fn, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+    note = Note(**CONTENT)
+
+    print(f"{'path':<30}{'op':<6}{'legacy':>12}{'Note':>12}{'NotePath':>12}")
+    for name, indices in PATHS.items():
+        path = NotePath(indices)
+        value = note.get(indices)
+        rows = {
+            "get": (
+                lambda: _legacy_get(note, indices),
+                lambda: note[indices],
+                lambda: path.get(note.content),
+            ),
+            "set": (
+                lambda: _legacy_set(note, indices, value),
+                lambda: note.set(indices, value),
+                lambda: path.set(note.content, value),
+            ),
+        }
+        for op, fns in rows.items():
+            legacy, current, compiled = (_ns(fn, args.count) for fn in fns)
+            print(
+                f"{name:<30}{op:<6}{legacy:>9.0f} ns"
+                f"{current:>9.0f} ns{compiled:>9.0f} ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Multi-threaded throughput of Pile under each concurrency mode.
+
+Usage:
+    python benchmarks/bench_pile_concurrency.py [--size 10000]
+                                                [--ops 200000]
+                                                [--threads 1 2 4 8]
+                                                [--write-ratio 0.05]
+
+Every thread runs the same mix of `get` reads and `pop`/`append`
+writes against one shared pile. The total number of operations is fixed,
+so better scaling with threads means higher throughput. Run it on a
+free-threaded CPython build (3.13t or later) to see the reader/writer
+lock scale across cores; with the GIL, the modes mostly show lock overhead.
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+from lion.core.generic import Element, Pile
+
+MODES = ("mutex", "rw", "unified", "none")
+
+
+def _worker(pile: Pile, ids: list[str], ops: int, write_ratio: float, seed: int):
+    rng = random.Random(seed)
+    for _ in range(ops):
+        if rng.random() < write_ratio:
+            item = pile.pop(rng.choice(ids), None)
+            if item is not None:
+                pile.append(item)
+        else:
+            pile.get(rng.choice(ids), None)
+
+
+def bench(mode: str, size: int, ops: int, threads: int, write_ratio: float):
+    items = [Element() for _ in range(size)]
+    ids = [i.ln_id for i in items]
+    pile = Pile(items=items, concurrency_mode=mode)
+    per_thread = ops // threads
+
+    workers = [
+        threading.Thread(
+            target=_worker,
+            args=(pile, ids, per_thread, write_ratio, seed),
+        )
+        for seed in range(threads)
+    ]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    return per_thread * threads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}),
+    )
+    parser.add_argument("--write-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(
+        f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, "
+        f"{os.cpu_count()} cores, {args.write_ratio:.0%} writes"
+    )
+    print(f"{'threads':<8}" + "".join(f"{m:>14}" for m in MODES))
+    for n in args.threads:
+        line = f"{n:<8}"
+        for mode in MODES:
+            if mode == "none" and n > 1 and args.write_ratio > 0:
+                line += f"{'n/a':>14}"
+                continue
+            rate = bench(mode, args.size, args.ops, n, args.write_ratio)
+            line += f"{rate / 1e3:>10.1f} k/s"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
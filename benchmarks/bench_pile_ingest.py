@@ -0,0 +1,55 @@
+"""
+Bulk ingestion into Pile.
+
+Usage:
+    python benchmarks/bench_pile_ingest.py [--sizes 100000 1000000]
+
+Times loading the same elements through the constructor, one `include`
+call per item, `Pile.from_iterable` and `extend_many` on an empty Pile.
+"""
+
+import argparse
+import time
+
+from lion.core.generic import Element, Pile
+
+
+def _timeit(fn, /) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _include_each(items: list[Element]) -> Pile:
+    pile = Pile(item_type={Element})
+    for i in items:
+        pile.include(i)
+    return pile
+
+
+def _extend_many(items: list[Element]) -> Pile:
+    pile = Pile(item_type={Element})
+    pile.extend_many(items)
+    return pile
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    cases = {
+        "Pile(items=...)": lambda items: Pile(items=items, item_type={Element}),
+        "include per item": _include_each,
+        "from_iterable": lambda items: Pile.from_iterable(items, item_type={Element}),
+        "extend_many": _extend_many,
+    }
+    for size in args.sizes:
+        items = [Element() for _ in range(size)]
+        print(f"\n== {size:,} elements ==")
+        for name, fn in cases.items():
+            print(f"{name:<24}{_timeit(lambda: fn(items)):>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare the list-backed Progression against IndexedProgression.
+
+Usage:
+    python benchmarks/bench_progression.py [--sizes 1000 100000 1000000]
+                                           [--lookups 1000]
+
+Each size builds a progression of fresh Lion IDs with a single append and
+then times membership, index, count, include and exclude over a fixed
+number of probes, so the list version stays runnable at 1M IDs.
+"""
+
+import argparse
+import random
+import time
+
+from lion.core.generic import IndexedProgression, Progression
+from lion.core.typing import ID
+
+
+def _timeit(fn, /) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench(cls: type[Progression], ids: list[str], lookups: int) -> dict:
+    prog = cls()
+    results = {"append": _timeit(lambda: prog.append(ids))}
+
+    probes = random.sample(ids, min(lookups, len(ids)))
+    fresh = [ID.id() for _ in range(min(lookups, 100))]
+    drop = probes[: min(lookups, 100)]
+
+    results["contains"] = _timeit(lambda: [i in prog for i in probes])
+    results["index"] = _timeit(lambda: [prog.index(i) for i in probes])
+    results["count"] = _timeit(lambda: [prog.count(i) for i in probes])
+    results["include"] = _timeit(lambda: prog.include(fresh))
+    results["exclude"] = _timeit(lambda: prog.exclude(drop))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--lookups", type=int, default=1_000)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        ids = [ID.id() for _ in range(size)]
+        print(f"\n== {size:,} IDs, {args.lookups:,} probes ==")
+        rows = {
+            cls.__name__: bench(cls, ids, args.lookups)
+            for cls in (
+                Progression,
+                IndexedProgression,
+            )
+        }
+        ops = next(iter(rows.values())).keys()
+        print(f"{'op':<10}" + "".join(f"{name:>22}" for name in rows))
+        for op in ops:
+            line = f"{op:<10}"
+            for name in rows:
+                line += f"{rows[name][op] * 1e3:>19.3f} ms"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
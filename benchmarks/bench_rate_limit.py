@@ -0,0 +1,89 @@
+"""
+Fan-out against a rate-limited endpoint.
+
+Usage:
+    python benchmarks/bench_rate_limit.py [--requests 3500] [--rpm 3000]
+                                          [--tpm 5000000] [--branches 8]
+
+Sends `--requests` chat completions from `--branches` iModels that share
+one endpoint, all at once, to a fake `acompletion` that reports `usage`.
+With a full bucket, a minute's quota goes out immediately and the rest
+is paced at the per-second rate. The script reports the achieved
+throughput after the initial burst against the configured limits, and
+the limiter overhead per request when no limit is reached.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from lion.integrations.litellm_.imodel import iModel
+
+
+def _fake_acompletion(sent: list[float]):
+    async def acompletion(**config):
+        sent.append(time.perf_counter())
+        await asyncio.sleep(0.01)
+        prompt = sum(len(m["content"]) for m in config["messages"]) // 4
+        completion = random.randint(50, 400)
+        return {
+            "choices": [{"message": {"content": "ok"}}],
+            "usage": {
+                "prompt_tokens": prompt,
+                "completion_tokens": completion,
+                "total_tokens": prompt + completion,
+            },
+        }
+
+    return acompletion
+
+
+async def _fan_out(args, rpm, tpm, key: str) -> tuple[list[float], float]:
+    sent: list[float] = []
+    models = []
+    for _ in range(args.branches):
+        model = iModel(
+            model="openai/fake",
+            api_key=key,
+            interval_requests=rpm,
+            interval_tokens=tpm,
+        )
+        model.acompletion = _fake_acompletion(sent)
+        models.append(model)
+    messages = [{"role": "user", "content": "lorem ipsum " * 100}]
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            models[i % args.branches].invoke(messages=messages, max_tokens=400)
+            for i in range(args.requests)
+        )
+    )
+    return sent, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=3500)
+    parser.add_argument("--rpm", type=int, default=3000)
+    parser.add_argument("--tpm", type=int, default=5_000_000)
+    parser.add_argument("--branches", type=int, default=8)
+    args = parser.parse_args()
+
+    sent, elapsed = asyncio.run(_fan_out(args, args.rpm, args.tpm, "key-a"))
+    sent.sort()
+    paced = sent[args.rpm :] if len(sent) > args.rpm else []
+    print(f"{args.requests} requests from {args.branches} branches in {elapsed:.1f} s")
+    if len(paced) > 1:
+        rate = (len(paced) - 1) / (paced[-1] - paced[0]) * 60
+        print(f"after the burst: {rate:,.0f} requests/min (limit {args.rpm:,})")
+
+    _, unlimited = asyncio.run(_fan_out(args, None, None, "key-b"))
+    _, limited = asyncio.run(_fan_out(args, 10**9, 10**12, "key-c"))
+    overhead = (limited - unlimited) / args.requests * 1e6
+    print(f"limiter overhead: {overhead:.1f} us/request")
+
+
+if __name__ == "__main__":
+    main()
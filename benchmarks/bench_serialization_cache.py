@@ -0,0 +1,62 @@
+"""
+Repeated serialization of unchanged messages.
+
+Usage:
+    python benchmarks/bench_serialization_cache.py [--messages 1000]
+                                                   [--repeat 10]
+
+Creates `--messages` instructions and serializes each of them `--repeat`
+times through `to_dict`, `to_json` and `to_log`, as logging and export
+do. The first pass fills the per-message cache; later passes reuse it.
+The last row modifies every message between passes, so each call pays
+for a full dump.
+"""
+
+import argparse
+import time
+
+from lion.core.communication import Instruction
+
+
+def _per_call(fn, messages, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for m in messages:
+            fn(m)
+    return (time.perf_counter() - start) / (len(messages) * repeat) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    messages = [
+        Instruction(
+            instruction=f"Question {i}: summarize section {i}.",
+            context=[{"section": i, "text": "lorem ipsum dolor " * 30}],
+            guidance="Answer in two sentences.",
+        )
+        for i in range(args.messages)
+    ]
+
+    edits = iter(range(10**9))
+
+    def modified_to_dict(m):
+        m.content["guidance"] = f"Answer in {next(edits)} words."
+        m.to_dict()
+
+    rows = {
+        "first to_dict": _per_call(lambda m: m.to_dict(), messages, 1),
+        "to_dict (cached)": _per_call(lambda m: m.to_dict(), messages, args.repeat),
+        "to_json (cached)": _per_call(lambda m: m.to_json(), messages, args.repeat),
+        "to_log": _per_call(lambda m: m.to_log(), messages, args.repeat),
+        "modify + to_dict": _per_call(modified_to_dict, messages, args.repeat),
+    }
+    for name, us in rows.items():
+        print(f"{name:<20}{us:>10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
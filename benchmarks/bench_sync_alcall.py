@@ -0,0 +1,74 @@
+"""
+Sync callables through alcall: per-call thread pools vs the shared pool.
+
+Usage:
+    python benchmarks/bench_sync_alcall.py [--calls 10000] [--work-us 50]
+
+Runs `--calls` calls of a sync function that sleeps for `--work-us`
+microseconds through `alcall`, which dispatches them to the shared
+"default" pool of `lion.libs.executor.EXECUTORS`. For comparison it
+repeats the run with the previous dispatch, where `ucall` wrapped the
+function in a fresh `ThreadPoolExecutor` per call. Reports wall time,
+calls per second and the peak number of live threads.
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from lion.libs.executor import EXECUTORS
+from lion.libs.func import alcall
+
+
+def _legacy_force_async(fn):
+    pool = ThreadPoolExecutor()
+
+    def wrapper(*args, **kwargs):
+        return asyncio.wrap_future(pool.submit(fn, *args, **kwargs))
+
+    return wrapper
+
+
+async def _run(calls: int, work_us: int, legacy: bool) -> tuple[float, int]:
+    peak = threading.active_count()
+
+    def work(i: int) -> int:
+        nonlocal peak
+        time.sleep(work_us / 1e6)
+        peak = max(peak, threading.active_count())
+        return i
+
+    async def legacy_work(i: int) -> int:
+        return await _legacy_force_async(work)(i)
+
+    start = time.perf_counter()
+    await alcall(list(range(calls)), legacy_work if legacy else work)
+    return time.perf_counter() - start, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--work-us", type=int, default=50)
+    args = parser.parse_args()
+
+    shared = asyncio.run(_run(args.calls, args.work_us, legacy=False))
+    stats = EXECUTORS.pool().stats()
+    legacy = asyncio.run(_run(args.calls, args.work_us, legacy=True))
+
+    print(f"{args.calls} sync calls, {args.work_us} us each")
+    for name, (elapsed, peak) in (
+        ("shared pool", shared),
+        ("pool per call", legacy),
+    ):
+        print(
+            f"{name:<16}{elapsed * 1e3:>10.1f} ms"
+            f"{args.calls / elapsed:>12,.0f} calls/s{peak:>8} threads peak"
+        )
+    print(f"default pool: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Token counting throughput.
+
+Usage:
+    python benchmarks/bench_tokenizer.py [--texts 5000] [--encoding o200k_base]
+
+Counts `--texts` chat-sized strings with the heuristic tokenizer and,
+when `tiktoken` is installed, with an exact tokenizer: one call per
+text, one batch call, and a batch call again once every count is in the
+LRU cache. The heuristic's error against the exact count is reported
+too.
+"""
+
+import argparse
+import random
+import time
+
+from lion.libs.tokenizer import HeuristicTokenizer, TiktokenTokenizer
+
+WORDS = (
+    "the quarterly revenue grew while operating costs fell sharply across "
+    "regions; analysts expect guidance (EBITDA, FCF) to improve in 2025 "
+    "résumé naïve 東京 データ"
+).split()
+
+
+def _texts(count: int) -> list[str]:
+    rng = random.Random(0)
+    return [
+        " ".join(rng.choices(WORDS, k=rng.randint(20, 400))) + f" #{i}"
+        for i in range(count)
+    ]
+
+
+def _rate(fn, count: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--encoding", default="o200k_base")
+    args = parser.parse_args()
+    texts = _texts(args.texts)
+
+    heuristic = HeuristicTokenizer()
+    rows = {"heuristic batch": lambda: heuristic.count_batch(texts)}
+    try:
+        exact = TiktokenTokenizer(args.encoding, cache_size=len(texts))
+    except (ImportError, ValueError):
+        exact = None
+        print("tiktoken not installed; exact rows skipped")
+    if exact is not None:
+        rows |= {
+            "exact per text": lambda: [exact._count_batch([t]) for t in texts],
+            "exact batch": lambda: exact.count_batch(texts),
+            "exact batch (cached)": lambda: exact.count_batch(texts),
+        }
+
+    for name, fn in rows.items():
+        print(f"{name:<24}{_rate(fn, len(texts)):>14,.0f} texts/s")
+
+    if exact is not None:
+        guess = sum(heuristic.count_batch(texts))
+        truth = sum(exact.count_batch(texts))
+        print(f"heuristic error         {(guess - truth) / truth:>+13.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,36 @@
 """The LION framework."""
 
+import importlib
 import logging
 
 from dotenv import load_dotenv
 
-from .core.session import Branch
-from .integrations.litellm_.imodel import iModel
-from .protocols.operatives.step import Step
-from .settings import Settings
-from .version import __version__
-
 load_dotenv()
 
+from .settings import Settings  # noqa: E402
+from .version import __version__  # noqa: E402
+
+# Heavy entry points are imported on first attribute access, so that
+# `import lion.core.generic` does not pull in sessions, litellm or pandas.
+_LAZY_IMPORTS = {
+    "Branch": ".core.session",
+    "iModel": ".integrations.litellm_.imodel",
+    "Step": ".protocols.operatives.step",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __all__ = [
     "Settings",
@@ -1,7 +1,9 @@
+import importlib
 import os
+from hashlib import sha256
 from typing import TypeVar
 
-from lion.libs.utils import get_class_file_registry, get_class_objects
+from lion.libs.utils import get_cached_class_file_registry, get_class_objects
 
 T = TypeVar("T")
 LION_CLASS_REGISTRY: dict[str, type[T]] = {}
@@ -15,12 +17,36 @@ pattern_list = [
     "lion/core/forms",
 ]
 
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _manifest_paths() -> list[str]:
+    """Package-local manifest first, then the user cache directory."""
+    cache_dir = os.environ.get("LION_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "lion"
+    )
+    key = sha256(script_dir.encode()).hexdigest()[:12]
+    return [
+        os.path.join(script_dir, "_class_manifest.json"),
+        os.path.join(cache_dir, f"class_manifest_{key}.json"),
+    ]
 
-if not LION_CLASS_FILE_REGISTRY:
-    script_path = os.path.abspath(__file__)
-    script_dir = os.path.dirname(script_path)
 
-    LION_CLASS_FILE_REGISTRY = get_class_file_registry(script_dir, pattern_list)
+def _module_name(file_path: str) -> str | None:
+    """Dotted module name of a source file under this package."""
+    rel = os.path.relpath(file_path, script_dir)
+    if rel.startswith(os.pardir):
+        return None
+    parts = os.path.splitext(rel)[0].split(os.sep)
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join([__package__, *parts])
+
+
+if not LION_CLASS_FILE_REGISTRY:
+    LION_CLASS_FILE_REGISTRY = get_cached_class_file_registry(
+        script_dir, pattern_list, _manifest_paths()
+    )
 
 
 def get_class(class_name: str) -> type:
@@ -28,7 +54,8 @@ def get_class(class_name: str) -> type:
     Retrieve a class by name from the registry or dynamically import it.
 
     This function first checks the LION_CLASS_REGISTRY for the requested class.
-    If not found, it uses mor to dynamically import the class. The
+    If not found, it imports the defining module, located through the class
+    file manifest, with importlib. The
     function ensures that the retrieved class is a subclass of the specified
     base_class.
 
@@ -54,8 +81,11 @@ def get_class(class_name: str) -> type:
 
     try:
         found_class_filepath = LION_CLASS_FILE_REGISTRY[class_name]
-        found_class_dict = get_class_objects(found_class_filepath)
-        return found_class_dict[class_name]
+        module_name = _module_name(found_class_filepath)
+        if module_name is None:
+            return get_class_objects(found_class_filepath)[class_name]
+        module = importlib.import_module(module_name)
+        return getattr(module, class_name)
     except Exception as e:
         raise ValueError(f"Unable to find class {class_name}: {e}")
 
@@ -1,5 +1,5 @@
 from lion.core.generic import Element, Log
-from lion.core.typing import Any, Enum, NoReturn, PrivateAttr, override
+from lion.core.typing import Any, Enum, NoReturn, Note, PrivateAttr, override
 from lion.settings import Settings, TimedFuncCallConfig
 
 
@@ -47,7 +47,7 @@ class ObservableAction(Element):
         dict_["status"] = self.status.value
         content = {k: dict_[k] for k in self._content_fields if k in dict_}
         loginfo = {k: dict_[k] for k in dict_ if k not in self._content_fields}
-        return Log(content=content, loginfo=loginfo)
+        return Log.fast_new(content=Note(**content), loginfo=Note(**loginfo))
 
     @classmethod
     def from_dict(cls, data: dict, /, **kwargs: Any) -> NoReturn:
@@ -4,7 +4,7 @@ from typing_extensions import override
 
 from lion.core.typing import ID, Any, LnID, Note
 from lion.libs.parse import to_dict
-from lion.libs.utils import copy
+from lion.libs.utils import copy, copy_nested
 
 from .message import MessageFlag, MessageRole, RoledMessage
 
@@ -96,7 +96,7 @@ class ActionRequest(RoledMessage):
         Returns:
             dict[str, Any]: The action request content.
         """
-        a = copy(self.content.get("action_request", {}))
+        a = copy_nested(self.content.get("action_request", {}))
         a.pop("output", None)
         return a
 
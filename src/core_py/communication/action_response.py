@@ -1,7 +1,7 @@
 from typing_extensions import override
 
 from lion.core.typing import ID, Any, Note
-from lion.libs.utils import copy
+from lion.libs.utils import copy_nested
 
 from .action_request import ActionRequest
 from .message import MessageFlag, MessageRole, RoledMessage
@@ -79,12 +79,12 @@ class ActionResponse(RoledMessage):
     @property
     def function(self) -> str:
         """Get the function name from the action response."""
-        return copy(self.content.get(["action_response", "function"]))
+        return copy_nested(self.content.get(["action_response", "function"]))
 
     @property
     def arguments(self) -> dict[str, Any]:
         """Get the function arguments from the action response."""
-        return copy(self.content.get(["action_response", "arguments"]))
+        return copy_nested(self.content.get(["action_response", "arguments"]))
 
     @property
     def output(self) -> Any:
@@ -94,12 +94,12 @@ class ActionResponse(RoledMessage):
     @property
     def response(self) -> dict[str, Any]:
         """Get the action response as a dictionary."""
-        return copy(self.content.get("action_response", {}))
+        return copy_nested(self.content.get("action_response", {}))
 
     @property
     def action_request_id(self) -> ID[ActionRequest].ID | None:
         """Get the ID of the corresponding action request."""
-        return copy(self.content.get("action_request_id", None))
+        return self.content.get("action_request_id", None)
 
     @override
     def _format_content(self) -> dict[str, Any]:
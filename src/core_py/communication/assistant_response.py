@@ -2,7 +2,7 @@ from typing_extensions import override
 
 from lion.core.typing import ID, Any, BaseModel, JsonValue, Note
 from lion.libs.parse import to_str
-from lion.libs.utils import copy
+from lion.libs.utils import copy_nested
 
 from .message import MessageFlag, MessageRole, RoledMessage
 
@@ -94,7 +94,7 @@ class AssistantResponse(RoledMessage):
         Returns:
             Any: The content of the assistant's response.
         """
-        return copy(self.content["assistant_response"])
+        return copy_nested(self.content["assistant_response"])
 
     @property
     def model_response(self) -> dict | list[dict]:
@@ -104,7 +104,7 @@ class AssistantResponse(RoledMessage):
         Returns:
             Any: The content of the model response.
         """
-        return copy(self.metadata.get("model_response", {}))
+        return copy_nested(self.metadata.get("model_response", {}))
 
     @override
     def _format_content(self) -> dict[str, str]:
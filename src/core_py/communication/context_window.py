@@ -0,0 +1,144 @@
+"""
+Copyright 2024 HaiyangLi
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Selection of the messages sent to the model under a token budget.
+"""
+
+from collections.abc import Collection, Sequence
+
+from lion.libs.tokenizer import chat_msg_text, get_tokenizer
+from lion.protocols.configs.branch_config import ContextWindowConfig
+
+from .instruction import Instruction
+from .message import RoledMessage
+
+
+def group_turns(messages: Sequence[RoledMessage]) -> list[list[RoledMessage]]:
+    """
+    Split messages into turns, each starting at an instruction.
+
+    Messages before the first instruction form a turn of their own.
+    """
+    turns: list[list[RoledMessage]] = []
+    for message in messages:
+        if isinstance(message, Instruction) or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+def select_context(
+    messages: Sequence[RoledMessage],
+    config: ContextWindowConfig,
+    *,
+    system: RoledMessage | None = None,
+    pinned: Collection[str] = (),
+    reserve_tokens: int = 0,
+) -> tuple[list[RoledMessage], list[RoledMessage]]:
+    """
+    Choose the messages to send under `config`.
+
+    The system message (if `config.keep_system`) and pinned messages are
+    always kept. Turns are then taken newest first while they fit the
+    remaining budget; the `config.keep_last_turns` newest turns are taken
+    regardless. The first turn that does not fit ends the window, so the
+    kept history is contiguous.
+
+    Args:
+        messages: The conversation, in order.
+        config: The window policy.
+        system: The conversation's system message, if any.
+        pinned: IDs of messages to keep regardless of the budget.
+        reserve_tokens: Tokens already spoken for, e.g. by the new
+            instruction sent after these messages.
+
+    Returns:
+        tuple: The kept messages and the dropped ones, each in order.
+    """
+    keep_system = config.keep_system and system is not None
+    body = [m for m in messages if not (keep_system and m is system)]
+    turns = group_turns(body)
+
+    budget = None
+    if config.max_tokens is not None:
+        budget = config.max_tokens - reserve_tokens
+        budget -= sum(m.token_count for m in messages if m.ln_id in pinned)
+        if len(body) < len(messages) and system.ln_id not in pinned:
+            budget -= system.token_count
+
+    kept_turns = 0
+    for i, turn in enumerate(reversed(turns)):
+        if config.max_turns is not None and i >= config.max_turns:
+            break
+        cost = sum(m.token_count for m in turn if m.ln_id not in pinned)
+        if budget is not None:
+            if cost > budget and i >= config.keep_last_turns:
+                break
+            budget -= cost
+        kept_turns += 1
+
+    older = {id(m) for turn in turns[: len(turns) - kept_turns] for m in turn}
+    kept, dropped = [], []
+    for m in messages:
+        if id(m) in older and m.ln_id not in pinned:
+            dropped.append(m)
+        else:
+            kept.append(m)
+    return kept, dropped
+
+
+def summarize_messages(messages: Sequence[RoledMessage], max_tokens: int) -> str:
+    """
+    Build an extractive digest of `messages` within `max_tokens`.
+
+    Each message contributes its role and the start of its text; when the
+    budget runs out the oldest messages are left out. Lines are sized by
+    the default tokenizer.
+
+    Args:
+        messages: The messages being dropped from the window.
+        max_tokens: The budget for the digest.
+
+    Returns:
+        str: The digest, for use as a system message.
+    """
+    tokenizer = get_tokenizer()
+    header = f"Summary of {len(messages)} earlier messages in this conversation:"
+    room = max_tokens - tokenizer.count(header)
+    per_message = max(room // max(len(messages), 1), 20)
+
+    lines = []
+    for message in reversed(messages):
+        words = chat_msg_text(message.chat_msg).split()
+        # every word is at least one token, so no more words than this fit
+        line = f"- {message.role.value}: {' '.join(words[:per_message])}"
+        cost = tokenizer.count(line)
+        while cost > per_message and len(words) > 1:
+            words = words[: max(len(words) * per_message // cost, 1)]
+            line = f"- {message.role.value}: {' '.join(words)}..."
+            cost = tokenizer.count(line)
+        if cost > room:
+            break
+        lines.append(line)
+        room -= cost
+    return "\n".join([header, *reversed(lines)])
+
+
+__all__ = [
+    "group_turns",
+    "select_context",
+    "summarize_messages",
+]
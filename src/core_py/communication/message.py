@@ -17,12 +17,22 @@ Copyright 2024 HaiyangLi
 from __future__ import annotations
 
 import inspect
+from functools import cache
 
 from pydantic import field_serializer, field_validator
 
 from lion.core.generic import Component, Log
-from lion.core.typing import Any, Communicatable, Enum, Field, Note, override
-from lion.libs.utils import copy
+from lion.core.typing import (
+    Any,
+    ClassVar,
+    Communicatable,
+    Enum,
+    Field,
+    Note,
+    override,
+)
+from lion.libs.tokenizer import count_chat_tokens, get_tokenizer
+from lion.libs.utils import copy_nested
 
 from .._class_registry import get_class
 from .base_mail import BaseMail
@@ -59,6 +69,12 @@ class MessageField(str, Enum):
 MESSAGE_FIELDS = [i.value for i in MessageField.__members__.values()]
 
 
+@cache
+def _flag_count(cls: type) -> int:
+    """Number of positional flags `cls.__init__` takes before its keywords."""
+    return len(inspect.signature(cls.__init__).parameters) - 2
+
+
 class RoledMessage(Component, BaseMail):
     """
     A base class representing a message with roles and properties.
@@ -67,6 +83,8 @@ class RoledMessage(Component, BaseMail):
     to create a versatile message object with role-based behavior.
     """
 
+    _cache_serialized: ClassVar[bool] = True
+
     content: Note = Field(
         default_factory=Note,
         description="The content of the message.",
@@ -97,10 +115,30 @@ class RoledMessage(Component, BaseMail):
         """
         Return message in chat representation.
 
+        The rendering is cached until the message changes, so repeated
+        calls only pay for a copy.
+
         Returns:
             Optional[Dict[str, Any]]: The message in chat format, or None
                 if formatting fails.
         """
+        return copy_nested(self._cached_render("chat_msg", self._render_chat_msg))
+
+    @property
+    def token_count(self) -> int:
+        """
+        Return the prompt tokens of `chat_msg`, by the default tokenizer.
+
+        The count is cached until the message changes or the default
+        tokenizer is replaced.
+        """
+        tokenizer = get_tokenizer()
+        return self._cached_render(
+            f"token_count/{tokenizer.name}",
+            lambda: count_chat_tokens(self.chat_msg, tokenizer),
+        )
+
+    def _render_chat_msg(self) -> dict[str, Any] | None:
         try:
             return self._format_content()
         except Exception:
@@ -129,14 +167,12 @@ class RoledMessage(Component, BaseMail):
             RoledMessage: A new instance with copied attributes.
         """
         cls = self.__class__
-        signature = inspect.signature(cls.__init__)
-        param_num = len(signature.parameters) - 2
-
-        init_args = [MessageFlag.MESSAGE_CLONE] * param_num
+        init_args = [MessageFlag.MESSAGE_CLONE] * _flag_count(cls)
 
         obj = cls(*init_args)
-        obj.role = self.role
-        obj.content = self.content
+        with obj.batch_update():
+            obj.role = self.role
+            obj.content = self.content
         obj.metadata.set("clone_from", self)
 
         return obj
@@ -155,15 +191,12 @@ class RoledMessage(Component, BaseMail):
             RoledMessage: An instance of RoledMessage created from
                 the dictionary.
         """
-        data = copy(data)
+        data = copy_nested(data)
         if kwargs:
             data.update(kwargs)
         if "lion_class" in data:
             cls = get_class(data.pop("lion_class"))
-        signature = inspect.signature(cls.__init__)
-        param_num = len(signature.parameters) - 2
-
-        init_args = [MessageFlag.MESSAGE_LOAD] * param_num
+        init_args = [MessageFlag.MESSAGE_LOAD] * _flag_count(cls)
 
         extra_fields = {}
         for k, v in list(data.items()):
@@ -178,9 +211,16 @@ class RoledMessage(Component, BaseMail):
         metadata = data.get("metadata", {})
         last_updated = metadata.get("last_updated", None)
         if last_updated is not None:
+            obj._discard_pending_updates()
             obj.metadata.set(["last_updated"], last_updated)
         return obj
 
+    @override
+    @classmethod
+    def _bulk_loadable(cls) -> bool:
+        # loading passes the record straight to the model constructor
+        return cls.from_dict.__func__ is RoledMessage.from_dict.__func__
+
     @override
     def __str__(self) -> str:
         """
@@ -208,11 +248,7 @@ class RoledMessage(Component, BaseMail):
         """
         dict_ = self.to_dict()
         content = dict_.pop("content")
-        _log = Log(
-            content=content,
-            loginfo=dict_,
-        )
-        return _log
+        return Log.fast_new(content=Note(**content), loginfo=Note(**dict_))
 
     @field_serializer("content")
     def _serialize_content(self, value: Note) -> dict[str, Any]:
@@ -225,7 +261,9 @@ class RoledMessage(Component, BaseMail):
         Returns:
             dict[str, Any]: The serialized content.
         """
-        output_dict = copy(value.content, deep=True)
+        # Only the top level is modified below; nested containers are
+        # rebuilt by the serializer, so a shallow copy is enough.
+        output_dict = dict(value.content)
         origin_obj = output_dict.pop("clone_from", None)
 
         if origin_obj and isinstance(origin_obj, Communicatable):
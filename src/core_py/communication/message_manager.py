@@ -1,15 +1,33 @@
-from lion.core.generic import LogManager, Pile, Progression
-from lion.core.typing import ID, Any, BaseModel, JsonValue, Literal
+from collections.abc import Callable
+
+from lion.core.generic import (
+    LogManager,
+    Pile,
+    PileView,
+    Progression,
+    ProgressionView,
+)
+from lion.core.typing import ID, Any, BaseModel, JsonValue, Literal, Note
+from lion.libs.utils import copy_nested
+from lion.protocols.configs.branch_config import ContextWindowConfig
 
 from .action_request import ActionRequest
 from .action_response import ActionResponse
 from .assistant_response import AssistantResponse
+from .context_window import select_context, summarize_messages
 from .instruction import Instruction
 from .message import RoledMessage
 from .system import System
 
 DEFAULT_SYSTEM = "You are a helpful AI assistant. Let's think step by step."
 
+INDEXED_MESSAGE_TYPES = (
+    AssistantResponse,
+    Instruction,
+    ActionRequest,
+    ActionResponse,
+)
+
 
 class MessageManager:
     """
@@ -17,7 +35,14 @@ class MessageManager:
     adding, and clearing messages.
     """
 
-    def __init__(self, messages=None, logger=None, system=None, save_on_clear=True):
+    def __init__(
+        self,
+        messages=None,
+        logger=None,
+        system=None,
+        save_on_clear=True,
+        context_window: ContextWindowConfig | None = None,
+    ):
         """
         Initializes the MessageManager with optional messages, logger, system,
         and save_on_clear flag.
@@ -27,17 +52,139 @@ class MessageManager:
             logger (LogManager, optional): Logger instance.
             system (System, optional): Initial system message.
             save_on_clear (bool, optional): Flag to save logs on clear.
+            context_window (ContextWindowConfig, optional): Policy for the
+                messages `to_context_msgs` sends to the model.
         """
         super().__init__()
         self.messages: Pile[RoledMessage] = Pile(
             items=messages, item_type={RoledMessage}
         )
+        for i in INDEXED_MESSAGE_TYPES:
+            self.messages.add_index(i.class_name(), i)
         self.logger = logger or LogManager()
         self.system = system
         self.save_on_clear = save_on_clear
+        # IDs of message objects shared with a fork or with the manager
+        # this one was forked from; see `fork`.
+        self._shared: set[str] = set()
+        self._fork_sender = None
+        self._fork_recipient = None
+        self.context_window = context_window
+        # Called as `summarizer(messages, max_tokens)` to summarize the
+        # turns left out of the context window.
+        self.summarizer: Callable[[list[RoledMessage], int], str] = summarize_messages
+        self._pinned: set[str] = set()
+        self._summary: tuple[tuple, str] | None = None
         if self.system:
             self.add_message(system=self.system)
 
+    def fork(
+        self,
+        *,
+        sender: ID.SenderRecipient = None,
+        recipient: ID.SenderRecipient = None,
+    ) -> "MessageManager":
+        """
+        Create a manager that shares this manager's messages (copy-on-write).
+
+        The fork holds references to the same message objects instead of
+        clones, so forking costs a pointer per message. A shared message
+        is cloned the first time either manager modifies it through
+        `add_message`. The fork re-addresses its clone from `sender` to
+        `recipient`, as `Branch.clone` does. Call `materialize()` before
+        editing shared messages in place by other means.
+
+        Args:
+            sender: Sender for the fork's materialized messages.
+            recipient: Recipient for the fork's materialized messages.
+
+        Returns:
+            MessageManager: The fork, without a logger.
+        """
+        fork = MessageManager(
+            save_on_clear=self.save_on_clear,
+            context_window=self.context_window,
+        )
+        fork.messages.extend_many(list(self.messages))
+        fork.system = self.system
+        fork.summarizer = self.summarizer
+        fork._pinned = self._pinned.copy()
+        fork._fork_sender = sender
+        fork._fork_recipient = recipient
+
+        shared = set(self.messages.progress)
+        self._shared |= shared
+        fork._shared = shared
+        return fork
+
+    def materialize(self) -> None:
+        """Replace every shared message with a clone owned by this manager."""
+        if not self._shared:
+            return
+        shared = self._shared
+        self._shared = set()
+        order = list(self.messages)
+        clones = {m.ln_id: self._clone_shared(m) for m in order if m.ln_id in shared}
+        self.messages.clear()
+        self.messages.extend_many([clones.get(m.ln_id, m) for m in order])
+        if self.system is not None and self.system.ln_id in clones:
+            self.system = clones[self.system.ln_id]
+        for ln_id in self._pinned & clones.keys():
+            self._pinned.discard(ln_id)
+            self._pinned.add(clones[ln_id].ln_id)
+
+    def _clone_shared(self, message: RoledMessage) -> RoledMessage:
+        clone = message.clone()
+        with clone.batch_update():
+            # `clone()` keeps the original's content Note; give the clone
+            # its own so that editing it cannot reach the other manager
+            clone.content = Note(**copy_nested(message.content.content))
+            clone.sender = self._fork_sender or message.sender
+            clone.recipient = self._fork_recipient or message.recipient
+        return clone
+
+    def _own(self, message: Any) -> Any:
+        """Return `message`, cloned into this manager first if shared."""
+        if not isinstance(message, RoledMessage) or message.ln_id not in self._shared:
+            return message
+        self._shared.discard(message.ln_id)
+        if message not in self.messages:
+            return message
+
+        clone = self._clone_shared(message)
+        index = self.messages.progress.index(message.ln_id)
+        self.messages.exclude(message)
+        self.messages.insert(index, clone)
+        if self.system is message:
+            self.system = clone
+        if message.ln_id in self._pinned:
+            self._pinned.discard(message.ln_id)
+            self._pinned.add(clone.ln_id)
+        return clone
+
+    def pin(self, *messages: ID.Ref) -> None:
+        """
+        Keep messages in the context window regardless of its budget.
+
+        Args:
+            *messages: The messages, or their IDs.
+        """
+        self._pinned.update(ID.get_id(m) for m in messages)
+
+    def unpin(self, *messages: ID.Ref) -> None:
+        """
+        Let pinned messages leave the context window again.
+
+        Args:
+            *messages: The messages, or their IDs.
+        """
+        self._pinned.difference_update(ID.get_id(m) for m in messages)
+
+    @property
+    def pinned(self) -> frozenset[str]:
+        """IDs of the messages pinned to the context window."""
+        return frozenset(self._pinned)
+
     def set_system(self, system: System) -> None:
         """
         Sets the system message, replacing any existing system message.
@@ -79,9 +226,22 @@ class MessageManager:
         Returns the progression of messages.
 
         Returns:
-            Progression: The progression of messages.
+            Progression: A copy of the order of messages.
+        """
+        return self.messages.progress.view().to_progression()
+
+    @property
+    def progress_view(self) -> ProgressionView:
+        """
+        Returns a read-only view of the message order.
+
+        The view is live and copies nothing; use `progress` for a
+        detached Progression.
+
+        Returns:
+            ProgressionView: The order of messages.
         """
-        return Progression(order=list(self.messages))
+        return self.messages.progress.view()
 
     @staticmethod
     def create_instruction(
@@ -348,6 +508,13 @@ class MessageManager:
         if sum(bool(x) for x in (instruction, assistant_response, system)) > 1:
             raise ValueError("Only one message type can be added at a time.")
 
+        if self._shared:
+            instruction = self._own(instruction)
+            assistant_response = self._own(assistant_response)
+            system = self._own(system)
+            action_request = self._own(action_request)
+            action_response = self._own(action_response)
+
         if system:
             _msg = self.create_system(
                 system=system,
@@ -415,10 +582,15 @@ class MessageManager:
             self.logger.dump(clear=True)
 
         self.messages.clear()
-        self.progress.clear()
         if self.system:
             self.messages.include(self.system)
-            self.progress.insert(0, self.system)
+
+    def _typed_view(self, cls: type[RoledMessage], /) -> PileView:
+        """Return a live view of the messages of a given type."""
+        name = cls.class_name()
+        if name not in self.messages.indexes:
+            self.messages.add_index(name, cls)
+        return self.messages.view(name)
 
     @property
     def last_response(self) -> AssistantResponse | None:
@@ -428,9 +600,7 @@ class MessageManager:
         Returns:
             AssistantResponse | None: The last assistant response message, or None if not found.
         """
-        for i in reversed(self.messages.progress):
-            if isinstance(self.messages[i], AssistantResponse):
-                return self.messages[i]
+        return self._typed_view(AssistantResponse).last()
 
     @property
     def last_instruction(self) -> Instruction | None:
@@ -440,9 +610,7 @@ class MessageManager:
         Returns:
             Instruction | None: The last instruction message, or None if not found.
         """
-        for i in reversed(self.messages.progress):
-            if isinstance(self.messages[i], Instruction):
-                return self.messages[i]
+        return self._typed_view(Instruction).last()
 
     @property
     def assistant_responses(self) -> Pile[AssistantResponse]:
@@ -452,13 +620,17 @@ class MessageManager:
         Returns:
             Pile[AssistantResponse]: The pile of assistant response messages.
         """
-        return Pile(
-            [
-                self.messages[i]
-                for i in self.messages.progress
-                if isinstance(self.messages[i], AssistantResponse)
-            ]
-        )
+        return self._typed_view(AssistantResponse).to_pile()
+
+    @property
+    def assistant_responses_view(self) -> PileView[AssistantResponse]:
+        """
+        Returns a live view of assistant response messages, without copying them.
+
+        Returns:
+            PileView[AssistantResponse]: The assistant response messages.
+        """
+        return self._typed_view(AssistantResponse)
 
     @property
     def action_requests(self) -> Pile[ActionRequest]:
@@ -468,13 +640,17 @@ class MessageManager:
         Returns:
             Pile[ActionRequest]: The pile of action request messages.
         """
-        return Pile(
-            [
-                self.messages[i]
-                for i in self.messages.progress
-                if isinstance(self.messages[i], ActionRequest)
-            ]
-        )
+        return self._typed_view(ActionRequest).to_pile()
+
+    @property
+    def action_requests_view(self) -> PileView[ActionRequest]:
+        """
+        Returns a live view of action request messages, without copying them.
+
+        Returns:
+            PileView[ActionRequest]: The action request messages.
+        """
+        return self._typed_view(ActionRequest)
 
     @property
     def action_responses(self) -> Pile[ActionResponse]:
@@ -484,13 +660,17 @@ class MessageManager:
         Returns:
             Pile[ActionResponse]: The pile of action response messages.
         """
-        return Pile(
-            [
-                self.messages[i]
-                for i in self.messages.progress
-                if isinstance(self.messages[i], ActionResponse)
-            ]
-        )
+        return self._typed_view(ActionResponse).to_pile()
+
+    @property
+    def action_responses_view(self) -> PileView[ActionResponse]:
+        """
+        Returns a live view of action response messages, without copying them.
+
+        Returns:
+            PileView[ActionResponse]: The action response messages.
+        """
+        return self._typed_view(ActionResponse)
 
     @property
     def instructions(self) -> Pile[Instruction]:
@@ -500,18 +680,25 @@ class MessageManager:
         Returns:
             Pile[Instruction]: The pile of instruction messages.
         """
-        return Pile(
-            [
-                self.messages[i]
-                for i in self.messages.progress
-                if isinstance(self.messages[i], Instruction)
-            ]
-        )
+        return self._typed_view(Instruction).to_pile()
+
+    @property
+    def instructions_view(self) -> PileView[Instruction]:
+        """
+        Returns a live view of instruction messages, without copying them.
+
+        Returns:
+            PileView[Instruction]: The instruction messages.
+        """
+        return self._typed_view(Instruction)
 
     def to_chat_msgs(self, progress=None) -> list[dict]:
         """
         Converts messages to chat format.
 
+        Each message caches its rendering until it changes, so repeated
+        calls over a growing conversation only render the new messages.
+
         Args:
             progress (list, optional): The progression of messages.
 
@@ -520,13 +707,105 @@ class MessageManager:
         """
         if progress == []:
             return []
+        if not progress:
+            return [m.chat_msg for m in self.messages]
+        try:
+            return [self.messages[i].chat_msg for i in progress]
+        except Exception as e:
+            raise ValueError(
+                "Invalid progress, not all requested messages are in the message pile"
+            ) from e
+
+    def to_context_msgs(self, progress=None, *, reserve_tokens: int = 0) -> list[dict]:
+        """
+        Converts the messages that fit the context window to chat format.
+
+        Applies `context_window` (see `ContextWindowConfig`): the system
+        message and pinned messages are always sent, followed by as many
+        recent turns as the token budget allows. Older turns are dropped,
+        or replaced by a single system message from `summarizer`.
+        Token counts are cached per message. Without a policy this is
+        `to_chat_msgs(progress)`.
+
+        Args:
+            progress (list, optional): The progression of messages.
+            reserve_tokens (int): Tokens of the budget set aside for
+                messages sent after these, such as the new instruction.
+
+        Returns:
+            list[dict]: The list of messages in chat format.
+        """
+        config = self.context_window
+        if (
+            config is None
+            or progress == []
+            or config.max_tokens is None
+            and config.max_turns is None
+        ):
+            return self.to_chat_msgs(progress)
         try:
-            return [self.messages[i].chat_msg for i in (progress or self.progress)]
+            messages = (
+                list(self.messages)
+                if not progress
+                else [self.messages[i] for i in progress]
+            )
         except Exception as e:
             raise ValueError(
                 "Invalid progress, not all requested messages are in the message pile"
             ) from e
 
+        kept, dropped = select_context(
+            messages,
+            config,
+            system=self.system,
+            pinned=self._pinned,
+            reserve_tokens=reserve_tokens,
+        )
+        if not dropped or config.overflow == "drop":
+            return [m.chat_msg for m in kept]
+
+        kept, dropped = select_context(
+            messages,
+            config,
+            system=self.system,
+            pinned=self._pinned,
+            reserve_tokens=reserve_tokens + config.summary_max_tokens,
+        )
+        chat_msgs = [m.chat_msg for m in kept]
+        if dropped:
+            at = 1 if kept and kept[0] is self.system else 0
+            summary = self._summarize(dropped, config.summary_max_tokens)
+            chat_msgs.insert(at, {"role": "system", "content": summary})
+        return chat_msgs
+
+    def _summarize(self, messages: list[RoledMessage], max_tokens: int) -> str:
+        # the dropped prefix only changes when the window moves, so the
+        # (possibly expensive) summarizer runs once per window position
+        key = (
+            self.summarizer,
+            max_tokens,
+            tuple((m.ln_id, m._serialization_key()) for m in messages),
+        )
+        if self._summary is None or self._summary[0] != key:
+            self._summary = (key, self.summarizer(messages, max_tokens))
+        return self._summary[1]
+
+    def context_tokens(self, progress=None) -> int:
+        """
+        Counts the prompt tokens of the messages, without a window.
+
+        Args:
+            progress (list, optional): The progression of messages.
+
+        Returns:
+            int: The count by the default tokenizer, from per-message caches.
+        """
+        if progress == []:
+            return 0
+        if not progress:
+            return sum(m.token_count for m in self.messages)
+        return sum(self.messages[i].token_count for i in progress)
+
     def __bool__(self):
         """
         Checks if there are any messages.
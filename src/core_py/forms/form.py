@@ -29,7 +29,7 @@ from lion.core.typing import (
     PydanticUndefined,
     TypeVar,
 )
-from lion.libs.utils import copy
+from lion.libs.utils import copy, copy_nested
 
 from .base import BaseForm
 from .utils import get_input_output_fields
@@ -436,7 +436,7 @@ class Form(BaseForm):
         Returns:
             The created Form instance.
         """
-        input_data = copy(data)
+        input_data = copy_nested(data)
 
         input_data.pop("lion_class", None)
         input_data.pop("input_fields", None)
@@ -451,8 +451,9 @@ class Form(BaseForm):
         obj.task = task
         for k, v in extra_fields.items():
             obj.update_field(field_name=k, value=v)
+        obj._discard_pending_updates()
 
-        metadata = copy(data.get("metadata", {}))
+        metadata = copy_nested(data.get("metadata", {}))
         last_updated = metadata.get("last_updated", None)
         if last_updated is not None:
             obj.metadata.set(["last_updated"], last_updated)
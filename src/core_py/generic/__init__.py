@@ -1,9 +1,12 @@
 from lion.core.generic.component import Component
 from lion.core.generic.element import Element
+from lion.core.generic.indexed_progression import IndexedProgression
 from lion.core.generic.log import Log
 from lion.core.generic.log_manager import LogManager
 from lion.core.generic.pile import Pile
+from lion.core.generic.pile_index import PileIndex, PileView
 from lion.core.generic.progression import Progression
+from lion.core.generic.progression_view import ProgressionView
 from lion.core.generic.utils import to_list_type
 
 __all__ = [
@@ -11,7 +14,11 @@ __all__ = [
     "Flow",
     "Log",
     "Pile",
+    "PileIndex",
+    "PileView",
     "Progression",
+    "ProgressionView",
+    "IndexedProgression",
     "Node",
     "to_list_type",
     "Element",
@@ -14,7 +14,12 @@ Copyright 2024 HaiyangLi
    limitations under the License.
 """
 
-from pydantic import field_serializer
+import json
+from collections.abc import Callable
+from time import monotonic
+from time import time as unix_time
+
+from pydantic import PrivateAttr, field_serializer
 from typing_extensions import override
 
 from lion.core._class_registry import get_class
@@ -30,7 +35,7 @@ from lion.core.typing import (
     PydanticUndefined,
     TypeVar,
 )
-from lion.libs.utils import copy, time
+from lion.libs.utils import copy_nested
 from lion.protocols.adapters.adapter import Adapter, AdapterRegistry
 from lion.protocols.registries._component_registry import ComponentAdapterRegistry
 
@@ -46,6 +51,71 @@ DEFAULT_SERIALIZATION_INCLUDE: set[str] = {
     "embedding",
 }
 
+# Pending updates are stamped with the monotonic clock, which is cheaper
+# to read than a tz-aware datetime; this offset converts the stamps to
+# unix timestamps when they are written to `metadata["last_updated"]`.
+_MONOTONIC_TO_UNIX = unix_time() - monotonic()
+
+
+class _UpdateTracker:
+    """
+    Fields modified since `metadata["last_updated"]` was last written,
+    and the cached serialization and renderings they invalidate. Also
+    the context manager returned by `Component.batch_update`.
+    """
+
+    __slots__ = (
+        "pending",
+        "depth",
+        "stamp",
+        "owner",
+        "dumped",
+        "json",
+        "rendered",
+        "snapshot",
+    )
+
+    def __init__(self) -> None:
+        self.pending: dict[str, float] = {}
+        self.depth = 0
+        # shared stamp for fields modified inside `batch_update()`
+        self.stamp = 0.0
+        # the component inside an open `batch_update()` block
+        self.owner: Component | None = None
+        self.dumped: dict | None = None
+        self.json: str | None = None
+        # name -> value, for subclass renderings
+        self.rendered: dict[str, Any] | None = None
+        # containers of metadata/content as of the cached values, to catch
+        # in-place edits of nested values that bypass the Notes' methods
+        self.snapshot: tuple | None = None
+
+    def touch(self, field_name: str, /) -> None:
+        self.drop_cached()
+        self.pending[field_name] = self.stamp if self.depth else monotonic()
+
+    def __enter__(self) -> "Component":
+        if not self.depth:
+            self.stamp = monotonic()
+        self.depth += 1
+        return self.owner
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.depth -= 1
+        if not self.depth:
+            self.owner = None
+
+    def drop_cached(self) -> None:
+        self.dumped = None
+        self.json = None
+        self.rendered = None
+        self.snapshot = None
+
+    def copy(self) -> "_UpdateTracker":
+        new = _UpdateTracker()
+        new.pending = self.pending.copy()
+        return new
+
 
 class Component(Element, OperableModel):
     """Extended base class for components in the Lion framework."""
@@ -64,9 +134,17 @@ class Component(Element, OperableModel):
 
     _adapter_registry: ClassVar = ComponentAdapterRegistry
 
+    # Cache `to_dict()`/`to_json()` until the component is modified:
+    # assigned, changed through its Notes' methods, or edited in place
+    # below its metadata/content (detected by comparing containers, so
+    # in-place changes to other mutable objects stored there are missed).
+    _cache_serialized: ClassVar[bool] = False
+    _update_tracker: _UpdateTracker = PrivateAttr(default_factory=_UpdateTracker)
+
     @field_serializer("metadata")
     def _serialize_metadata(self, value: Note) -> dict:
         """Serialize metadata Note recursively."""
+        self._materialize_last_updated()
         return self._serialize_note_recursive(value)
 
     def _serialize_note_recursive(self, note: Note) -> dict:
@@ -148,9 +226,41 @@ class Component(Element, OperableModel):
         )
         self._add_last_update(field_name)
 
+    def batch_update(self) -> _UpdateTracker:
+        """
+        Group several modifications under a single `last_updated` stamp.
+
+        Fields assigned inside the block all share one timestamp, taken
+        when the outermost block is entered. Blocks may be nested.
+
+        Example:
+            >>> with message.batch_update():
+            ...     message.sender = sender
+            ...     message.recipient = recipient
+        """
+        tracker = self.__pydantic_private__["_update_tracker"]
+        tracker.owner = self
+        return tracker
+
     def _add_last_update(self, field_name: FIELD_NAME, /) -> None:
-        current_time = time()
-        self.metadata.set(["last_updated", field_name], current_time)
+        self.__pydantic_private__["_update_tracker"].touch(field_name)
+
+    def _materialize_last_updated(self) -> None:
+        """Write pending update stamps into `metadata["last_updated"]`."""
+        pending = self.__pydantic_private__["_update_tracker"].pending
+        if not pending:
+            return
+        last_updated = self.metadata.content.get("last_updated")
+        if not isinstance(last_updated, dict):
+            last_updated = {}
+            self.metadata.content["last_updated"] = last_updated
+        for field_name, stamp in pending.items():
+            last_updated[field_name] = stamp + _MONOTONIC_TO_UNIX
+        pending.clear()
+
+    def _discard_pending_updates(self) -> None:
+        """Drop update stamps recorded while restoring serialized data."""
+        self.__pydantic_private__["_update_tracker"].pending.clear()
 
     @override
     def to_dict(self, **kwargs: Any) -> dict[str, Any]:
@@ -163,6 +273,74 @@ class Component(Element, OperableModel):
         Returns:
             dict[str, Any]: A dictionary representation of the component.
         """
+        if self._cache_serialized and not kwargs:
+            return copy_nested(self._cached_dict())
+        return self._dump_dict(**kwargs)
+
+    def to_json(self) -> str:
+        """Return `to_dict()` encoded as JSON, cached with the dict."""
+        if not self._cache_serialized:
+            return json.dumps(self.to_dict())
+        dict_ = self._cached_dict()
+        tracker = self.__pydantic_private__["_update_tracker"]
+        if tracker.json is None:
+            tracker.json = json.dumps(dict_)
+        return tracker.json
+
+    def _serialization_key(self) -> tuple:
+        if isinstance(self.content, Note):
+            return self.metadata.state_key, self.content.state_key
+        return (self.metadata.state_key,)
+
+    def _cache_state(self) -> tuple:
+        if isinstance(self.content, Note):
+            return self.metadata.content, self.content.content
+        return self.metadata.content, self.content
+
+    def _checked_tracker(self) -> _UpdateTracker:
+        """Return the update tracker, its caches dropped if stale."""
+        tracker = self.__pydantic_private__["_update_tracker"]
+        if tracker.snapshot is None:
+            return tracker
+        try:
+            unchanged = tracker.snapshot == self._cache_state()
+        except Exception:
+            unchanged = False
+        if not unchanged:
+            tracker.drop_cached()
+        return tracker
+
+    def _take_snapshot(self, tracker: _UpdateTracker) -> None:
+        if tracker.snapshot is None:
+            self._materialize_last_updated()
+            tracker.snapshot = copy_nested(self._cache_state())
+
+    def _cached_dict(self) -> dict[str, Any]:
+        tracker = self._checked_tracker()
+        if tracker.dumped is None:
+            tracker.json = None
+            tracker.dumped = self._dump_dict()
+            self._take_snapshot(tracker)
+        return tracker.dumped
+
+    def _cached_render(self, name: str, render: Callable[[], Any]) -> Any:
+        """
+        Return `render()`, reusing the previous result while unchanged.
+
+        The result is shared between calls; callers must copy it before
+        handing it out for modification.
+        """
+        tracker = self._checked_tracker()
+        if tracker.rendered is None:
+            tracker.rendered = {}
+        elif name in tracker.rendered:
+            return tracker.rendered[name]
+        value = render()
+        tracker.rendered[name] = value
+        self._take_snapshot(tracker)
+        return value
+
+    def _dump_dict(self, **kwargs: Any) -> dict[str, Any]:
         dict_ = self.model_dump(**kwargs)
         if isinstance(self.content, Note):
             dict_["content"] = self._serialize_note_recursive(self.content)
@@ -190,7 +368,7 @@ class Component(Element, OperableModel):
         Returns:
             T: An instance of the Component class or its subclass.
         """
-        input_data = copy(data)
+        input_data = copy_nested(data)
         if "lion_class" in input_data:
             cls = get_class(input_data.pop("lion_class"))
         if cls.from_dict.__func__ != Component.from_dict.__func__:
@@ -203,8 +381,9 @@ class Component(Element, OperableModel):
         obj = cls.model_validate(input_data, **kwargs)
         for k, v in extra_fields.items():
             obj.update_field(k, value=v)
+        obj._discard_pending_updates()
 
-        metadata = copy(data.get("metadata", {}))
+        metadata = copy_nested(data.get("metadata", {}))
         last_updated = metadata.get("last_updated", None)
         if last_updated is not None:
             obj.metadata.set(["last_updated"], last_updated)
@@ -212,6 +391,45 @@ class Component(Element, OperableModel):
             obj.metadata.pop(["last_updated"], None)
         return obj
 
+    @override
+    @classmethod
+    def _bulk_loadable(cls) -> bool:
+        return cls.from_dict.__func__ is Component.from_dict.__func__
+
+    @override
+    @classmethod
+    def _load_records(cls, records: list[dict], /) -> list["Component"]:
+        """
+        Load records of this class, validating them as one list.
+
+        Records with keys outside the model fields need `update_field`
+        and go through `from_dict` one by one.
+        """
+        if not cls._bulk_loadable():
+            return super()._load_records(records)
+
+        fields = cls.model_fields
+        out = [None] * len(records)
+        plain, plain_indices = [], []
+        for i, record in enumerate(records):
+            if all(k in fields or k == "lion_class" for k in record):
+                plain.append(
+                    {k: copy_nested(v) for k, v in record.items() if k != "lion_class"}
+                )
+                plain_indices.append(i)
+            else:
+                out[i] = cls.from_dict(record)
+
+        loaded = cls._validate_records(plain)
+        for i, obj in zip(plain_indices, loaded):
+            metadata = records[i].get("metadata")
+            if isinstance(metadata, dict):
+                last_updated = metadata.get("last_updated")
+                if last_updated is not None:
+                    obj.metadata.set("last_updated", copy_nested(last_updated))
+            out[i] = obj
+        return out
+
     @override
     def __setattr__(self, field_name: str, value: Any) -> None:
         if field_name == "metadata":
@@ -225,8 +443,18 @@ class Component(Element, OperableModel):
 
         self._add_last_update(field_name)
 
+    @override
+    def __copy__(self) -> "Component":
+        new = super().__copy__()
+        new.__pydantic_private__["_update_tracker"] = self.__pydantic_private__[
+            "_update_tracker"
+        ].copy()
+        return new
+
     @override
     def __getattr__(self, field_name: str) -> Any:
+        if field_name.startswith("_"):
+            return super().__getattr__(field_name)
         if field_name in self.extra_fields:
             default_ = self.extra_fields[field_name].default
             if default_ is not PydanticUndefined:
@@ -241,6 +469,7 @@ class Component(Element, OperableModel):
     @override
     def __str__(self) -> str:
         """Return a concise string representation of the component."""
+        self._materialize_last_updated()
         content_preview = str(self.content)[:50]
         if len(content_preview) == 50:
             content_preview += "..."
@@ -289,6 +518,7 @@ class Component(Element, OperableModel):
                 truncated["..."] = f"({len(d) - max_items} more items)"
             return truncated
 
+        self._materialize_last_updated()
         content_repr = repr(self.content)
         if len(content_repr) > 100:
             content_repr = content_repr[:97] + "..."
@@ -1,8 +1,9 @@
 """Base element module for the Lion framework."""
 
 from datetime import datetime
+from time import time as unix_time
 
-from pydantic import field_validator
+from pydantic import TypeAdapter, field_validator
 from typing_extensions import override
 
 from lion.core._class_registry import LION_CLASS_REGISTRY, get_class
@@ -22,6 +23,9 @@ from lion.settings import Settings
 
 T = TypeVar("T", bound=Observable)
 
+# list[cls] validators used by bulk loading, one per concrete class
+_RECORDS_ADAPTERS: dict[type, TypeAdapter] = {}
+
 
 class Element(BaseModel, Observable):
     """Base class in the Lion framework."""
@@ -58,6 +62,33 @@ class Element(BaseModel, Observable):
         super().__pydantic_init_subclass__(**kwargs)
         LION_CLASS_REGISTRY[cls.__name__] = cls
 
+    @classmethod
+    def fast_new(cls, **data: Any) -> T:
+        """
+        Create an instance from trusted data, skipping validation.
+
+        A `model_construct` for internal creation paths: no validators
+        or custom `__init__` run and values are stored as given, so the
+        data must already have the field types (e.g. `Note` rather than
+        dict, enum members rather than strings, validated IDs). Missing
+        fields get their defaults; `ln_id` and `timestamp` are generated.
+
+        Only worth it for classes without default factories, such as
+        `Log`: `model_construct` inspects each factory it calls, which
+        makes it slower than the constructor for `Component` subclasses.
+
+        Args:
+            **data: Field values, by field name.
+
+        Returns:
+            A new instance of the class.
+        """
+        if "ln_id" not in data:
+            data["ln_id"] = ID.id()
+        if "timestamp" not in data:
+            data["timestamp"] = unix_time()
+        return cls.model_construct(**data)
+
     @property
     def created_datetime(self) -> datetime:
         """Get the creation datetime of the Element."""
@@ -96,6 +127,79 @@ class Element(BaseModel, Observable):
             return cls.from_dict(data, **kwargs)
         return cls.model_validate(data, **kwargs)
 
+    @classmethod
+    def from_dicts(cls, data: list[dict], /) -> list[T]:
+        """
+        Create elements from many dictionaries, preserving their order.
+
+        Records are grouped by `lion_class`, each class is resolved once,
+        and each group is loaded with `_load_records`, which validates the
+        whole group in one call when the class supports it. Records
+        without `lion_class` are loaded as `cls`.
+
+        Args:
+            data: Dictionaries as produced by `to_dict`. They are not
+                modified.
+
+        Returns:
+            The loaded elements, in the order of `data`.
+        """
+        classes: dict[str, type[Element]] = {}
+        groups: dict[type[Element], list[int]] = {}
+        for i, record in enumerate(data):
+            name = record.get("lion_class")
+            if name is None:
+                target = cls
+            elif (target := classes.get(name)) is None:
+                target = classes[name] = get_class(name)
+            groups.setdefault(target, []).append(i)
+
+        out = [None] * len(data)
+        for target, indices in groups.items():
+            loaded = target._load_records([data[i] for i in indices])
+            for i, obj in zip(indices, loaded):
+                out[i] = obj
+        return out
+
+    @classmethod
+    def _bulk_loadable(cls) -> bool:
+        """Whether `from_dict` amounts to validating the record as is."""
+        return cls.from_dict.__func__ is Element.from_dict.__func__
+
+    @classmethod
+    def _records_adapter(cls) -> TypeAdapter:
+        adapter = _RECORDS_ADAPTERS.get(cls)
+        if adapter is None:
+            adapter = _RECORDS_ADAPTERS[cls] = TypeAdapter(list[cls])
+        return adapter
+
+    @classmethod
+    def _validate_records(cls, records: list[dict], /) -> list[T]:
+        """
+        Validate field dicts into instances of this class.
+
+        A custom `__init__` (as on messages, which take load flags) is
+        not called: each record is validated into a bare instance, as
+        `BaseModel.__init__` does, instead of as one list.
+        """
+        if not cls.__pydantic_custom_init__:
+            return cls._records_adapter().validate_python(records)
+        validate = cls.__pydantic_validator__.validate_python
+        out = []
+        for record in records:
+            obj = cls.__new__(cls)
+            validate(record, self_instance=obj)
+            out.append(obj)
+        return out
+
+    @classmethod
+    def _load_records(cls, records: list[dict], /) -> list[T]:
+        """Load records that all belong to this class."""
+        if not cls._bulk_loadable():
+            return [cls.from_dict(dict(r)) for r in records]
+        records = [{k: v for k, v in r.items() if k != "lion_class"} for r in records]
+        return cls._validate_records(records)
+
     @override
     def to_dict(self, **kwargs: Any) -> dict:
         """Convert the Element to a dictionary representation."""
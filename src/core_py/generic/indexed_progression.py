@@ -0,0 +1,253 @@
+"""
+Copyright 2024 HaiyangLi
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+from collections import Counter
+from typing import Any
+
+from pydantic import PrivateAttr
+from typing_extensions import override
+
+from lion.core.typing import ID, ItemNotFoundError, LnID
+
+from .element import Element
+from .progression import Progression
+from .utils import to_list_type, validate_order
+
+
+class IndexedProgression(Progression):
+    """
+    A Progression backed by a hash index over its order.
+
+    Keeps the list semantics of `Progression` (slicing, insert, popleft,
+    duplicates) while answering membership and count queries in O(1).
+    Positions are served from a first-occurrence map that is maintained
+    on appends and pops from the right, and lazily rebuilt after any
+    mutation that shifts positions, so repeated `index` lookups are O(1)
+    amortized.
+
+    Note:
+        The index is kept in sync through the Progression API and on
+        reassignment of `order`. Mutating `order` in place directly
+        bypasses the index; call `reindex()` afterwards if you must.
+    """
+
+    _counts: dict[LnID, int] = PrivateAttr(default_factory=dict)
+    _positions: dict[LnID, int] = PrivateAttr(default_factory=dict)
+    _positions_valid: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build the index from the validated order."""
+        self.reindex()
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "order":
+            self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild the membership index from the current order."""
+        self._counts = dict(Counter(self.order))
+        self._positions = {}
+        self._positions_valid = False
+
+    def _position(self, item_id: LnID, /) -> int:
+        """Return the position of the first occurrence of an ID."""
+        if not self._positions_valid:
+            positions = {}
+            for idx, i in enumerate(self.order):
+                positions.setdefault(i, idx)
+            self._positions = positions
+            self._positions_valid = True
+        return self._positions[item_id]
+
+    def _add_counts(self, ids: list[LnID], /) -> None:
+        # private attributes resolve through pydantic's __getattr__, so
+        # bind the dict once rather than per ID
+        counts = self.__pydantic_private__["_counts"]
+        for i in ids:
+            counts[i] = counts.get(i, 0) + 1
+
+    def _drop_count(self, item_id: LnID, /) -> None:
+        if self._counts[item_id] == 1:
+            del self._counts[item_id]
+        else:
+            self._counts[item_id] -= 1
+
+    @override
+    def __contains__(self, item: ID.RefSeq | ID.Ref) -> bool:
+        """Check if item(s) are in the progression."""
+        if item is None or not self._counts:
+            return False
+        if isinstance(item, str):
+            return item in self._counts
+        if isinstance(item, Element):
+            return item.ln_id in self._counts
+
+        item = to_list_type(item) if not isinstance(item, list) else item
+        if not item:
+            return False
+        for i in item:
+            if isinstance(i, str):
+                check = i in self._counts
+            elif isinstance(i, Element):
+                check = i.ln_id in self._counts
+            else:
+                check = False
+            if not check:
+                return False
+        return True
+
+    @override
+    def __delitem__(self, key: int | slice) -> None:
+        """Delete an item or slice of items from the progression."""
+        super().__delitem__(key)
+        self.reindex()
+
+    @override
+    def clear(self) -> None:
+        """Clear the progression."""
+        super().clear()
+        self._counts.clear()
+        self._positions.clear()
+        self._positions_valid = True
+
+    @override
+    def append(self, item: ID.RefSeq, /) -> None:
+        """Append an item to the end of the progression."""
+        self._append_ids(validate_order(item))
+
+    @override
+    def _append_ids(self, ids: list[LnID], /) -> None:
+        """Append already validated IDs and index them."""
+        start = len(self.order)
+        self.order.extend(ids)
+        self._add_counts(ids)
+        if self._positions_valid:
+            positions = self._positions
+            for offset, i in enumerate(ids):
+                positions.setdefault(i, start + offset)
+
+    @override
+    def pop(self, index: int = None, /) -> str:
+        """Remove and return an item from the progression."""
+        last = len(self.order) - 1
+        result = super().pop(index)
+        self._drop_count(result)
+        if index is None or index == -1 or index == last:
+            if self._positions.get(result) == last:
+                del self._positions[result]
+        else:
+            self._positions_valid = False
+        return result
+
+    @override
+    def include(self, item: ID.RefSeq, /) -> None:
+        """Include item(s) in the progression."""
+        to_add = []
+        seen = set()
+        for i in validate_order(item):
+            if i not in self._counts and i not in seen:
+                seen.add(i)
+                to_add.append(i)
+        if to_add:
+            self._append_ids(to_add)
+
+    @override
+    def exclude(self, item: int | ID.RefSeq, /) -> None:
+        """Exclude an item or items from the progression."""
+        drop = {i for i in validate_order(item) if i in self._counts}
+        if drop:
+            self.order = [i for i in self.order if i not in drop]
+
+    @override
+    def index(self, item: Any, /, start: int = 0, end: int = None) -> int:
+        """Return the index of an item in the progression."""
+        item_id = ID.get_id(item)
+        if start == 0 and end is None:
+            if item_id not in self._counts:
+                raise ValueError(f"{item_id} is not in progression")
+            return self._position(item_id)
+        return super().index(item_id, start, end)
+
+    @override
+    def remove(self, item: ID.RefSeq, /) -> None:
+        """Remove the next occurrence of an item from the progression."""
+        item_ = validate_order(item) if item in self else []
+        needed = Counter(item_)
+        if not item_ or any(self._counts[k] < v for k, v in needed.items()):
+            raise ItemNotFoundError(f"{item}")
+
+        if len(item_) == 1:
+            item_id = item_[0]
+            del self.order[self._position(item_id)]
+            self._drop_count(item_id)
+            self._positions_valid = False
+            return
+
+        new_order = []
+        for i in self.order:
+            if needed.get(i):
+                needed[i] -= 1
+                continue
+            new_order.append(i)
+        self.order = new_order
+
+    @override
+    def popleft(self) -> str:
+        """Remove and return the leftmost item from the progression."""
+        result = super().popleft()
+        self._drop_count(result)
+        self._positions_valid = False
+        return result
+
+    @override
+    def extend(self, item: Progression, /) -> None:
+        """Extend the progression from the right with another progression."""
+        if not isinstance(item, Progression):
+            raise TypeError(
+                f"Expected a Progression, got {type(item).__name__}",
+            )
+        self.append(list(item.order))
+
+    @override
+    def count(self, item: ID.Ref, /) -> int:
+        """Return the number of occurrences of an item"""
+        if item not in self:
+            return 0
+        return self._counts[ID.get_id(item)]
+
+    @override
+    def insert(self, index: int, item: ID.RefSeq, /) -> None:
+        """Insert an item at the specified index."""
+        item_ = validate_order(item)
+        super().insert(index, item_)
+        self._add_counts(item_)
+        self._positions_valid = False
+
+    @override
+    def __repr__(self) -> str:
+        return f"IndexedProgression({self.order})"
+
+    @override
+    def __str__(self) -> str:
+        """Return a string representation of the progression."""
+        if len(a := str(self.order)) > 50:
+            a = a[:50] + "..."
+        return f"IndexedProgression(name={self.name}, size={len(self)}, items={a})"
+
+
+__all__ = ["IndexedProgression"]
@@ -19,9 +19,8 @@ import threading
 from collections.abc import AsyncIterator, Callable, Iterator, Sequence
 from functools import wraps
 from pathlib import Path
-from typing import Any, ClassVar, Generic, Self, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, Self, TypeVar
 
-import pandas as pd
 from pydantic import field_serializer
 from typing_extensions import override
 
@@ -34,22 +33,45 @@ from lion.core.typing import (
     ItemNotFoundError,
     Observable,
 )
+from lion.libs.concurrency import NullLock, RWLock, UnifiedLock
 from lion.libs.parse import is_same_dtype, to_list
 from lion.protocols.adapters.adapter import Adapter, AdapterRegistry
 from lion.protocols.registries._pile_registry import PileAdapterRegistry
 
 from .element import Element
+from .indexed_progression import IndexedProgression
+from .pile_index import INDEX_KEY, PileIndex, PileView
 from .progression import Progression
 from .utils import to_list_type, validate_order
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 T = TypeVar("T", bound=Element)
 D = TypeVar("D")
 
+CONCURRENCY_MODE = Literal["mutex", "rw", "unified", "none"]
+
+_MODE_LOCKS: dict[str, type[RWLock]] = {
+    "rw": RWLock,
+    "unified": UnifiedLock,
+    "none": NullLock,
+}
+
 
 def synchronized(func: Callable):
     @wraps(func)
     def wrapper(self: "Pile", *args, **kwargs):
-        with self.lock:
+        with self._write_guard():
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def read_synchronized(func: Callable):
+    @wraps(func)
+    def wrapper(self: "Pile", *args, **kwargs):
+        with self._read_guard():
             return func(self, *args, **kwargs)
 
     return wrapper
@@ -58,14 +80,32 @@ def synchronized(func: Callable):
 def async_synchronized(func: Callable):
     @wraps(func)
     async def wrapper(self: "Pile", *args, **kwargs):
-        async with self.async_lock:
+        async with self._async_write_guard():
+            return await func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def async_read_synchronized(func: Callable):
+    @wraps(func)
+    async def wrapper(self: "Pile", *args, **kwargs):
+        async with self._async_read_guard():
             return await func(self, *args, **kwargs)
 
     return wrapper
 
 
 class Pile(Element, Generic[T]):
-    """thread-safe async-compatible, ordered collection of elements."""
+    """thread-safe async-compatible, ordered collection of elements.
+
+    Locking is selected per pile with `concurrency_mode`:
+        - "mutex" (default): a `threading.Lock` for sync methods and a
+          separate `asyncio.Lock` for the async ones.
+        - "rw": a reader/writer lock shared by sync and async methods;
+          concurrent reads (`get`, iteration) do not block each other.
+        - "unified": a single mutex shared by sync and async methods.
+        - "none": no locking, for single-threaded asyncio deployments.
+    """
 
     pile_: dict[str, T] = Field(default_factory=dict)
     item_type: set[type[T]] | None = Field(
@@ -74,7 +114,7 @@ class Pile(Element, Generic[T]):
         exclude=True,
     )
     progress: Progression = Field(
-        default_factory=Progression,
+        default_factory=IndexedProgression,
         description="Progression specifying the order of items in the pile.",
         exclude=True,
     )
@@ -83,6 +123,12 @@ class Pile(Element, Generic[T]):
         description="Specify if enforce a strict type check",
         frozen=True,
     )
+    concurrency_mode: CONCURRENCY_MODE = Field(
+        default="mutex",
+        description="Locking strategy used by the synchronized methods",
+        frozen=True,
+        exclude=True,
+    )
 
     _adapter_registry: ClassVar[AdapterRegistry] = PileAdapterRegistry
 
@@ -102,6 +148,7 @@ class Pile(Element, Generic[T]):
         item_type: set[type[T]] = None,
         order: ID.RefSeq = None,
         strict_type: bool = False,
+        concurrency_mode: CONCURRENCY_MODE = "mutex",
         **kwargs,
     ) -> None:
         """
@@ -112,6 +159,8 @@ class Pile(Element, Generic[T]):
             item_type: Allowed types for items in the pile.
             order: Initial order of items (as Progression).
             strict: If True, enforce strict type checking.
+            concurrency_mode: Locking strategy, one of "mutex", "rw",
+                "unified" or "none".
         """
         _config = {}
         if "ln_id" in kwargs:
@@ -119,7 +168,11 @@ class Pile(Element, Generic[T]):
         if "created" in kwargs:
             _config["created"] = kwargs["created"]
 
-        super().__init__(strict_type=strict_type, **_config)
+        super().__init__(
+            strict_type=strict_type,
+            concurrency_mode=concurrency_mode,
+            **_config,
+        )
         self.item_type = self._validate_item_type(item_type)
         self.pile_ = self._validate_pile(items or kwargs.get("pile_", {}))
         self.progress = self._validate_order(order)
@@ -144,8 +197,58 @@ class Pile(Element, Generic[T]):
             ValueError: If the dictionary format is invalid.
         """
         items = data.pop("pile_", [])
-        items = [Element.from_dict(i) for i in items]
-        return cls(items=items, **data)
+        return cls.from_records(items, **data)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: list[dict[str, Any]],
+        /,
+        **kwargs,
+    ) -> "Pile":
+        """Build a Pile from serialized items, loading them in bulk.
+
+        Records are grouped by `lion_class` and each class is resolved
+        once (see `Element.from_dicts`); classes without a custom
+        `__init__` are validated in one call per group.
+
+        Args:
+            records: Item dictionaries as produced by `to_dict`.
+            **kwargs: Arguments for `from_iterable` (item_type,
+                strict_type, ...).
+
+        Returns:
+            A new Pile holding the loaded items, in record order.
+        """
+        return cls.from_iterable(Element.from_dicts(records), **kwargs)
+
+    @classmethod
+    def from_iterable(
+        cls,
+        items: ID.ItemSeq,
+        /,
+        item_type: set[type[T]] = None,
+        strict_type: bool = False,
+        **kwargs,
+    ) -> "Pile":
+        """Build a Pile from a large collection of items in one pass.
+
+        Validates like `Pile(items=...)`: duplicates are collapsed with a
+        dict, type checks run once per concrete class and the order is
+        appended in a single operation without re-validating IDs.
+
+        Args:
+            items: Items to load, in order.
+            item_type: Allowed types for items in the pile.
+            strict_type: If True, enforce strict type checking.
+            **kwargs: Additional arguments for the Pile constructor.
+
+        Returns:
+            A new Pile holding the items.
+        """
+        pile = cls(item_type=item_type, strict_type=strict_type, **kwargs)
+        pile._include(items)
+        return pile
 
     def __setitem__(
         self,
@@ -255,6 +358,22 @@ class Pile(Element, Generic[T]):
         """
         self._update(other)
 
+    @synchronized
+    def extend_many(self, items: ID.ItemSeq, /) -> None:
+        """Include many items in a single validation pass.
+
+        Bulk counterpart of `include`: items already in the Pile are
+        replaced in place, new ones are appended in order in one
+        operation.
+
+        Args:
+            items: Items to include.
+
+        Raises:
+            TypeError: If an item is not of an allowed type.
+        """
+        self._include(items)
+
     @synchronized
     def insert(self, index: int, item: T, /) -> None:
         """Insert an item at a specific position in the Pile.
@@ -283,7 +402,7 @@ class Pile(Element, Generic[T]):
         """
         self.update(item)
 
-    @synchronized
+    @read_synchronized
     def get(
         self,
         key: ID.Ref | ID.RefSeq | int | slice,
@@ -308,6 +427,62 @@ class Pile(Element, Generic[T]):
         """
         return self._get(key, default)
 
+    def add_index(self, name: str, key: INDEX_KEY, /) -> None:
+        """Declare a secondary index on the Pile.
+
+        The index is built from the current items and then maintained
+        incrementally by every mutation of the Pile, so lookups cost
+        O(k) in the size of the result.
+
+        Args:
+            name: The name of the index.
+            key: A class (index instances of it), an attribute name (index
+                by attribute value), or a callable returning the key.
+
+        Raises:
+            ValueError: If an index with the same name already exists.
+        """
+        if name in self.indexes:
+            raise ValueError(f"Index {name} already exists.")
+        index = PileIndex(name, key)
+        index.add(self.values())
+        self.indexes[name] = index
+
+    def remove_index(self, name: str, /) -> None:
+        """Drop a secondary index from the Pile."""
+        self.indexes.pop(name, None)
+
+    def view(self, name: str, value: Any = True, /) -> PileView[T]:
+        """Return a live view over the items of an index bucket.
+
+        Args:
+            name: The name of the index.
+            value: The bucket key. Defaults to True, the bucket of a class
+                index.
+
+        Returns:
+            A read-only view that reflects later changes to the Pile.
+
+        Raises:
+            KeyError: If no index with that name exists.
+        """
+        if name not in self.indexes:
+            raise KeyError(f"Index {name} does not exist.")
+        return PileView(self, name, value)
+
+    def refresh_indexes(self, item: ID.Ref | ID.RefSeq = None, /) -> None:
+        """Recompute index keys after indexed attributes were mutated.
+
+        Args:
+            item: The item(s) to refresh. Refreshes every item if None.
+        """
+        items = self.values() if item is None else to_list_type(item)
+        for i in items:
+            i = self.pile_.get(ID.get_id(i))
+            if i is not None:
+                for index in self.indexes.values():
+                    index.refresh(i)
+
     def keys(self) -> Sequence[str]:
         """Return a sequence of all keys (Lion IDs) in the Pile.
 
@@ -364,7 +539,7 @@ class Pile(Element, Generic[T]):
         Yields:
             Items in the Pile in their current order.
         """
-        with self.lock:
+        with self._read_guard():
             current_order = list(self.progress)
 
         for key in current_order:
@@ -562,13 +737,24 @@ class Pile(Element, Generic[T]):
         state = self.__dict__.copy()
         state["_lock"] = None
         state["_async_lock"] = None
+        state["_rwlock"] = None
+        state["_indexes"] = None
+        state["_index_keys"] = {
+            name: index.key
+            for name, index in self.indexes.items()
+            if isinstance(index.key, type | str)
+        }
         return state
 
     def __setstate__(self, state):
         """Restore the Pile instance after unpickling."""
+        state = dict(state)
+        index_keys = state.pop("_index_keys", {})
         self.__dict__.update(state)
         self._lock = threading.Lock()
         self._async_lock = asyncio.Lock()
+        for name, key in index_keys.items():
+            self.add_index(name, key)
 
     @property
     def lock(self):
@@ -577,6 +763,62 @@ class Pile(Element, Generic[T]):
             self._lock = threading.Lock()
         return self._lock
 
+    @property
+    def rwlock(self) -> RWLock | None:
+        """The lock shared by sync and async methods, or None in "mutex"
+        mode."""
+        if not hasattr(self, "_rwlock") or self._rwlock is None:
+            lock_cls = _MODE_LOCKS.get(self.concurrency_mode)
+            if lock_cls is None:
+                return None
+            self._rwlock = lock_cls()
+        return self._rwlock
+
+    def _read_guard(self):
+        if self.rwlock is None:
+            return self.lock
+        return self.rwlock.read()
+
+    def _write_guard(self):
+        if self.rwlock is None:
+            return self.lock
+        return self.rwlock.write()
+
+    def _async_read_guard(self):
+        if self.rwlock is None:
+            return self.async_lock
+        return self.rwlock.aread()
+
+    def _async_write_guard(self):
+        if self.rwlock is None:
+            return self.async_lock
+        return self.rwlock.awrite()
+
+    @property
+    def indexes(self) -> dict[str, PileIndex]:
+        """Secondary indexes declared on the Pile.
+
+        Class and attribute indexes are rebuilt when the Pile is
+        unpickled; indexes keyed by a callable are dropped, since the
+        callable may not be picklable.
+        """
+        if not hasattr(self, "_indexes") or self._indexes is None:
+            self._indexes = {}
+        return self._indexes
+
+    def _index_add(self, items: Any, /, ordered: bool = True) -> None:
+        for index in self.indexes.values():
+            index.add(items, ordered=ordered)
+
+    def _index_remove(self, item_ids: Any, /) -> None:
+        for index in self.indexes.values():
+            index.remove(item_ids)
+
+    def _index_refresh(self, items: Any, /) -> None:
+        for index in self.indexes.values():
+            for i in items:
+                index.refresh(i)
+
     @property
     def async_lock(self):
         """Ensure the async lock is always available, even during unpickling"""
@@ -692,7 +934,7 @@ class Pile(Element, Generic[T]):
     ) -> None:
         self._update(other)
 
-    @async_synchronized
+    @async_read_synchronized
     async def aget(
         self,
         key: Any,
@@ -715,7 +957,7 @@ class Pile(Element, Generic[T]):
             allowing other async operations to run between iterations.
         """
 
-        async with self.async_lock:
+        async with self._async_read_guard():
             current_order = list(self.progress)
 
         for key in current_order:
@@ -803,9 +1045,12 @@ class Pile(Element, Generic[T]):
                     else [self.progress[key]]
                 )
                 self.progress[key] = item_order
-                for i in to_list(delete_order, flatten=True):
+                delete_order = to_list(delete_order, flatten=True)
+                for i in delete_order:
                     self.pile_.pop(i)
                 self.pile_.update(item_dict)
+                self._index_remove(delete_order)
+                self._index_add(item_dict.values(), ordered=False)
             except Exception as e:
                 raise ValueError(f"Failed to set pile. Error: {e}")
         else:
@@ -824,6 +1069,7 @@ class Pile(Element, Generic[T]):
                     )
             self.progress += key
             self.pile_.update(item_dict)
+            self._index_add(item_dict.values(), ordered=False)
 
     def _get(self, key: Any, default: D = UNDEFINED) -> T | "Pile" | D:
         """
@@ -897,6 +1143,7 @@ class Pile(Element, Generic[T]):
                 for i in pops:
                     self.progress.remove(i)
                     result.append(self.pile_.pop(i))
+                self._index_remove(pops)
                 result = (
                     self.__class__(items=result, item_type=self.item_type)
                     if len(result) > 1
@@ -914,6 +1161,7 @@ class Pile(Element, Generic[T]):
                 for k in key:
                     self.progress.remove(k)
                     result.append(self.pile_.pop(k))
+                self._index_remove(key)
                 if len(result) == 0:
                     raise ItemNotFoundError(f"key {key} item not found")
                 elif len(result) == 1:
@@ -941,22 +1189,28 @@ class Pile(Element, Generic[T]):
             return
         raise ItemNotFoundError(f"{item}")
 
-    def _include(self, item: ID.ItemSeq | ID.Item):
+    def _include(self, item: ID.ItemSeq | ID.Item, trusted: bool = False):
         """
         Include item(s) in pile if not already present.
 
         Args:
             item: Item(s) to include. Can be single item or collection.
+            trusted: Skip the item type checks.
         """
-        item_dict = self._validate_pile(item)
+        item_dict = self._validate_pile(item, trusted=trusted)
 
         item_order = []
+        existing = []
         for i in item_dict.keys():
-            if i not in self.progress:
+            if i not in self.pile_:
                 item_order.append(i)
+            else:
+                existing.append(item_dict[i])
 
-        self.progress.append(item_order)
+        self.progress._append_ids(item_order)
         self.pile_.update(item_dict)
+        self._index_add([item_dict[i] for i in item_order])
+        self._index_refresh(existing)
 
     def _exclude(self, item: ID.Ref | ID.RefSeq):
         """
@@ -977,15 +1231,21 @@ class Pile(Element, Generic[T]):
         """Remove all items from the pile."""
         self.pile_.clear()
         self.progress.clear()
+        for index in self.indexes.values():
+            index.clear()
 
     def _update(self, other: ID.ItemSeq | ID.Item):
         """Update pile with another collection of items."""
         others = self._validate_pile(other)
-        for i in others.keys():
+        new = []
+        for i, item in others.items():
             if i in self.pile_:
-                self.pile_[i] = others[i]
+                self.pile_[i] = item
+                self._index_refresh([item])
             else:
-                self.include(others[i])
+                new.append(item)
+        if new:
+            self._include(new, trusted=True)
 
     def _validate_item_type(self, value) -> set[type[T]] | None:
         """
@@ -1026,39 +1286,51 @@ class Pile(Element, Generic[T]):
         if len(value) > 0:
             return set(value)
 
-    def _validate_pile(self, value: Any) -> dict[str, T]:
-        """Validate and convert the items to be added to the pile."""
+    def _validate_pile(self, value: Any, trusted: bool = False) -> dict[str, T]:
+        """Validate and convert the items to be added to the pile.
+
+        The type check runs once per concrete class rather than once per
+        item. With `trusted=True` the check is skipped entirely.
+        """
         if not value:
             return {}
 
         value = to_list_type(value)
+        if trusted:
+            return {i.ln_id: i for i in value}
 
+        accepted = set()
         result = {}
         for i in value:
-            if self.item_type:
-                if self.strict_type:
-                    if type(i) not in self.item_type:
-                        raise TypeError(
-                            message="Invalid item type in pile."
-                            f" Expected {self.item_type}",
-                        )
-                else:
-                    if not any(issubclass(type(i), t) for t in self.item_type):
-                        raise TypeError(
-                            "Invalid item type in pile. Expected "
-                            f"{self.item_type} or the subclasses",
-                        )
-            else:
-                if not isinstance(i, Observable):
-                    raise ValueError(f"Invalid pile item {i}")
-
+            cls = i.__class__
+            if cls not in accepted:
+                self._check_item_class(cls, i)
+                accepted.add(cls)
             result[i.ln_id] = i
 
         return result
 
+    def _check_item_class(self, cls: type, item: Any, /) -> None:
+        """Raise if items of `cls` are not allowed in the pile."""
+        if self.item_type:
+            if self.strict_type:
+                if cls not in self.item_type:
+                    raise TypeError(
+                        f"Invalid item type in pile. Expected {self.item_type}",
+                    )
+            elif not any(issubclass(cls, t) for t in self.item_type):
+                raise TypeError(
+                    "Invalid item type in pile. Expected "
+                    f"{self.item_type} or the subclasses",
+                )
+        elif not issubclass(cls, Observable):
+            raise ValueError(f"Invalid pile item {item}")
+
     def _validate_order(self, value: Any) -> Progression:
         if not value:
-            return self.progress.__class__(order=list(self.pile_.keys()))
+            progress = self.progress.__class__()
+            progress._append_ids(list(self.pile_.keys()))
+            return progress
 
         if isinstance(value, Progression):
             value = list(value)
@@ -1089,6 +1361,7 @@ class Pile(Element, Generic[T]):
             item_order.append(i)
         self.progress.insert(index, item_order)
         self.pile_.update(item_dict)
+        self._index_add(item_dict.values(), ordered=False)
 
     @field_serializer("pile_")
     def _(self, value: dict[str, T]):
@@ -1115,7 +1388,10 @@ class Pile(Element, Generic[T]):
         Enter async context - useful for bulk operations that need
         guaranteed cleanup.
         """
-        await self.async_lock.acquire()
+        if self.rwlock is None:
+            await self.async_lock.acquire()
+        else:
+            await self.rwlock.aacquire_write()
         return self
 
     async def __aexit__(
@@ -1127,7 +1403,10 @@ class Pile(Element, Generic[T]):
         """
         Exit async context - ensures lock release.
         """
-        self.async_lock.release()
+        if self.rwlock is None:
+            self.async_lock.release()
+        else:
+            self.rwlock.release_write()
 
     def is_homogenous(self) -> bool:
         return len(self.pile_) < 2 or all(is_same_dtype(self.pile_.values()))
@@ -1177,7 +1456,7 @@ def pile(
     item_type: type[T] | set[type[T]] | None = None,
     order: list[str] | None = None,
     strict_type: bool = False,
-    df: pd.DataFrame | None = None,  # priority 1
+    df: "pd.DataFrame | None" = None,  # priority 1
     fp: str | Path | None = None,  # priority 2
     **kwargs,
 ) -> Pile:
@@ -0,0 +1,211 @@
+"""
+Copyright 2024 HaiyangLi
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from lion.core.typing import ID, UNDEFINED, ItemNotFoundError
+
+from .element import Element
+
+if TYPE_CHECKING:
+    from .pile import Pile
+
+T = TypeVar("T", bound=Element)
+
+INDEX_KEY = type | str | Callable[[Any], Hashable]
+
+
+class PileIndex:
+    """
+    A secondary index over the items of a Pile.
+
+    Items are grouped into buckets by a key derived from the item. The key
+    can be:
+        - a class: items that are instances of it go into a single bucket
+          keyed by `True`.
+        - an attribute name: the attribute value is the bucket key.
+        - a callable: its return value is the bucket key.
+
+    Items whose key is `UNDEFINED` are not indexed. Buckets keep the pile
+    order; positional inserts mark the index unordered and buckets are
+    rebuilt in one pass on the next lookup.
+
+    Note:
+        Attribute and callable keys are captured when the item enters the
+        pile. If an indexed attribute is mutated afterwards, call
+        `Pile.refresh_indexes(item)` to move it to its new bucket.
+    """
+
+    def __init__(self, name: str, key: INDEX_KEY, /) -> None:
+        self.name = name
+        self.key = key
+        self.buckets: dict[Hashable, dict[str, None]] = {}
+        self._keys: dict[str, Hashable] = {}
+        self._ordered = True
+
+    def key_of(self, item: Element, /) -> Hashable:
+        """Compute the bucket key of an item."""
+        if isinstance(self.key, type):
+            return True if isinstance(item, self.key) else UNDEFINED
+        if isinstance(self.key, str):
+            return getattr(item, self.key, UNDEFINED)
+        return self.key(item)
+
+    def add(self, items: Iterable[Element], /, ordered: bool = True) -> None:
+        """Index items appended to (or inserted into) the pile."""
+        for item in items:
+            key = self.key_of(item)
+            if key is UNDEFINED:
+                continue
+            self._keys[item.ln_id] = key
+            self.buckets.setdefault(key, {})[item.ln_id] = None
+        if not ordered:
+            self._ordered = False
+
+    def remove(self, item_ids: Iterable[str], /) -> None:
+        """Drop item IDs from the index."""
+        for i in item_ids:
+            key = self._keys.pop(i, UNDEFINED)
+            if key is UNDEFINED:
+                continue
+            bucket = self.buckets[key]
+            bucket.pop(i, None)
+            if not bucket:
+                del self.buckets[key]
+
+    def refresh(self, item: Element, /) -> None:
+        """Recompute the key of an item already in the pile."""
+        if self._keys.get(item.ln_id, UNDEFINED) == self.key_of(item):
+            return
+        self.remove([item.ln_id])
+        self.add([item], ordered=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the index."""
+        self.buckets.clear()
+        self._keys.clear()
+        self._ordered = True
+
+    def bucket(self, order: Iterable[str], value: Hashable, /) -> dict[str, None]:
+        """Return the bucket for a key, reordering buckets if needed."""
+        if not self._ordered:
+            buckets = {}
+            for i in order:
+                key = self._keys.get(i, UNDEFINED)
+                if key is not UNDEFINED:
+                    buckets.setdefault(key, {})[i] = None
+            self.buckets = buckets
+            self._ordered = True
+        return self.buckets.get(value, {})
+
+
+class PileView(Generic[T]):
+    """
+    A live, read-only view over one bucket of a Pile index.
+
+    The view holds no items itself; every access reads the current
+    state of the pile, so it never needs to be rebuilt after the pile
+    changes. Use `to_pile()` to materialize a detached Pile.
+    """
+
+    def __init__(self, pile: "Pile[T]", name: str, value: Hashable = True) -> None:
+        self.pile = pile
+        self.name = name
+        self.value = value
+
+    def _bucket(self) -> dict[str, None]:
+        return self.pile.indexes[self.name].bucket(self.pile.progress, self.value)
+
+    def keys(self) -> list[str]:
+        """Return the IDs in the view, in pile order."""
+        return list(self._bucket())
+
+    def values(self) -> list[T]:
+        """Return the items in the view, in pile order."""
+        return [self.pile.pile_[i] for i in self._bucket()]
+
+    def items(self) -> list[tuple[str, T]]:
+        """Return (ID, item) pairs in the view, in pile order."""
+        return [(i, self.pile.pile_[i]) for i in self._bucket()]
+
+    def first(self, default: Any = None) -> T | Any:
+        """Return the first item in the view, or `default` if empty."""
+        bucket = self._bucket()
+        return self.pile.pile_[next(iter(bucket))] if bucket else default
+
+    def last(self, default: Any = None) -> T | Any:
+        """Return the last item in the view, or `default` if empty."""
+        bucket = self._bucket()
+        return self.pile.pile_[next(reversed(bucket))] if bucket else default
+
+    def is_empty(self) -> bool:
+        return not self._bucket()
+
+    def size(self) -> int:
+        return len(self._bucket())
+
+    def to_pile(self) -> "Pile[T]":
+        """Materialize the view into a new Pile."""
+        return self.pile.__class__(
+            items=self.values(),
+            item_type=self.pile.item_type,
+        )
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.values())
+
+    def __reversed__(self) -> Iterator[T]:
+        return iter([self.pile.pile_[i] for i in reversed(self._bucket())])
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def __bool__(self) -> bool:
+        return not self.is_empty()
+
+    def __contains__(self, item: ID.Ref) -> bool:
+        try:
+            return ID.get_id(item) in self._bucket()
+        except Exception:
+            return False
+
+    def __getitem__(self, key: int | slice | ID.Ref) -> T | list[T]:
+        if isinstance(key, slice):
+            return self.values()[key]
+        if isinstance(key, int):
+            if key == -1:
+                item = self.last(UNDEFINED)
+                if item is UNDEFINED:
+                    raise ItemNotFoundError(f"index {key} item not found")
+                return item
+            try:
+                return self.pile.pile_[self.keys()[key]]
+            except IndexError as e:
+                raise ItemNotFoundError(f"index {key} item not found") from e
+        key = ID.get_id(key)
+        if key not in self._bucket():
+            raise ItemNotFoundError(f"key {key} item not found")
+        return self.pile.pile_[key]
+
+    def __str__(self) -> str:
+        return f"PileView({self.name}, {len(self)})"
+
+    def __repr__(self) -> str:
+        return f"PileView(name={self.name!r}, value={self.value!r}, size={len(self)})"
+
+
+__all__ = ["PileIndex", "PileView"]
@@ -25,6 +25,7 @@ from lion.core.typing import ID, Field, ItemNotFoundError, LnID, Ordering
 from lion.libs.parse import to_list
 
 from .element import Element
+from .progression_view import ProgressionView
 from .utils import to_list_type, validate_order
 
 
@@ -43,6 +44,13 @@ class Progression(Element, Ordering):
         description="The order of the progression.",
     )
 
+    @classmethod
+    def _from_ids(cls, ids: list[LnID], /, name: str | None = None) -> Self:
+        """Build a progression from already validated IDs."""
+        progress = cls(name=name)
+        progress._append_ids(ids)
+        return progress
+
     @field_validator("order", mode="before")
     def _validate_order(cls, value: ID.RefSeq) -> list[LnID]:
         """Validate the order field."""
@@ -90,7 +98,7 @@ class Progression(Element, Ordering):
             if not a:
                 raise ItemNotFoundError(f"index {key} item not found")
             if isinstance(key, slice):
-                return self.__class__(order=a)
+                return self._from_ids(a)
             else:
                 return a
         except IndexError:
@@ -127,8 +135,11 @@ class Progression(Element, Ordering):
 
     def append(self, item: ID.RefSeq, /) -> None:
         """Append an item to the end of the progression."""
-        item_ = validate_order(item)
-        self.order.extend(item_)
+        self._append_ids(validate_order(item))
+
+    def _append_ids(self, ids: list[LnID], /) -> None:
+        """Append already validated IDs in one operation."""
+        self.order.extend(ids)
 
     def pop(self, index: int = None, /) -> str:
         """Remove and return an item from the progression."""
@@ -152,13 +163,22 @@ class Progression(Element, Ordering):
             while i in self:
                 self.remove(i)
 
+    def view(self, key: slice | None = None, /) -> ProgressionView:
+        """Return a read-only view of the progression, or of a slice of it.
+
+        The view references this progression's order without copying or
+        validating it. See `ProgressionView`.
+        """
+        view = ProgressionView(self)
+        return view if key is None else view[key]
+
     def is_empty(self) -> bool:
         """Check if the progression is empty."""
         return not self.order
 
     def reverse(self) -> "Progression":
         """Return a reversed progression."""
-        return self.__class__(order=list(reversed(self.order)), name=self.name)
+        return self._from_ids(self.order[::-1], name=self.name)
 
     def __reverse__(self) -> "Progression":
         """Return a reversed progression."""
@@ -222,7 +242,7 @@ class Progression(Element, Ordering):
         other = validate_order(other)
         new_order = list(self.order)  # Create a new list to avoid modifying original
         new_order.extend(other)
-        return self.__class__(order=new_order)
+        return self._from_ids(new_order)
 
     def __radd__(self, other: ID.RefSeq) -> "Progression":
         """Reverse add operation"""
@@ -244,7 +264,7 @@ class Progression(Element, Ordering):
         new_order = list(self)
         for i in other:
             new_order.remove(i)
-        return self.__class__(order=new_order)
+        return self._from_ids(new_order)
 
     @override
     def __repr__(self) -> str:
@@ -0,0 +1,152 @@
+"""
+Copyright 2024 HaiyangLi
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from lion.core.typing import ID, ItemNotFoundError, LnID
+
+if TYPE_CHECKING:
+    from .progression import Progression
+
+VIEW_OP = slice | Callable[[LnID], bool]
+
+
+class ProgressionView:
+    """
+    A read-only window over the order of a Progression.
+
+    A view is a chain of slices and filters applied to the parent order.
+    It copies and validates nothing: positions are resolved against the
+    current parent order on every access, so the view stays live as the
+    parent changes. Slicing, reversing or filtering a view returns a new
+    view. Call `to_progression()` to materialize a real Progression.
+
+    Slices are resolved as `range` arithmetic, so chains of slices cost
+    O(1) until iterated. A slice applied after a filter resolves the
+    filtered positions first.
+    """
+
+    __slots__ = ("parent", "_ops")
+
+    def __init__(self, parent: "Progression", ops: tuple[VIEW_OP, ...] = ()) -> None:
+        self.parent = parent
+        self._ops = ops
+
+    def _positions(self) -> Sequence[int]:
+        order = self.parent.order
+        positions: Sequence[int] = range(len(order))
+        for op in self._ops:
+            if isinstance(op, slice):
+                positions = positions[op]
+            else:
+                positions = [p for p in positions if op(order[p])]
+        return positions
+
+    def _with(self, op: VIEW_OP, /) -> "ProgressionView":
+        return ProgressionView(self.parent, self._ops + (op,))
+
+    def reverse(self) -> "ProgressionView":
+        """Return a reversed view."""
+        return self._with(slice(None, None, -1))
+
+    def filter(self, predicate: Callable[[LnID], bool], /) -> "ProgressionView":
+        """Return a view of the IDs for which `predicate(id)` is true."""
+        return self._with(predicate)
+
+    def to_progression(self, name: str | None = None) -> "Progression":
+        """Materialize the view into a new Progression."""
+        progress = self.parent.__class__(name=name)
+        progress._append_ids(list(self))
+        return progress
+
+    def index(self, item: Any, /) -> int:
+        """Return the position of an item within the view."""
+        item_id = ID.get_id(item)
+        for idx, i in enumerate(self):
+            if i == item_id:
+                return idx
+        raise ValueError(f"{item_id} is not in view")
+
+    def count(self, item: ID.Ref, /) -> int:
+        """Return the number of occurrences of an item in the view."""
+        try:
+            item_id = ID.get_id(item)
+        except Exception:
+            return 0
+        return sum(1 for i in self if i == item_id)
+
+    def size(self) -> int:
+        return len(self)
+
+    def is_empty(self) -> bool:
+        return not self
+
+    def __list__(self) -> list[LnID]:
+        return list(self)
+
+    def __iter__(self) -> Iterator[LnID]:
+        order = self.parent.order
+        return (order[p] for p in self._positions())
+
+    def __reversed__(self) -> Iterator[LnID]:
+        return iter(self.reverse())
+
+    def __len__(self) -> int:
+        return len(self._positions())
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __contains__(self, item: ID.Ref) -> bool:
+        try:
+            item_id = ID.get_id(item)
+        except Exception:
+            return False
+        if not self._ops:
+            return item_id in self.parent
+        return any(i == item_id for i in self)
+
+    def __getitem__(self, key: int | slice) -> "LnID | ProgressionView":
+        if isinstance(key, slice):
+            return self._with(key)
+        if not isinstance(key, int):
+            key_cls = key.__class__.__name__
+            raise TypeError(f"indices must be integers or slices, not {key_cls}")
+        try:
+            return self.parent.order[self._positions()[key]]
+        except IndexError:
+            raise ItemNotFoundError(f"index {key} item not found")
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ProgressionView):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ProgressionView({list(self)})"
+
+    def __str__(self) -> str:
+        if len(a := str(list(self))) > 50:
+            a = a[:50] + "..."
+        return f"ProgressionView(size={len(self)}, items={a})"
+
+
+__all__ = ["ProgressionView"]
@@ -16,6 +16,7 @@ Copyright 2024 HaiyangLi
 
 import inspect
 from collections.abc import Callable, ItemsView, Iterator, ValuesView
+from functools import lru_cache
 from typing import Any, Self, TypeVar
 
 from pydantic import (
@@ -36,14 +37,12 @@ from lion.libs.constants import UNDEFINED
 from lion.libs.parse import (
     flatten,
     is_same_dtype,
-    nget,
     ninsert,
     npop,
-    nset,
     to_list,
     validate_boolean,
 )
-from lion.libs.utils import copy, unique_hash
+from lion.libs.utils import copy, copy_nested, unique_hash
 
 INDICE_TYPE = str | list[str | int]
 FIELD_NAME = TypeVar("FIELD_NAME", bound=str)
@@ -387,10 +386,138 @@ class OperableModel(BaseAutoModel):
             )
 
 
+class NotePath:
+    """
+    A precompiled path into the nested content of a Note.
+
+    The indices are normalized once, the same way `Note.get`/`set` would
+    normalize them on every call, and the walk over the structure is
+    inlined instead of going through `nget`/`nset`. Paths are immutable
+    and cached by `NotePath.of`, so they can be kept as module constants
+    or built inline.
+
+    Example:
+        >>> FUNCTION = NotePath(("action_request", "function"))
+        >>> FUNCTION.get(message.content.content)
+        'multiply'
+        >>> note[FUNCTION] = "add"
+    """
+
+    __slots__ = ("keys", "_parents", "_last")
+
+    def __init__(self, indices: "INDICE_TYPE | NotePath", /) -> None:
+        if isinstance(indices, NotePath):
+            keys = indices.keys
+        else:
+            keys = tuple(to_list(indices, flatten=True, dropna=True))
+        self.keys: tuple[str | int, ...] = keys
+        self._parents = keys[:-1]
+        self._last = keys[-1] if keys else UNDEFINED
+
+    @classmethod
+    def of(cls, indices: "INDICE_TYPE | NotePath", /) -> "NotePath":
+        """Return the cached path for `indices`, compiling it if needed."""
+        if isinstance(indices, NotePath):
+            return indices
+        try:
+            key = tuple(indices) if isinstance(indices, list) else indices
+            return _compile_note_path(key)
+        except TypeError:  # unhashable (nested lists)
+            return cls(indices)
+
+    def get(self, nested: dict | list, /, default: Any = UNDEFINED) -> Any:
+        """Get the value at this path, with the semantics of `nget`."""
+        current = nested
+        last = self._last
+        try:
+            for key in self._parents:
+                if isinstance(current, list):
+                    if isinstance(key, str) and key.isdigit():
+                        key = int(key)
+                    if not (isinstance(key, int) and 0 <= key < len(current)):
+                        raise IndexError
+                    current = current[key]
+                elif isinstance(current, dict):
+                    current = current[key]
+                else:
+                    raise TypeError
+            if isinstance(current, dict):
+                if last in current:
+                    return current[last]
+            elif (
+                isinstance(current, list)
+                and isinstance(last, int)
+                and last < len(current)
+            ):
+                return current[last]
+        except (IndexError, KeyError, TypeError):
+            pass
+        if default is not UNDEFINED:
+            return default
+        raise LookupError("Target not found and no default value provided.")
+
+    def set(self, nested: dict | list, value: Any, /) -> None:
+        """
+        Set the value at this path, as `Note.set` does.
+
+        Missing or None targets are inserted with `ninsert`, creating
+        intermediate containers; existing values are replaced in place.
+        """
+        if self.get(nested, None) is None:
+            ninsert(nested, list(self.keys), value)
+            return
+
+        current = nested
+        for key in self._parents:
+            if isinstance(current, list) and not isinstance(key, int):
+                raise TypeError("Cannot use non-integer index on a list")
+            if isinstance(current, dict) and isinstance(key, int):
+                raise TypeError(
+                    f"Unsupported key type: {type(key).__name__}. "
+                    "Only string keys are acceptable."
+                )
+            current = current[key]
+
+        last = self._last
+        if isinstance(current, list) and not isinstance(last, int):
+            raise TypeError("Cannot use non-integer index on a list")
+        if isinstance(current, dict) and not isinstance(last, str):
+            raise TypeError(
+                f"Unsupported key type: {type(last).__name__}. "
+                "Only string keys are acceptable."
+            )
+        current[last] = value
+
+    def insert(self, nested: dict | list, value: Any, /) -> None:
+        """Insert a value at this path with `ninsert`."""
+        ninsert(nested, list(self.keys), value)
+
+    def pop(self, nested: dict | list, /, default: Any = UNDEFINED) -> Any:
+        """Remove and return the value at this path with `npop`."""
+        return npop(nested, list(self.keys), default)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NotePath):
+            return NotImplemented
+        return self.keys == other.keys
+
+    def __hash__(self) -> int:
+        return hash(self.keys)
+
+    def __repr__(self) -> str:
+        return f"NotePath({self.keys!r})"
+
+
+@lru_cache(maxsize=4096)
+def _compile_note_path(indices: str | tuple, /) -> NotePath:
+    return NotePath(indices)
+
+
 class Note(BaseAutoModel):
     """A container for managing nested dictionary data structures."""
 
     content: dict[str, Any] = Field(default_factory=dict)
+    _version: int = PrivateAttr(default=0)
 
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -405,51 +532,78 @@ class Note(BaseAutoModel):
 
     @field_serializer("content")
     def _serialize_content(self, value: Any) -> dict[str, Any]:
-        """Serialize the content"""
-        output_dict = copy(value, deep=True)
-        return output_dict
+        """
+        Serialize the content.
+
+        The serializer rebuilds every dict and list it walks, so the dump
+        never shares containers with the Note and no copy is made here.
+        """
+        return value
 
     def clean_dump(self) -> dict[str, Any]:
-        out = copy(self.content)
+        return {
+            k: copy_nested(v) for k, v in self.content.items() if v is not UNDEFINED
+        }
 
-        for k, v in self.content.items():
-            if v is UNDEFINED:
-                out.pop(k)
-        return out
+    @property
+    def state_key(self) -> tuple[int, int]:
+        """
+        Identify the current state of the content.
+
+        Changes whenever the content is modified through the Note's methods
+        or replaced. In-place changes to nested values obtained from `get`
+        are not tracked.
+        """
+        return id(self.content), self.__pydantic_private__["_version"]
+
+    def _touch(self) -> None:
+        self.__pydantic_private__["_version"] += 1
 
     def pop(
         self,
-        indices: INDICE_TYPE,
+        indices: INDICE_TYPE | NotePath,
         /,
         default: Any = UNDEFINED,
     ) -> Any:
         """Remove and return an item from the nested structure."""
-        indices = to_list(indices, flatten=True, dropna=True)
-        return npop(self.content, indices, default)
-
-    def insert(self, indices: INDICE_TYPE, value: Any, /) -> None:
+        self._touch()
+        if isinstance(indices, str):
+            try:
+                return self.content.pop(indices)
+            except KeyError as e:
+                if default is not UNDEFINED:
+                    return default
+                raise KeyError(f"Invalid npop. Error: {e}")
+        return NotePath.of(indices).pop(self.content, default)
+
+    def insert(self, indices: INDICE_TYPE | NotePath, value: Any, /) -> None:
         """Insert a value into the nested structure at the specified indice"""
-        indices = to_list(indices, flatten=True, dropna=True)
-        ninsert(self.content, indices, value)
+        self._touch()
+        NotePath.of(indices).insert(self.content, value)
 
-    def set(self, indices: INDICE_TYPE, value: Any, /) -> None:
+    def set(self, indices: INDICE_TYPE | NotePath, value: Any, /) -> None:
         """Set a value in the nested structure at the specified indice"""
-        indices = to_list(indices, flatten=True, dropna=True)
-
-        if self.get(indices, None) is None:
-            self.insert(indices, value)
-        else:
-            nset(self.content, indices, value)
+        self._touch()
+        if isinstance(indices, str):
+            self.content[indices] = value
+            return
+        NotePath.of(indices).set(self.content, value)
 
     def get(
         self,
-        indices: INDICE_TYPE,
+        indices: INDICE_TYPE | NotePath,
         /,
         default: Any = UNDEFINED,
     ) -> Any:
         """Get a value from the nested structure at the specified indice"""
-        indices = to_list(indices, flatten=True, dropna=True)
-        return nget(self.content, indices, default)
+        if isinstance(indices, str):
+            try:
+                return self.content[indices]
+            except KeyError:
+                if default is not UNDEFINED:
+                    return default
+                raise LookupError("Target not found and no default value provided.")
+        return NotePath.of(indices).get(self.content, default)
 
     def keys(self, /, flat: bool = False, **kwargs: Any) -> list:
         """
@@ -507,6 +661,7 @@ class Note(BaseAutoModel):
 
     def clear(self) -> None:
         """Clear the content of the Note."""
+        self._touch()
         self.content.clear()
 
     def update(
@@ -514,6 +669,7 @@ class Note(BaseAutoModel):
         indices: INDICE_TYPE,
         value: Any,
     ) -> None:
+        self._touch()
         existing = None
         if not indices:
             existing = self.content
@@ -573,12 +729,11 @@ class Note(BaseAutoModel):
         """Return a detailed string representation of the Note's content."""
         return repr(self.content)
 
-    def __getitem__(self, indices: INDICE_TYPE) -> Any:
+    def __getitem__(self, indices: INDICE_TYPE | NotePath) -> Any:
         """Get an item from the Note using index notation."""
-        indices = to_list(indices, flatten=True, dropna=True)
         return self.get(indices)
 
-    def __setitem__(self, indices: INDICE_TYPE, value: Any) -> None:
+    def __setitem__(self, indices: INDICE_TYPE | NotePath, value: Any) -> None:
         """Set an item in the Note using index notation."""
         self.set(indices, value)
 
@@ -766,6 +921,7 @@ __all__ = [
     "FieldModel",
     "OperableModel",
     "Note",
+    "NotePath",
     "NewModelParams",
     "BaseAutoModel",
 ]
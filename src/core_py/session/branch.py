@@ -1,17 +1,21 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
 from pydantic import model_validator
 
 from lion.core.generic import Component, LogManager, Pile, Progression
 from lion.core.typing import ID
 from lion.integrations.litellm_.imodel import iModel
+from lion.protocols.configs.branch_config import BranchConfig, ContextWindowConfig
 from lion.settings import Settings
 
 from ..action.action_manager import ActionManager
 from ..communication import MESSAGE_FIELDS, MessageManager
 from .branch_mixins import BranchActionMixin, BranchOperationMixin
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class Branch(Component, BranchActionMixin, BranchOperationMixin):
 
@@ -25,6 +29,10 @@ class Branch(Component, BranchActionMixin, BranchOperationMixin):
     @model_validator(mode="before")
     def _validate_data(cls, data: dict) -> dict:
 
+        config = data.pop("config", None) or Settings.Branch.BRANCH
+        if isinstance(config, dict):
+            config = BranchConfig(**config)
+
         user = data.pop("user", None)
         name = data.pop("name", None)
         message_manager = data.pop("msgs", None)
@@ -36,15 +44,21 @@ class Branch(Component, BranchActionMixin, BranchOperationMixin):
             )
         if not message_manager.logger:
             message_manager.logger = LogManager(
-                **Settings.Branch.BRANCH.message_log_config.clean_dump()
+                **config.message_log_config.clean_dump()
             )
 
+        context_window = data.pop("context_window", None)
+        if context_window is None and message_manager.context_window is None:
+            context_window = config.context_window_config
+        if isinstance(context_window, dict):
+            context_window = ContextWindowConfig(**context_window)
+        if context_window is not None:
+            message_manager.context_window = context_window
+
         acts = data.pop("acts", None)
         if not acts:
             acts = ActionManager()
-            acts.logger = LogManager(
-                **Settings.Branch.BRANCH.action_log_config.clean_dump()
-            )
+            acts.logger = LogManager(**config.action_log_config.clean_dump())
         if "tools" in data:
             acts.register_tools(data.pop("tools"))
 
@@ -67,24 +81,29 @@ class Branch(Component, BranchActionMixin, BranchOperationMixin):
         self.msgs.logger.dump(clear, persist_path)
         self.acts.logger.dump(clear, persist_path)
 
-    def to_df(self, *, progress: Progression = None) -> pd.DataFrame:
+    def to_df(self, *, progress: Progression = None) -> "pd.DataFrame":
         if progress is None:
-            progress = self.msgs.progress
+            progress = self.msgs.progress_view
 
         msgs = [self.msgs.messages[i] for i in progress if i in self.msgs.messages]
         p = Pile(items=msgs)
         return p.to_df(columns=MESSAGE_FIELDS)
 
-    async def aclone(self, sender: ID.Ref = None) -> "Branch":
+    async def aclone(
+        self, sender: ID.Ref = None, *, copy_on_write: bool = False
+    ) -> "Branch":
         async with self.msgs.messages:
-            return self.clone(sender)
+            return self.clone(sender, copy_on_write=copy_on_write)
 
-    def clone(self, sender: ID.Ref = None) -> "Branch":
+    def clone(self, sender: ID.Ref = None, *, copy_on_write: bool = False) -> "Branch":
         """
         Split a branch, creating a new branch with the same messages and tools.
 
         Args:
-            branch: The branch to split or its identifier.
+            sender: Sender of the cloned messages, defaults to this branch.
+            copy_on_write: Share this branch's message objects instead of
+                cloning them; a message is only cloned (and re-addressed)
+                once either branch modifies it. See `MessageManager.fork`.
 
         Returns:
             The newly created branch.
@@ -96,15 +115,35 @@ class Branch(Component, BranchActionMixin, BranchOperationMixin):
                 )
             sender = ID.get_id(sender)
 
-        system = self.msgs.system.clone() if self.msgs.system else None
         tools = list(self.acts.registry.values()) if self.acts.registry else None
+        if copy_on_write:
+            ln_id = ID.id()
+            return Branch(
+                ln_id=ln_id,
+                user=self.user,
+                msgs=self.msgs.fork(sender=sender or self.ln_id, recipient=ln_id),
+                tools=tools,
+            )
+
+        system = self.msgs.system.clone() if self.msgs.system else None
+        messages = [i.clone() for i in self.msgs.messages]
         branch_clone = Branch(
             system=system,
             user=self.user,
-            messages=[i.clone() for i in self.msgs.messages],
+            messages=messages,
             tools=tools,
+            context_window=self.msgs.context_window,
+        )
+        branch_clone.msgs.summarizer = self.msgs.summarizer
+        branch_clone.msgs.pin(
+            *(
+                clone
+                for clone, message in zip(messages, self.msgs.messages)
+                if message.ln_id in self.msgs.pinned
+            )
         )
         for message in branch_clone.msgs.messages:
-            message.sender = sender or self.ln_id
-            message.recipient = branch_clone.ln_id
+            with message.batch_update():
+                message.sender = sender or self.ln_id
+                message.recipient = branch_clone.ln_id
         return branch_clone
@@ -275,8 +275,11 @@ class BranchOperationMixin(ABC):
             image_detail=image_detail,
             tool_schemas=tool_schemas,
         )
-        kwargs["messages"] = self.msgs.to_chat_msgs(progress)
-        kwargs["messages"].append(ins.chat_msg)
+        chat_msg = ins.chat_msg
+        kwargs["messages"] = self.msgs.to_context_msgs(
+            progress, reserve_tokens=ins.token_count
+        )
+        kwargs["messages"].append(chat_msg)
 
         imodel = imodel or self.imodel
         api_response = await imodel.invoke(**kwargs)
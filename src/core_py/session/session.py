@@ -1,6 +1,5 @@
 from collections.abc import Callable
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from lion.core.generic import Component, Pile, Progression
 from lion.core.typing import ID, Field, ItemNotFoundError, JsonValue
@@ -12,6 +11,9 @@ from ..communication.message import MESSAGE_FIELDS, RoledMessage
 from ..communication.system import System
 from .branch import Branch
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class Session(Component):
     """
@@ -84,31 +86,37 @@ class Session(Component):
         if delete:
             del branch
 
-    async def asplit(self, branch: ID.Ref) -> Branch:
+    async def asplit(self, branch: ID.Ref, *, copy_on_write: bool = False) -> Branch:
         """
         Split a branch, creating a new branch with the same messages and tools.
 
         Args:
             branch: The branch to split or its identifier.
+            copy_on_write: Share the branch's messages with the new branch
+                until either modifies them (see `Branch.clone`).
 
         Returns:
             The newly created branch.
         """
         async with self.branches:
-            return self.split(branch)
+            return self.split(branch, copy_on_write=copy_on_write)
 
-    def split(self, branch: ID.Ref) -> Branch:
+    def split(self, branch: ID.Ref, *, copy_on_write: bool = False) -> Branch:
         """
         Split a branch, creating a new branch with the same messages and tools.
 
         Args:
             branch: The branch to split or its identifier.
+            copy_on_write: Share the branch's messages with the new branch
+                until either modifies them (see `Branch.clone`). Shared
+                messages keep the original sender and recipient until
+                they are copied.
 
         Returns:
             The newly created branch.
         """
         branch: Branch = self.branches[branch]
-        branch_clone = branch.clone(sender=self.ln_id)
+        branch_clone = branch.clone(sender=self.ln_id, copy_on_write=copy_on_write)
         self.branches.append(branch_clone)
         return branch_clone
 
@@ -124,7 +132,7 @@ class Session(Component):
             self.default_branch = branch
         raise ValueError("Session can only have one default branch.")
 
-    def to_df(self, branches: ID.RefSeq = None) -> pd.DataFrame:
+    def to_df(self, branches: ID.RefSeq = None) -> "pd.DataFrame":
         out = self.concat_messages(branches=branches)
         return out.to_df(columns=MESSAGE_FIELDS)
 
@@ -1,12 +1,13 @@
 import json
 import os
+from contextlib import nullcontext
+from functools import cache
+from hashlib import sha256
 
-import litellm
-from dotenv import load_dotenv
-
-litellm.drop_params = True
-load_dotenv()
-
+from lion.libs.concurrency import AdaptiveConcurrencyLimiter
+from lion.libs.rate_limit import RateLimiter, get_rate_limiter, usage_tokens
+from lion.libs.retry import RetryPolicy, get_retry_policy
+from lion.libs.tokenizer import count_request_tokens
 
 RESERVED_PARAMS = [
     "invoke_action",
@@ -14,10 +15,52 @@ RESERVED_PARAMS = [
     "clear_messages",
 ]
 
+# Rate limits from `iModelConfig`; kept in `to_dict`, never sent to the API.
+LIMIT_PARAMS = (
+    "interval_requests",
+    "interval_tokens",
+)
+
+
+@cache
+def _litellm():
+    """Import and configure litellm on first use; it is slow to import."""
+    import litellm
+
+    litellm.drop_params = True
+    return litellm
+
 
 class iModel:
+    """
+    A chat model endpoint called through litellm.
+
+    When `interval_requests` (requests per minute) or `interval_tokens`
+    (tokens per minute) are given, `invoke` waits for a shared
+    `RateLimiter` before each call. Every iModel with the same provider,
+    model and API key shares one limiter, so fan-out across branches
+    stays within the quota; it applies the strictest limits any of them
+    sets. Pass `rate_limiter` to use a specific one.
+
+    Pass `concurrency_limiter` to bound the calls in flight with an
+    `AdaptiveConcurrencyLimiter`, which backs off on 429s, timeouts and
+    latency spikes; share one instance between iModels that call the
+    same endpoint.
+
+    Pass `retry_policy` to retry failed calls under a `RetryPolicy`, with
+    jittered backoff, a retry budget and a circuit breaker that fails
+    fast while the endpoint is down. `retry_policy=True` uses the policy
+    shared by every iModel with the same provider, model and API key,
+    which retries transient errors only.
+    """
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        retry_policy: RetryPolicy | bool | None = None,
+        **kwargs,
+    ):
         if "api_key" in kwargs:
             try:
                 api_key1 = os.getenv(kwargs["api_key"], None)
@@ -29,7 +72,52 @@ class iModel:
             except Exception:
                 pass
         self.kwargs = kwargs
-        self.acompletion = litellm.acompletion
+        self._acompletion = None
+        self.rate_limiter = rate_limiter or self._shared_rate_limiter()
+        self.concurrency_limiter = concurrency_limiter
+        if retry_policy is True:
+            retry_policy = get_retry_policy(("imodel", *self._endpoint_key()))
+        self.retry_policy = retry_policy or None
+
+    def _endpoint_key(self) -> tuple:
+        api_key = str(self.kwargs.get("api_key", ""))
+        return (
+            self.kwargs.get("provider"),
+            self.kwargs.get("model"),
+            self.kwargs.get("base_url") or self.kwargs.get("api_base"),
+            sha256(api_key.encode()).hexdigest(),
+        )
+
+    def _shared_rate_limiter(self) -> RateLimiter | None:
+        rpm = self.kwargs.get("interval_requests")
+        tpm = self.kwargs.get("interval_tokens")
+        if not (rpm or tpm):
+            return None
+        return get_rate_limiter(
+            self._endpoint_key(), requests_per_minute=rpm, tokens_per_minute=tpm
+        )
+
+    @staticmethod
+    def estimate_tokens(config: dict) -> int:
+        """
+        Estimate the tokens a completion request will use.
+
+        Counts the prompt with the default tokenizer and adds the
+        completion limit the request sets, if any.
+        """
+        prompt = count_request_tokens(config.get("messages") or [])
+        completion = config.get("max_completion_tokens") or config.get("max_tokens")
+        return prompt + (completion or 0)
+
+    @property
+    def acompletion(self):
+        if self._acompletion is None:
+            self._acompletion = _litellm().acompletion
+        return self._acompletion
+
+    @acompletion.setter
+    def acompletion(self, value):
+        self._acompletion = value
 
     def to_dict(self) -> dict:
         dict_ = {k: v for k, v in self.kwargs.items() if k not in RESERVED_PARAMS}
@@ -44,10 +132,33 @@ class iModel:
 
     async def invoke(self, **kwargs):
         config = {**self.kwargs, **kwargs}
-        for i in RESERVED_PARAMS:
+        for i in (*RESERVED_PARAMS, *LIMIT_PARAMS):
             config.pop(i, None)
 
-        return await self.acompletion(**config)
+        if self.retry_policy is not None:
+            return await self.retry_policy.call(self._invoke_once, config)
+        return await self._invoke_once(config)
+
+    async def _invoke_once(self, config: dict):
+        slot = self.concurrency_limiter or nullcontext()
+        limiter = self.rate_limiter
+        if limiter is None:
+            async with slot:
+                return await self.acompletion(**config)
+
+        estimate = self.estimate_tokens(config) if limiter.tokens else 0
+        await limiter.acquire(estimate)
+        try:
+            async with slot:
+                response = await self.acompletion(**config)
+        except BaseException:
+            # a failed call is assumed not to have consumed tokens
+            limiter.reconcile(estimate, 0)
+            raise
+        actual = usage_tokens(response)
+        if actual is not None:
+            limiter.reconcile(estimate, actual)
+        return response
 
     def __hash__(self):
         # Convert kwargs to a hashable format by serializing unhashable types
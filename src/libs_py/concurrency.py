@@ -0,0 +1,486 @@
+"""
+Copyright 2024 HaiyangLi
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Hashable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any
+
+
+def lock_owner() -> tuple[int, int | None]:
+    """
+    Identify the current lock owner.
+
+    The owner is the current thread, refined by the running asyncio task
+    when called from inside an event loop. Two tasks on the same loop
+    therefore never share ownership, while a sync call made from a
+    coroutine is owned by the task that made it.
+    """
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return threading.get_ident(), id(task) if task is not None else None
+
+
+async def _acquire_in_thread(
+    acquire: Callable[[], bool],
+    release: Callable[[], None],
+) -> None:
+    """
+    Run a blocking acquire in the default executor without leaking it.
+
+    If the awaiting task is cancelled while the worker thread is still
+    blocked, the lock is released as soon as the worker obtains it.
+    """
+    loop = asyncio.get_running_loop()
+    fut = loop.run_in_executor(None, acquire)
+    try:
+        await asyncio.shield(fut)
+    except asyncio.CancelledError:
+
+        def _release_on_done(f: asyncio.Future) -> None:
+            if not f.cancelled() and f.exception() is None:
+                release()
+
+        fut.add_done_callback(_release_on_done)
+        raise
+
+
+class RWLock:
+    """
+    A reentrant reader/writer lock shared by threads and the event loop.
+
+    Any number of readers may hold the lock together; a writer holds it
+    alone. Waiting writers block new readers so writes are not starved.
+    The same lock is used from sync code (`read`, `write`) and from
+    coroutines (`aread`, `awrite`), so both paths exclude each other.
+
+    Ownership is tracked per thread and per asyncio task (see
+    `lock_owner`), which makes the lock reentrant: a writer may take
+    further read or write holds, and a reader may nest reads. Upgrading
+    a read hold to a write hold is refused with a RuntimeError, since two
+    upgrading readers would deadlock.
+
+    Async acquisition tries a non-blocking acquire first and only falls
+    back to waiting in the default executor under contention, so the
+    event loop is never blocked.
+
+    Note:
+        Blocking sync acquisition from inside a coroutine still blocks
+        the event loop. Use the async methods from coroutines.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers: dict[Hashable, int] = {}
+        self._writer: Hashable | None = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+
+    def _try_read(self, owner: Hashable, /) -> bool:
+        if owner in self._readers or owner == self._writer:
+            self._readers[owner] = self._readers.get(owner, 0) + 1
+            return True
+        if self._writer is None and not self._writers_waiting:
+            self._readers[owner] = 1
+            return True
+        return False
+
+    def _try_write(self, owner: Hashable, /) -> bool:
+        if owner == self._writer:
+            self._writer_depth += 1
+            return True
+        if owner in self._readers:
+            raise RuntimeError("Cannot upgrade a read lock to a write lock")
+        if self._writer is None and not self._readers:
+            self._writer = owner
+            self._writer_depth = 1
+            return True
+        return False
+
+    def acquire_read(self, blocking: bool = True, owner: Hashable = None) -> bool:
+        """Acquire a shared hold. Return False if `blocking` is False and
+        the lock is not immediately available."""
+        owner = owner or lock_owner()
+        with self._cond:
+            while not self._try_read(owner):
+                if not blocking:
+                    return False
+                self._cond.wait()
+            return True
+
+    def release_read(self, owner: Hashable = None) -> None:
+        """Release a shared hold."""
+        owner = owner or lock_owner()
+        with self._cond:
+            count = self._readers.get(owner)
+            if not count:
+                raise RuntimeError("Cannot release an unacquired read lock")
+            if count == 1:
+                del self._readers[owner]
+                if not self._readers:
+                    self._cond.notify_all()
+            else:
+                self._readers[owner] = count - 1
+
+    def acquire_write(self, blocking: bool = True, owner: Hashable = None) -> bool:
+        """Acquire an exclusive hold. Return False if `blocking` is False
+        and the lock is not immediately available."""
+        owner = owner or lock_owner()
+        with self._cond:
+            if self._try_write(owner):
+                return True
+            if not blocking:
+                return False
+            self._writers_waiting += 1
+            try:
+                while not self._try_write(owner):
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            return True
+
+    def release_write(self, owner: Hashable = None) -> None:
+        """Release an exclusive hold."""
+        owner = owner or lock_owner()
+        with self._cond:
+            if self._writer != owner:
+                raise RuntimeError("Cannot release an unacquired write lock")
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    async def aacquire_read(self) -> None:
+        """Acquire a shared hold without blocking the event loop."""
+        owner = lock_owner()
+        if self.acquire_read(blocking=False, owner=owner):
+            return
+        await _acquire_in_thread(
+            lambda: self.acquire_read(owner=owner),
+            lambda: self.release_read(owner=owner),
+        )
+
+    async def aacquire_write(self) -> None:
+        """Acquire an exclusive hold without blocking the event loop."""
+        owner = lock_owner()
+        if self.acquire_write(blocking=False, owner=owner):
+            return
+        await _acquire_in_thread(
+            lambda: self.acquire_write(owner=owner),
+            lambda: self.release_write(owner=owner),
+        )
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        owner = lock_owner()
+        self.acquire_read(owner=owner)
+        try:
+            yield
+        finally:
+            self.release_read(owner=owner)
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        owner = lock_owner()
+        self.acquire_write(owner=owner)
+        try:
+            yield
+        finally:
+            self.release_write(owner=owner)
+
+    @asynccontextmanager
+    async def aread(self) -> AsyncIterator[None]:
+        await self.aacquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @asynccontextmanager
+    async def awrite(self) -> AsyncIterator[None]:
+        await self.aacquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class UnifiedLock(RWLock):
+    """
+    A reentrant mutex shared by threads and the event loop.
+
+    Same thread/task ownership and async behaviour as `RWLock`, but
+    every hold is exclusive, including reads.
+    """
+
+    def acquire_read(self, blocking: bool = True, owner: Hashable = None) -> bool:
+        return self.acquire_write(blocking=blocking, owner=owner)
+
+    def release_read(self, owner: Hashable = None) -> None:
+        self.release_write(owner=owner)
+
+
+class NullLock(RWLock):
+    """A lock that never blocks, for single-threaded deployments."""
+
+    def acquire_read(self, blocking: bool = True, owner: Hashable = None) -> bool:
+        return True
+
+    def release_read(self, owner: Hashable = None) -> None:
+        pass
+
+    def acquire_write(self, blocking: bool = True, owner: Hashable = None) -> bool:
+        return True
+
+    def release_write(self, owner: Hashable = None) -> None:
+        pass
+
+
+# Start times of the limited calls in progress in the current task; a
+# stack, since `async with` blocks nest.
+_CALL_STARTS: ContextVar[tuple[float, ...]] = ContextVar("_CALL_STARTS", default=())
+
+
+def is_overload_error(error: BaseException, /) -> bool:
+    """
+    Tell whether an error signals that the callee is overloaded.
+
+    Timeouts, HTTP 429/503 responses (a `status_code` or `status`
+    attribute) and rate-limit exceptions (litellm's `RateLimitError`,
+    or any class named like it) count as overload.
+    """
+    if isinstance(error, TimeoutError):
+        return True
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    if status in (429, 503):
+        return True
+    return any("RateLimit" in cls.__name__ for cls in type(error).__mro__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    A concurrency limit that adapts to the callee (AIMD).
+
+    Used like a semaphore (`async with limiter:`), it admits at most
+    `limit` calls at once and queues the rest in arrival order. After
+    each call the limit is adjusted:
+
+    - Additive increase: a successful call made while the limit was in
+      use raises the limit by `increase / limit`, about `increase` per
+      round of calls.
+    - Multiplicative decrease: an overload error (see `classify`) or a
+      call slower than `latency_tolerance` times the baseline latency
+      multiplies the limit by `backoff`, at most once per baseline
+      latency so that one burst of failures backs off once.
+
+    The baseline is the lowest recent latency; it drifts up slowly so a
+    callee that gets permanently slower is re-learned. Other errors do
+    not change the limit.
+
+    Args:
+        initial_limit: The starting limit.
+        min_limit: The limit never goes below this.
+        max_limit: The limit never goes above this.
+        increase: Additive increase per round of calls.
+        backoff: Multiplicative decrease factor, between 0 and 1.
+        latency_tolerance: Latency multiple of the baseline that counts
+            as a spike; None to ignore latency.
+        classify: Tells whether an error is an overload signal.
+
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        >>> await alcall(prompts, ask, max_concurrent=limiter)
+        >>> limiter.stats()
+        {'limit': 23, 'in_flight': 0, 'queue_depth': 0, ...}
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        backoff: float = 0.5,
+        latency_tolerance: float | None = 2.0,
+        classify: Callable[[BaseException], bool] = is_overload_error,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.classify = classify
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._baseline: float | None = None
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._successes = 0
+        self._overloads = 0
+        self._decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """The current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently admitted."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting to be admitted."""
+        return len(self._waiters)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the limit, load and outcome counters."""
+        with self._lock:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._waiters),
+                "baseline_latency": self._baseline,
+                "successes": self._successes,
+                "overloads": self._overloads,
+                "decreases": self._decreases,
+            }
+
+    async def acquire(self) -> None:
+        """Wait for a slot."""
+        with self._lock:
+            if not self._waiters and self._in_flight < int(self._limit):
+                self._in_flight += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # the slot was granted before the cancellation landed
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            raise
+
+    def release(
+        self,
+        *,
+        latency: float | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """
+        Free a slot and adapt the limit to the call's outcome.
+
+        Args:
+            latency: The call's duration in seconds, if it completed.
+            error: The exception the call raised, if any.
+        """
+        now = monotonic()
+        with self._lock:
+            in_use = self._in_flight >= int(self._limit)
+            if error is not None:
+                if self.classify(error):
+                    self._overloads += 1
+                    self._decrease(now)
+            elif latency is not None:
+                self._successes += 1
+                self._observe(latency, now, in_use)
+        self._release_slot()
+
+    def _observe(self, latency: float, now: float, in_use: bool) -> None:
+        baseline = self._baseline
+        if baseline is None or latency < baseline:
+            self._baseline = latency
+        else:
+            # drift up slowly so a lasting slowdown becomes the baseline
+            self._baseline = baseline + (latency - baseline) * 0.01
+        if (
+            self.latency_tolerance is not None
+            and baseline is not None
+            and latency > baseline * self.latency_tolerance
+        ):
+            self._decrease(now)
+        elif in_use:
+            self._limit = min(
+                self._limit + self.increase / self._limit, float(self.max_limit)
+            )
+
+    def _decrease(self, now: float) -> None:
+        if now - self._last_decrease < (self._baseline or 0.0):
+            return
+        self._last_decrease = now
+        self._decreases += 1
+        self._limit = max(self._limit * self.backoff, float(self.min_limit))
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            while self._waiters and self._in_flight < int(self._limit):
+                waiter = self._waiters.popleft()
+                if waiter.done():
+                    continue
+                self._in_flight += 1
+                waiter.get_loop().call_soon_threadsafe(self._grant, waiter)
+
+    def _grant(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            # cancelled between being granted and woken
+            self._release_slot()
+        else:
+            waiter.set_result(None)
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        await self.acquire()
+        _CALL_STARTS.set((*_CALL_STARTS.get(), monotonic()))
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        *outer, start = _CALL_STARTS.get()
+        _CALL_STARTS.set(tuple(outer))
+        if exc is None:
+            self.release(latency=monotonic() - start)
+        elif isinstance(exc, asyncio.CancelledError):
+            self.release()
+        else:
+            self.release(error=exc)
+
+
+__all__ = [
+    "RWLock",
+    "UnifiedLock",
+    "NullLock",
+    "lock_owner",
+    "AdaptiveConcurrencyLimiter",
+    "is_overload_error",
+]
@@ -0,0 +1,249 @@
+"""
+Copyright 2024 HaiyangLi
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Process-wide executor pools for running sync callables from async code.
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from functools import partial
+from typing import Any, Literal, TypeVar
+
+T = TypeVar("T")
+
+PoolKind = Literal["thread", "process"]
+
+DEFAULT_POOL = "default"
+CPU_POOL = "cpu"
+
+
+class ManagedPool:
+    """
+    A named executor with a worker limit and queue metrics.
+
+    The executor is created on first use and again after `shutdown`, so
+    a pool can be reconfigured or shut down at any time.
+
+    Attributes:
+        name: The pool's name in its `ExecutorManager`.
+        kind: "thread", or "process" for CPU-bound callables. Process
+            pools need picklable callables and arguments.
+        max_workers: The worker limit.
+    """
+
+    def __init__(self, name: str, kind: PoolKind, max_workers: int) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown pool kind: {kind!r}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.name = name
+        self.kind = kind
+        self.max_workers = max_workers
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+
+    @property
+    def executor(self) -> Executor:
+        """The underlying executor, created if needed."""
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        self._executor = ProcessPoolExecutor(self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            self.max_workers,
+                            thread_name_prefix=f"lion-{self.name}",
+                        )
+                executor = self._executor
+        return executor
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future:
+        """Schedule `fn(*args, **kwargs)` and return its future."""
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self.executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def run(
+        self, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> "asyncio.Future[T]":
+        """Schedule `fn(*args, **kwargs)` and return an awaitable for it."""
+        return asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled() or future.exception() is not None:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the pool's current load.
+
+        Returns:
+            dict: `pending` calls not yet finished, `queue_depth` of those
+                waiting for a worker, and `completed`/`failed` totals.
+        """
+        with self._lock:
+            pending = self._pending
+            return {
+                "name": self.name,
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "pending": pending,
+                "queue_depth": max(pending - self.max_workers, 0),
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+
+    def shutdown(self, *, wait: bool = True, cancel_futures: bool = False) -> None:
+        """
+        Shut the executor down; the next call starts a new one.
+
+        Args:
+            wait: Block until running calls finish.
+            cancel_futures: Cancel calls still waiting for a worker.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+class ExecutorManager:
+    """
+    Registry of the named executor pools shared by the process.
+
+    Two pools are predefined: "default", a thread pool for sync callables
+    called from async code (`ucall`, `force_async`, `tcall`), and "cpu",
+    a process pool that is only started when a call opts into it. Other
+    pools are created by `configure`.
+    """
+
+    def __init__(self) -> None:
+        self._pools: dict[str, ManagedPool] = {}
+        self._lock = threading.Lock()
+        cpus = os.cpu_count() or 1
+        self.configure(DEFAULT_POOL, max_workers=min(32, cpus + 4))
+        self.configure(CPU_POOL, kind="process", max_workers=cpus)
+
+    def configure(
+        self,
+        name: str,
+        *,
+        max_workers: int | None = None,
+        kind: PoolKind | None = None,
+    ) -> ManagedPool:
+        """
+        Create a pool, or change the limit or kind of an existing one.
+
+        A running pool that is changed is shut down without waiting; its
+        queued calls still complete, and new calls go to a new executor.
+
+        Args:
+            name: The pool's name.
+            max_workers: The worker limit. Defaults to the current limit,
+                or the CPU count for a new pool.
+            kind: "thread" or "process". Defaults to the current kind, or
+                "thread" for a new pool.
+
+        Returns:
+            ManagedPool: The configured pool.
+        """
+        with self._lock:
+            current = self._pools.get(name)
+            kind = kind or (current.kind if current else "thread")
+            if max_workers is None:
+                max_workers = current.max_workers if current else (os.cpu_count() or 1)
+            if current and (current.kind, current.max_workers) == (kind, max_workers):
+                return current
+            pool = ManagedPool(name, kind, max_workers)
+            self._pools[name] = pool
+        if current is not None:
+            current.shutdown(wait=False)
+        return pool
+
+    def pool(self, name: str = DEFAULT_POOL, /) -> ManagedPool:
+        """
+        Return a configured pool.
+
+        Raises:
+            KeyError: If no pool has that name.
+        """
+        try:
+            return self._pools[name]
+        except KeyError:
+            raise KeyError(f"No executor pool named {name!r}") from None
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return `ManagedPool.stats()` for every pool."""
+        return {name: pool.stats() for name, pool in list(self._pools.items())}
+
+    def shutdown(self, *, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Shut every pool down; pools restart on their next call."""
+        for pool in list(self._pools.values()):
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+EXECUTORS = ExecutorManager()
+atexit.register(partial(EXECUTORS.shutdown, wait=True, cancel_futures=True))
+
+
+def run_sync(
+    fn: Callable[..., T], /, *args: Any, pool: str = DEFAULT_POOL, **kwargs: Any
+) -> "asyncio.Future[T]":
+    """
+    Run a sync callable in a shared pool and return an awaitable for it.
+
+    `pool` is taken by this function; call `EXECUTORS.pool(name).run`
+    directly for callables that take a `pool` keyword.
+
+    Args:
+        fn: The callable.
+        *args: Positional arguments for `fn`.
+        pool: The pool's name; "cpu" for the process pool.
+        **kwargs: Keyword arguments for `fn`.
+    """
+    return EXECUTORS.pool(pool).run(fn, *args, **kwargs)
+
+
+__all__ = [
+    "ManagedPool",
+    "ExecutorManager",
+    "EXECUTORS",
+    "run_sync",
+]
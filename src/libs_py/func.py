@@ -18,13 +18,23 @@ import asyncio
 import functools
 import logging
 import time
-from collections.abc import AsyncGenerator, Callable, Sequence
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Sequence,
+)
+from contextlib import nullcontext
 from functools import lru_cache, wraps
 from typing import Any, TypeVar
 
+from .concurrency import AdaptiveConcurrencyLimiter
 from .constants import UNDEFINED
+from .executor import DEFAULT_POOL, EXECUTORS
 from .parse import to_list
+from .retry import RetryPolicy
 from .utils import time as _t
 
 T = TypeVar("T")
@@ -46,8 +56,9 @@ async def bcall(
     verbose_retry: bool = True,
     error_msg: str | None = None,
     error_map: dict[type, Callable[[Exception], Any]] | None = None,
-    max_concurrent: int | None = None,
+    max_concurrent: int | AdaptiveConcurrencyLimiter | None = None,
     throttle_period: float | None = None,
+    retry_policy: RetryPolicy | None = None,
     **kwargs: Any,
 ) -> AsyncGenerator[list[T | tuple[T, float]], None]:
     """
@@ -67,8 +78,11 @@ async def bcall(
         verbose: If True, print retry attempts and exceptions.
         error_msg: Custom error message prefix.
         error_map: Mapping of errors to handle custom error responses.
-        max_concurrent: Maximum number of concurrent calls.
+        max_concurrent: Maximum number of concurrent calls, or an
+            `AdaptiveConcurrencyLimiter` shared by all batches.
         throttle_period: Throttle period in seconds.
+        retry_policy: A `RetryPolicy` used instead of retries, delay and
+            backoff_factor.
         **kwargs: Additional keyword arguments to pass to the function.
 
     Yields:
@@ -100,6 +114,7 @@ async def bcall(
             error_map=error_map,
             max_concurrent=max_concurrent,
             throttle_period=throttle_period,
+            retry_policy=retry_policy,
             **kwargs,
         )
         yield batch_results
@@ -176,14 +191,7 @@ class CallDecorator:
         def decorator(func: F) -> F:
             if not is_coroutine_func(func):
                 func = force_async(func)
-            throttle_instance = Throttle(period)
-
-            @wraps(func)
-            async def wrapper(*args, **kwargs):
-                await throttle_instance(func)(*args, **kwargs)
-                return await func(*args, **kwargs)
-
-            return wrapper
+            return Throttle(period).__call_async__(func)
 
         return decorator
 
@@ -413,11 +421,13 @@ async def alcall(
     verbose_retry: bool = True,
     error_msg: str | None = None,
     error_map: dict[type, Callable[[Exception], None]] | None = None,
-    max_concurrent: int | None = None,
+    max_concurrent: int | AdaptiveConcurrencyLimiter | None = None,
     throttle_period: float | None = None,
     flatten: bool = False,
     dropna: bool = False,
     unique: bool = False,
+    retry_policy: RetryPolicy | None = None,
+    pool: str = DEFAULT_POOL,
     **kwargs: Any,
 ) -> list[T] | list[tuple[T, float]]:
     """Apply a function to each element of a list asynchronously with options.
@@ -435,10 +445,18 @@ async def alcall(
         verbose_retry: If True, print retry messages.
         error_msg: Custom error message prefix for exceptions.
         error_map: Dict mapping exception types to error handlers.
-        max_concurrent: Maximum number of concurrent executions.
+        max_concurrent: Maximum number of concurrent executions, or an
+            `AdaptiveConcurrencyLimiter` that adjusts the limit to the
+            callee's latency and overload errors.
         throttle_period: Minimum time between function executions (seconds).
         flatten: If True, flatten the resulting list.
         dropna: If True, remove None values from the result.
+        retry_policy: A `RetryPolicy`, shared with other callers of the
+            same endpoint, used instead of num_retries, retry_delay and
+            backoff_factor. Timeouts are then retried like other errors.
+        pool: The `lion.libs.executor.EXECUTORS` pool that runs a sync
+            `func`; "cpu" for the process pool (`func` and its arguments
+            must pickle).
         **kwargs: Additional keyword arguments passed to func.
 
     Returns:
@@ -462,9 +480,13 @@ async def alcall(
         - Supports both synchronous and asynchronous functions for `func`.
         - Results are returned in the original input order.
     """
+    EXECUTORS.pool(pool)  # fail early on an unknown pool name
     if initial_delay:
         await asyncio.sleep(initial_delay)
 
+    limiter = None
+    if isinstance(max_concurrent, AdaptiveConcurrencyLimiter):
+        limiter, max_concurrent = max_concurrent, None
     semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
     throttle_delay = throttle_period if throttle_period else 0
 
@@ -476,46 +498,24 @@ async def alcall(
             return await _execute_task(i, index)
 
     async def _execute_task(i: Any, index: int) -> Any:
-        attempts = 0
-        current_delay = retry_delay
-        while True:
-            try:
-                if retry_timing:
-                    start_time = asyncio.get_event_loop().time()
-                    result = await asyncio.wait_for(
-                        ucall(func, i, **kwargs), retry_timeout
-                    )
-                    end_time = asyncio.get_event_loop().time()
-                    return index, result, end_time - start_time
-                else:
-                    result = await asyncio.wait_for(
-                        ucall(func, i, **kwargs), retry_timeout
-                    )
-                    return index, result
-            except TimeoutError as e:
-                raise TimeoutError(
-                    f"{error_msg or ''} Timeout {retry_timeout} seconds " "exceeded"
-                ) from e
-            except Exception as e:
-                if error_map and type(e) in error_map:
-                    handler = error_map[type(e)]
-                    if asyncio.iscoroutinefunction(handler):
-                        return index, await handler(e)
-                    else:
-                        return index, handler(e)
-                attempts += 1
-                if attempts <= num_retries:
-                    if verbose_retry:
-                        print(
-                            f"Attempt {attempts}/{num_retries} failed: {e}"
-                            ", retrying..."
-                        )
-                    await asyncio.sleep(current_delay)
-                    current_delay *= backoff_factor
-                else:
-                    if retry_default is not UNDEFINED:
-                        return index, retry_default
-                    raise e
+        result = await _call_item(
+            func,
+            i,
+            kwargs,
+            num_retries=num_retries,
+            retry_delay=retry_delay,
+            backoff_factor=backoff_factor,
+            retry_default=retry_default,
+            retry_timeout=retry_timeout,
+            retry_timing=retry_timing,
+            verbose_retry=verbose_retry,
+            error_msg=error_msg,
+            error_map=error_map,
+            limiter=limiter,
+            retry_policy=retry_policy,
+            pool=pool,
+        )
+        return (index, *result) if retry_timing else (index, result)
 
     tasks = [_task(i, index) for index, i in enumerate(input_)]
     results = []
@@ -542,6 +542,277 @@ async def alcall(
         )
 
 
+async def _call_item(
+    func: Callable[..., T],
+    item: Any,
+    kwargs: dict[str, Any],
+    *,
+    num_retries: int,
+    retry_delay: float,
+    backoff_factor: float,
+    retry_default: Any,
+    retry_timeout: float | None,
+    retry_timing: bool,
+    verbose_retry: bool,
+    error_msg: str | None,
+    error_map: dict[type, Callable[[Exception], None]] | None,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
+    retry_policy: RetryPolicy | None = None,
+    pool: str = DEFAULT_POOL,
+) -> T | tuple[T, float]:
+    """Call `func(item, **kwargs)` with the retry options of `alcall`.
+
+    With a `limiter`, each attempt holds one of its slots, so that the
+    limiter sees every failure and retries wait outside it. Likewise a
+    `retry_policy` guards and records each attempt.
+    """
+    guard = retry_policy.attempt if retry_policy is not None else nullcontext
+    if retry_policy is not None:
+        num_retries = retry_policy.max_retries
+
+    async def _attempt() -> T:
+        with guard():
+            if limiter is None:
+                return await asyncio.wait_for(
+                    ucall(func, item, pool=pool, **kwargs), retry_timeout
+                )
+            async with limiter:
+                return await asyncio.wait_for(
+                    ucall(func, item, pool=pool, **kwargs), retry_timeout
+                )
+
+    attempts = 0
+    current_delay = retry_delay
+    delay = None
+    while True:
+        try:
+            if retry_timing:
+                start_time = asyncio.get_event_loop().time()
+                result = await _attempt()
+                end_time = asyncio.get_event_loop().time()
+                return result, end_time - start_time
+            else:
+                return await _attempt()
+        except Exception as e:
+            if isinstance(e, TimeoutError) and retry_policy is None:
+                raise TimeoutError(
+                    f"{error_msg or ''} Timeout {retry_timeout} seconds " "exceeded"
+                ) from e
+            if error_map and type(e) in error_map:
+                handler = error_map[type(e)]
+                if asyncio.iscoroutinefunction(handler):
+                    result = await handler(e)
+                else:
+                    result = handler(e)
+                return (result, 0.0) if retry_timing else result
+            attempts += 1
+            if retry_policy is not None:
+                delay = retry_policy.backoff(e, attempts, delay)
+            elif attempts <= num_retries:
+                delay, current_delay = current_delay, current_delay * backoff_factor
+            else:
+                delay = None
+            if delay is not None:
+                if verbose_retry:
+                    print(f"Attempt {attempts}/{num_retries} failed: {e}, retrying...")
+                await asyncio.sleep(delay)
+            else:
+                if retry_default is not UNDEFINED:
+                    return (retry_default, 0.0) if retry_timing else retry_default
+                raise e
+
+
+async def alcall_iter(
+    input_: Iterable[Any] | AsyncIterable[Any],
+    func: Callable[..., T],
+    /,
+    max_concurrent: int = 64,
+    ordered: bool = True,
+    num_retries: int = 0,
+    initial_delay: float = 0,
+    retry_delay: float = 0,
+    backoff_factor: float = 1,
+    retry_default: Any = UNDEFINED,
+    retry_timeout: float | None = None,
+    retry_timing: bool = False,
+    verbose_retry: bool = True,
+    error_msg: str | None = None,
+    error_map: dict[type, Callable[[Exception], None]] | None = None,
+    throttle_period: float | None = None,
+    dropna: bool = False,
+    limiter: AdaptiveConcurrencyLimiter | None = None,
+    retry_policy: RetryPolicy | None = None,
+    **kwargs: Any,
+) -> AsyncIterator[T | tuple[T, float]]:
+    """Stream a function over an iterable with a bounded number of calls.
+
+    Unlike `alcall`, inputs are pulled lazily and results are yielded as
+    soon as they are available, so memory stays flat however long the
+    input is. At most `max_concurrent` calls are in flight (and, when
+    ordered, waiting to be yielded). Inputs are only pulled while the
+    window has room, which applies backpressure to both the input and
+    the calls; an async input is awaited alongside the calls, so results
+    are yielded while the next input is still on its way.
+
+    Args:
+        input_: A sync or async iterable of inputs.
+        func: Async or sync function to apply to each input.
+        max_concurrent: Maximum number of inputs being processed.
+        ordered: Yield results in input order. If False, yield each
+            result as soon as its call finishes.
+        num_retries: Number of retry attempts for each function call.
+        initial_delay: Initial delay before starting execution (seconds).
+        retry_delay: Delay between retry attempts (seconds).
+        backoff_factor: Factor by which delay increases after each attempt.
+        retry_default: Default value to return if all attempts fail.
+        retry_timeout: Timeout for each function execution (seconds).
+        retry_timing: If True, yield (result, duration) tuples.
+        verbose_retry: If True, print retry messages.
+        error_msg: Custom error message prefix for exceptions.
+        error_map: Dict mapping exception types to error handlers.
+        throttle_period: Minimum time between yielded results (seconds).
+        dropna: If True, skip None results.
+        limiter: An `AdaptiveConcurrencyLimiter` that further limits the
+            calls running at once within the window.
+        retry_policy: A `RetryPolicy` used instead of num_retries,
+            retry_delay and backoff_factor, as in `alcall`.
+        **kwargs: Additional keyword arguments passed to func.
+
+    Yields:
+        T | tuple[T, float]: Results, optionally with execution times.
+
+    Raises:
+        ValueError: If max_concurrent is less than 1.
+        Exception: The first unhandled exception from func; calls still
+            in flight are cancelled.
+
+    Examples:
+        >>> async def square(x):
+        ...     return x * x
+        >>> [r async for r in alcall_iter(range(4), square, max_concurrent=2)]
+        [0, 1, 4, 9]
+    """
+    if max_concurrent < 1:
+        raise ValueError("max_concurrent must be at least 1")
+    if initial_delay:
+        await asyncio.sleep(initial_delay)
+
+    is_async = isinstance(input_, AsyncIterable)
+    inputs = aiter(input_) if is_async else iter(input_)
+
+    def _keep(result: Any) -> bool:
+        value = result[0] if retry_timing else result
+        return not (dropna and value is None)
+
+    pending: dict[asyncio.Task, int] = {}
+    buffered: dict[int, Any] = {}
+    next_index = 0
+    next_yield = 0
+    exhausted = False
+    puller: asyncio.Task | None = None
+
+    def _start(item: Any) -> None:
+        nonlocal next_index
+        task = asyncio.ensure_future(
+            _call_item(
+                func,
+                item,
+                kwargs,
+                num_retries=num_retries,
+                retry_delay=retry_delay,
+                backoff_factor=backoff_factor,
+                retry_default=retry_default,
+                retry_timeout=retry_timeout,
+                retry_timing=retry_timing,
+                verbose_retry=verbose_retry,
+                error_msg=error_msg,
+                error_map=error_map,
+                limiter=limiter,
+                retry_policy=retry_policy,
+            )
+        )
+        pending[task] = next_index
+        next_index += 1
+
+    try:
+        while True:
+            has_room = len(pending) + len(buffered) < max_concurrent
+            if is_async:
+                if puller is None and not exhausted and has_room:
+                    puller = asyncio.ensure_future(anext(inputs))
+            else:
+                while not exhausted and has_room:
+                    try:
+                        _start(next(inputs))
+                    except StopIteration:
+                        exhausted = True
+                    has_room = len(pending) + len(buffered) < max_concurrent
+            waiting = set(pending)
+            if puller is not None:
+                waiting.add(puller)
+            if not waiting:
+                break
+
+            done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if puller in done:
+                done.discard(puller)
+                try:
+                    _start(puller.result())
+                except StopAsyncIteration:
+                    exhausted = True
+                finally:
+                    puller = None
+            ready = []
+            for task in done:
+                index = pending.pop(task)
+                if (error := task.exception()) is not None:
+                    # mark the other failures as retrieved before raising
+                    for other in done:
+                        other.cancelled() or other.exception()
+                    raise error
+                ready.append((index, task.result()))
+            ready.sort(key=lambda r: r[0])
+            if ordered:
+                buffered.update(ready)
+                ready = []
+                while next_yield in buffered:
+                    ready.append((next_yield, buffered.pop(next_yield)))
+                    next_yield += 1
+            for _, result in ready:
+                if _keep(result):
+                    yield result
+                    if throttle_period:
+                        await asyncio.sleep(throttle_period)
+    finally:
+        leftover = [*pending, *([puller] if puller is not None else [])]
+        for task in leftover:
+            task.cancel()
+        if leftover:
+            await asyncio.gather(*leftover, return_exceptions=True)
+
+
+def amap(
+    func: Callable[..., T],
+    input_: Iterable[Any] | AsyncIterable[Any],
+    /,
+    max_concurrent: int = 64,
+    ordered: bool = True,
+    **kwargs: Any,
+) -> AsyncIterator[T | tuple[T, float]]:
+    """Stream `func` over `input_`, like the builtin `map`.
+
+    Shorthand for `alcall_iter(input_, func, ...)`; see `alcall_iter` for
+    the options accepted in `kwargs`.
+
+    Examples:
+        >>> async for result in amap(fetch, urls, max_concurrent=8):
+        ...     print(result)
+    """
+    return alcall_iter(
+        input_, func, max_concurrent=max_concurrent, ordered=ordered, **kwargs
+    )
+
+
 async def mcall(
     input_: Any,
     func: Callable[..., T] | Sequence[Callable[..., T]],
@@ -561,6 +832,7 @@ async def mcall(
     max_concurrent: int | None = None,
     throttle_period: float | None = None,
     dropna: bool = False,
+    retry_policy: RetryPolicy | None = None,
     **kwargs: Any,
 ) -> list[T] | list[tuple[T, float]]:
     """
@@ -583,6 +855,8 @@ async def mcall(
         max_concurrent: Maximum number of concurrent executions.
         throttle_period: Minimum time period between function executions.
         dropna: Whether to drop None values from the output list.
+        retry_policy: A `RetryPolicy` used instead of retries, delay and
+            backoff_factor.
         **kwargs: Additional keyword arguments for the functions.
 
     Returns:
@@ -614,6 +888,7 @@ async def mcall(
                 max_concurrent=max_concurrent,
                 throttle_period=throttle_period,
                 dropna=dropna,
+                retry_policy=retry_policy,
                 **kwargs,
             )
             for f in func
@@ -634,6 +909,7 @@ async def mcall(
                 verbose_retry=verbose_retry,
                 error_msg=error_msg,
                 error_map=error_map,
+                retry_policy=retry_policy,
                 **kwargs,
             )
             for inp in input_
@@ -655,6 +931,7 @@ async def mcall(
                 verbose_retry=verbose_retry,
                 error_msg=error_msg,
                 error_map=error_map,
+                retry_policy=retry_policy,
                 **kwargs,
             )
             for inp, f in zip(input_, func)
@@ -816,6 +1093,7 @@ async def rcall(
     verbose_retry: bool = True,
     error_msg: str | None = None,
     error_map: dict[type, Callable[[Exception], None]] | None = None,
+    retry_policy: RetryPolicy | None = None,
     **kwargs: Any,
 ) -> T | tuple[T, float]:
     """Retry a function asynchronously with customizable options.
@@ -835,6 +1113,9 @@ async def rcall(
         verbose_retry: If True, print retry messages.
         error_msg: Custom error message prefix.
         error_map: Dict mapping exception types to error handlers.
+        retry_policy: A `RetryPolicy`, shared with other callers of the
+            same endpoint, used instead of num_retries, retry_delay and
+            backoff_factor.
         **kwargs: Additional keyword arguments for the function.
 
     Returns:
@@ -860,61 +1141,70 @@ async def rcall(
     """
     last_exception = None
     result = None
+    guard = retry_policy.attempt if retry_policy is not None else nullcontext
+    if retry_policy is not None:
+        num_retries = retry_policy.max_retries
+    delay = None
 
     await asyncio.sleep(initial_delay)
     for attempt in range(num_retries + 1):
         try:
-            if num_retries == 0:
+            with guard():
+                if num_retries == 0:
+                    if retry_timing:
+                        result, duration = await _rcall(
+                            func,
+                            *args,
+                            retry_timeout=retry_timeout,
+                            retry_timing=True,
+                            **kwargs,
+                        )
+                        return result, duration
+                    result = await _rcall(
+                        func,
+                        *args,
+                        retry_timeout=retry_timeout,
+                        **kwargs,
+                    )
+                    return result
+                err_msg = f"Attempt {attempt + 1}/{num_retries + 1}: {error_msg or ''}"
                 if retry_timing:
                     result, duration = await _rcall(
                         func,
                         *args,
+                        error_msg=err_msg,
                         retry_timeout=retry_timeout,
                         retry_timing=True,
                         **kwargs,
                     )
                     return result, duration
+
                 result = await _rcall(
-                    func,
-                    *args,
-                    retry_timeout=retry_timeout,
-                    **kwargs,
-                )
-                return result
-            err_msg = f"Attempt {attempt + 1}/{num_retries + 1}: {error_msg or ''}"
-            if retry_timing:
-                result, duration = await _rcall(
                     func,
                     *args,
                     error_msg=err_msg,
                     retry_timeout=retry_timeout,
-                    retry_timing=True,
                     **kwargs,
                 )
-                return result, duration
-
-            result = await _rcall(
-                func,
-                *args,
-                error_msg=err_msg,
-                retry_timeout=retry_timeout,
-                **kwargs,
-            )
-            return result
+                return result
         except Exception as e:
             last_exception = e
             if error_map and type(e) in error_map:
                 error_map[type(e)](e)
-            if attempt < num_retries:
-                if verbose_retry:
-                    print(
-                        f"Attempt {attempt + 1}/{num_retries + 1} failed: {e},"
-                        " retrying..."
-                    )
-                await asyncio.sleep(retry_delay)
-                retry_delay *= backoff_factor
-            else:
+            if attempt >= num_retries:
                 break
+            if retry_policy is not None:
+                delay = retry_policy.backoff(e, attempt + 1, delay)
+                if delay is None:
+                    break
+            else:
+                delay, retry_delay = retry_delay, retry_delay * backoff_factor
+            if verbose_retry:
+                print(
+                    f"Attempt {attempt + 1}/{num_retries + 1} failed: {e},"
+                    " retrying..."
+                )
+            await asyncio.sleep(delay)
 
     if retry_default is not UNDEFINED:
         return retry_default
@@ -1045,7 +1335,7 @@ async def tcall(
                 result = func(*args, **kwargs)
             else:
                 result = await asyncio.wait_for(
-                    asyncio.shield(asyncio.to_thread(func, *args, **kwargs)),
+                    asyncio.shield(EXECUTORS.pool().run(func, *args, **kwargs)),
                     timeout=retry_timeout,
                 )
 
@@ -1136,10 +1426,13 @@ class Throttle:
 
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            elapsed = _t() - self.last_called
-            if elapsed < self.period:
-                await asyncio.sleep(self.period - elapsed)
-            self.last_called = _t()
+            # claim the next free slot before sleeping, so that concurrent
+            # callers are spaced `period` apart instead of waking together
+            now = _t()
+            slot = max(now, self.last_called + self.period)
+            self.last_called = slot
+            if slot > now:
+                await asyncio.sleep(slot - now)
             return await func(*args, **kwargs)
 
         return wrapper
@@ -1150,6 +1443,7 @@ async def ucall(
     /,
     *args: Any,
     error_map: dict[type, Callable[[Exception], None]] | None = None,
+    pool: str = DEFAULT_POOL,
     **kwargs: Any,
 ) -> T:
     """Execute a function asynchronously with error handling.
@@ -1161,6 +1455,9 @@ async def ucall(
         func: The function to be executed (coroutine or regular).
         *args: Positional arguments for the function.
         error_map: Dict mapping exception types to error handlers.
+        pool: The `lion.libs.executor.EXECUTORS` pool that runs a
+            non-coroutine `func`; "cpu" for the process pool (`func` and
+            its arguments must pickle).
         **kwargs: Keyword arguments for the function.
 
     Returns:
@@ -1178,27 +1475,14 @@ async def ucall(
         6
 
     Note:
-        - Automatically wraps non-coroutine functions for async execution.
-        - Manages event loop creation and closure when necessary.
+        - Runs non-coroutine functions in the shared `pool` of
+          `lion.libs.executor.EXECUTORS`, "default" unless given.
         - Applies custom error handling based on the provided error_map.
     """
     try:
-        if not is_coroutine_func(func):
-            func = force_async(func)
-
-        # Checking for a running event loop
-        try:
-            loop = asyncio.get_running_loop()
-            if loop.is_running():
-                return await func(*args, **kwargs)
-            else:
-                return await asyncio.run(func(*args, **kwargs))
-
-        except RuntimeError:  # No running event loop
-            loop = asyncio.new_event_loop()
-            result = await func(*args, **kwargs)
-            loop.close()
-            return result
+        if is_coroutine_func(func):
+            return await func(*args, **kwargs)
+        return await EXECUTORS.pool(pool).run(func, *args, **kwargs)
 
     except Exception as e:
         if error_map:
@@ -1207,23 +1491,26 @@ async def ucall(
         raise e
 
 
-def force_async(fn: Callable[..., T]) -> Callable[..., Callable[..., T]]:
+def force_async(
+    fn: Callable[..., T], pool: str = DEFAULT_POOL
+) -> Callable[..., Callable[..., T]]:
     """
     Convert a synchronous function to an asynchronous function
-    using a thread pool.
+    using a shared executor pool.
 
     Args:
         fn: The synchronous function to convert.
+        pool: The `lion.libs.executor.EXECUTORS` pool to run it in; "cpu"
+            for the process pool (`fn` and its arguments must pickle).
 
     Returns:
         The asynchronous version of the function.
     """
-    pool = ThreadPoolExecutor()
+    EXECUTORS.pool(pool)  # fail early on an unknown pool name
 
     @wraps(fn)
     def wrapper(*args, **kwargs):
-        future = pool.submit(fn, *args, **kwargs)
-        return asyncio.wrap_future(future)  # Make it awaitable
+        return EXECUTORS.pool(pool).run(fn, *args, **kwargs)
 
     return wrapper
 
@@ -1291,11 +1578,4 @@ def throttle(func: Callable[..., T], period: float) -> Callable[..., Callable[..
     """
     if not is_coroutine_func(func):
         func = force_async(func)
-    throttle_instance = Throttle(period)
-
-    @wraps(func)
-    async def wrapper(*args, **kwargs):
-        await throttle_instance(func)(*args, **kwargs)
-        return await func(*args, **kwargs)
-
-    return wrapper
+    return Throttle(period).__call_async__(func)
@@ -0,0 +1,257 @@
+"""
+Copyright 2024 HaiyangLi
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Token-bucket rate limits for requests and tokens per minute.
+"""
+
+import asyncio
+import threading
+from collections.abc import Hashable
+from time import monotonic
+from typing import Any
+
+
+class TokenBucket:
+    """
+    A token bucket that callers reserve from, first come first served.
+
+    `capacity` units are available at once and the bucket refills at
+    `rate` units per second. A reservation is taken immediately and the
+    caller sleeps until the bucket has caught up, so concurrent callers
+    are spaced out in arrival order. A reservation larger than the
+    capacity is allowed; it puts the bucket into debt, which later
+    callers wait out.
+
+    State is guarded by a thread lock rather than an asyncio primitive,
+    so one bucket can be shared by every event loop in the process.
+    """
+
+    def __init__(self, capacity: float, rate: float) -> None:
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("capacity and rate must be positive")
+        self.capacity = capacity
+        self.rate = rate
+        self._level = capacity
+        self._stamp = monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._level = min(self.capacity, self._level + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def reserve(self, amount: float) -> float:
+        """Take `amount` now; return the seconds to wait before using it."""
+        with self._lock:
+            self._refill(monotonic())
+            self._level -= amount
+            return max(-self._level / self.rate, 0.0)
+
+    def give_back(self, amount: float) -> None:
+        """Return unused units, or take more with a negative `amount`."""
+        with self._lock:
+            self._refill(monotonic())
+            self._level = min(self.capacity, self._level + amount)
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until `amount` units are available, then use them."""
+        wait = self.reserve(amount)
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.give_back(amount)
+                raise
+
+    @property
+    def available(self) -> float:
+        """Units available now; negative while the bucket is in debt."""
+        with self._lock:
+            self._refill(monotonic())
+            return self._level
+
+    def configure(self, capacity: float, rate: float) -> None:
+        """Change the limits, keeping the current fill level."""
+        if capacity <= 0 or rate <= 0:
+            raise ValueError("capacity and rate must be positive")
+        with self._lock:
+            self._refill(monotonic())
+            self.capacity, self.rate = capacity, rate
+            self._level = min(self._level, capacity)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limits for one endpoint.
+
+    Call `acquire(estimate)` before a request, with the estimated tokens
+    it will use, and `reconcile(estimate, actual)` once the response's
+    `usage` is known, so that the token bucket tracks real usage.
+
+    Args:
+        requests_per_minute: Request limit, or None for no limit.
+        tokens_per_minute: Token limit (prompt and completion), or None
+            for no limit.
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_minute=500,
+        ...                       tokens_per_minute=200_000)
+        >>> await limiter.acquire(estimate)
+        >>> response = await call()
+        >>> limiter.reconcile(estimate, response["usage"]["total_tokens"])
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        self.requests: TokenBucket | None = None
+        self.tokens: TokenBucket | None = None
+        self.configure(requests_per_minute, tokens_per_minute)
+
+    def configure(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        """Set or change the limits; None removes a limit."""
+        self.requests = self._bucket(self.requests, requests_per_minute)
+        self.tokens = self._bucket(self.tokens, tokens_per_minute)
+
+    @staticmethod
+    def _bucket(bucket: TokenBucket | None, per_minute: int | None):
+        if not per_minute:
+            return None
+        if bucket is None:
+            return TokenBucket(per_minute, per_minute / 60)
+        bucket.configure(per_minute, per_minute / 60)
+        return bucket
+
+    @property
+    def limits(self) -> dict[str, int | None]:
+        """The configured per-minute limits."""
+        return {
+            "requests_per_minute": self.requests and int(self.requests.capacity),
+            "tokens_per_minute": self.tokens and int(self.tokens.capacity),
+        }
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until one request and `tokens` tokens fit the limits.
+
+        Both buckets are reserved before waiting, so a caller waits for
+        whichever limit is further behind, not for the sum.
+        """
+        waits = []
+        if self.requests is not None:
+            waits.append(self.requests.reserve(1))
+        if self.tokens is not None and tokens:
+            waits.append(self.tokens.reserve(tokens))
+        wait = max(waits, default=0.0)
+        if wait:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                if self.requests is not None:
+                    self.requests.give_back(1)
+                self.reconcile(tokens, 0)
+                raise
+
+    def reconcile(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once a request's usage is known."""
+        if self.tokens is not None and estimated != actual:
+            self.tokens.give_back(estimated - actual)
+
+
+_LIMITERS: dict[Hashable, RateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(
+    key: Hashable,
+    *,
+    requests_per_minute: int | None = None,
+    tokens_per_minute: int | None = None,
+) -> RateLimiter:
+    """
+    Return the process-wide limiter for `key`, creating it if needed.
+
+    Everything calling the same endpoint (provider, model and API key)
+    should use the same key, so that concurrent branches draw from one
+    quota. Limits passed for an existing key can only tighten it: a
+    None keeps the existing limit and the stricter of two limits wins.
+    Call `RateLimiter.configure` to loosen or remove a limit.
+
+    Args:
+        key: Identifies the endpoint.
+        requests_per_minute: Request limit, or None for no limit.
+        tokens_per_minute: Token limit, or None for no limit.
+    """
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = _LIMITERS[key] = RateLimiter(
+                requests_per_minute, tokens_per_minute
+            )
+            return limiter
+    current = limiter.limits
+    limits = {
+        "requests_per_minute": _stricter(
+            current["requests_per_minute"], requests_per_minute
+        ),
+        "tokens_per_minute": _stricter(current["tokens_per_minute"], tokens_per_minute),
+    }
+    if limits != current:
+        limiter.configure(**limits)
+    return limiter
+
+
+def _stricter(a: int | None, b: int | None) -> int | None:
+    """Return the lower of two per-minute limits, where None is no limit."""
+    if not a or not b:
+        return a or b or None
+    return min(a, b)
+
+
+def usage_tokens(response: Any) -> int | None:
+    """
+    Return the total tokens reported in a completion response's `usage`.
+
+    Accepts dict responses and objects with a `usage` attribute, as
+    returned by litellm. Returns None when no usage is reported.
+    """
+    usage = (
+        response.get("usage")
+        if isinstance(response, dict)
+        else getattr(response, "usage", None)
+    )
+    if usage is None:
+        return None
+    get = usage.get if isinstance(usage, dict) else lambda k: getattr(usage, k, None)
+    total = get("total_tokens")
+    if total is None:
+        prompt, completion = get("prompt_tokens"), get("completion_tokens")
+        if prompt is None and completion is None:
+            return None
+        total = (prompt or 0) + (completion or 0)
+    return int(total)
+
+
+__all__ = [
+    "TokenBucket",
+    "RateLimiter",
+    "get_rate_limiter",
+    "usage_tokens",
+]
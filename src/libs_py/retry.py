@@ -0,0 +1,431 @@
+"""
+Copyright 2024 HaiyangLi
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Retry policies shared by the callers of an endpoint: jittered backoff,
+a retry budget and a circuit breaker.
+"""
+
+import asyncio
+import random
+import threading
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import contextmanager
+from time import monotonic
+from typing import Any, Literal, TypeVar
+
+from .concurrency import is_overload_error
+
+T = TypeVar("T")
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of calling an endpoint whose circuit is open.
+
+    Attributes:
+        retry_after: Seconds until the breaker lets a probe call through.
+    """
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def is_transient_error(error: BaseException, /) -> bool:
+    """
+    Tell whether an error says the endpoint is unhealthy, not the request.
+
+    Timeouts, overload errors (see `is_overload_error`), connection
+    errors, and HTTP 408 or 5xx responses count as transient.
+    """
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    if is_overload_error(error):
+        return True
+    status = getattr(error, "status_code", None) or getattr(error, "status", None)
+    return isinstance(status, int) and (status == 408 or 500 <= status < 600)
+
+
+class RetryBudget:
+    """
+    Retries allowed as a fraction of successful calls.
+
+    Each success deposits `ratio` of a retry, and `min_per_second`
+    retries are deposited over time so that a quiet endpoint can still
+    retry. The balance is capped at `max_balance`, which is also where it
+    starts. When an endpoint fails outright, retries are limited to the
+    trickle of `min_per_second` instead of multiplying the load.
+
+    Args:
+        ratio: Retries earned per successful call.
+        min_per_second: Retries earned per second regardless.
+        max_balance: The most retries that can be saved up.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        *,
+        min_per_second: float = 1.0,
+        max_balance: float = 20.0,
+    ) -> None:
+        if ratio < 0 or min_per_second < 0 or max_balance < 1:
+            raise ValueError("ratio and min_per_second must be >= 0, max_balance >= 1")
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self._balance = max_balance
+        self._stamp = monotonic()
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._rejected = 0
+
+    def _refill(self, now: float) -> None:
+        self._balance = min(
+            self.max_balance,
+            self._balance + (now - self._stamp) * self.min_per_second,
+        )
+        self._stamp = now
+
+    def record_success(self) -> None:
+        """Deposit the share of a retry earned by a successful call."""
+        with self._lock:
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry; return False if the budget is exhausted."""
+        with self._lock:
+            self._refill(monotonic())
+            if self._balance < 1:
+                self._rejected += 1
+                return False
+            self._balance -= 1
+            self._retries += 1
+            return True
+
+    def stats(self) -> dict[str, Any]:
+        """Return the balance and the retries granted and refused."""
+        with self._lock:
+            self._refill(monotonic())
+            return {
+                "balance": self._balance,
+                "retries": self._retries,
+                "rejected": self._rejected,
+            }
+
+
+class CircuitBreaker:
+    """
+    Fail fast while an endpoint is unhealthy.
+
+    The circuit opens after `failure_threshold` consecutive transient
+    failures (see `classify`); calls then raise `CircuitOpenError`
+    without reaching the endpoint. After `recovery_time` seconds the
+    circuit is half open and lets `half_open_calls` probe calls through:
+    a successful probe closes it, a failed one opens it again. Errors
+    that are not transient mean the endpoint answered, and count as
+    successes.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        recovery_time: Seconds the circuit stays open.
+        half_open_calls: Probe calls allowed while half open.
+        classify: Tells whether an error counts as a failure.
+        name: The endpoint's name, for error messages.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_time: float = 10.0,
+        *,
+        half_open_calls: int = 1,
+        classify: Callable[[BaseException], bool] = is_transient_error,
+        name: str | None = None,
+    ) -> None:
+        if failure_threshold < 1 or half_open_calls < 1:
+            raise ValueError("failure_threshold and half_open_calls must be >= 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.half_open_calls = half_open_calls
+        self.classify = classify
+        self.name = name
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The circuit's state: closed, open or half_open."""
+        with self._lock:
+            return self._current_state(monotonic())
+
+    def _current_state(self, now: float) -> CircuitState:
+        if self._state == "open" and now - self._opened_at >= self.recovery_time:
+            self._state = "half_open"
+            self._probes = 0
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Admit a call, or raise if the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half open with
+                every probe already in flight.
+        """
+        with self._lock:
+            now = monotonic()
+            state = self._current_state(now)
+            if state == "closed":
+                return
+            if state == "half_open" and self._probes < self.half_open_calls:
+                self._probes += 1
+                return
+            self._rejected += 1
+            retry_after = max(self._opened_at + self.recovery_time - now, 0.0)
+        raise CircuitOpenError(
+            f"Circuit open for {self.name or 'endpoint'}; "
+            f"retry in {retry_after:.1f} seconds",
+            retry_after,
+        )
+
+    def after_call(self, error: BaseException | None = None) -> None:
+        """
+        Record the outcome of an admitted call.
+
+        Args:
+            error: The exception the call raised, if any. A cancelled
+                call frees its probe slot without counting either way.
+        """
+        with self._lock:
+            half_open = self._state == "half_open"
+            if half_open:
+                self._probes = max(self._probes - 1, 0)
+            if isinstance(error, asyncio.CancelledError):
+                return
+            if error is None or not self.classify(error):
+                self._failures = 0
+                if half_open:
+                    self._state = "closed"
+                return
+            self._failures += 1
+            if half_open or (
+                self._state == "closed" and self._failures >= self.failure_threshold
+            ):
+                self._state = "open"
+                self._opened_at = monotonic()
+                self._opened += 1
+
+    def reset(self) -> None:
+        """Close the circuit."""
+        with self._lock:
+            self._state = "closed"
+            self._failures = 0
+            self._probes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the state, failure streak and open/reject counters."""
+        with self._lock:
+            return {
+                "state": self._current_state(monotonic()),
+                "failures": self._failures,
+                "opened": self._opened,
+                "rejected": self._rejected,
+            }
+
+
+class RetryPolicy:
+    """
+    How calls to one endpoint are retried, shared by all its callers.
+
+    Delays use decorrelated jitter: each delay is drawn between
+    `base_delay` and three times the previous delay, capped at
+    `max_delay`, so callers that failed together do not retry together.
+    An optional `RetryBudget` caps retries at a share of successful
+    calls, and an optional `CircuitBreaker` fails calls fast while the
+    endpoint is down. Both only work across callers when the policy
+    (or the budget and breaker) is shared; see `get_retry_policy`.
+
+    `alcall`, `bcall`, `alcall_iter`, `rcall` and `mcall` accept a
+    policy as `retry_policy`, in place of `num_retries`, `retry_delay`
+    and `backoff_factor`; `iModel` accepts one as `retry_policy`.
+
+    Args:
+        max_retries: Retries after the first attempt.
+        base_delay: The shortest delay, in seconds.
+        max_delay: The longest delay, in seconds.
+        retry_on: Tells whether an error is worth retrying; by default
+            only transient errors are (see `is_transient_error`). Pass
+            `lambda e: True` to retry every error. `CircuitOpenError` is
+            never retried.
+        budget: The retry budget, if any.
+        breaker: The circuit breaker, if any.
+
+    Example:
+        >>> policy = get_retry_policy(
+        ...     "openai/gpt-4o",
+        ...     budget=RetryBudget(ratio=0.1),
+        ...     breaker=CircuitBreaker(failure_threshold=5),
+        ... )
+        >>> await alcall(prompts, ask, retry_policy=policy)
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        *,
+        base_delay: float = 0.1,
+        max_delay: float = 20.0,
+        retry_on: Callable[[BaseException], bool] = is_transient_error,
+        budget: RetryBudget | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if not 0 <= base_delay <= max_delay:
+            raise ValueError("Expected 0 <= base_delay <= max_delay")
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.budget = budget
+        self.breaker = breaker
+
+    def next_delay(self, previous: float | None = None) -> float:
+        """Draw the delay after `previous`, the last delay slept."""
+        high = max(previous or self.base_delay, self.base_delay) * 3
+        return min(self.max_delay, random.uniform(self.base_delay, high))
+
+    def backoff(
+        self, error: BaseException, attempt: int, previous: float | None = None
+    ) -> float | None:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Takes a retry from the budget when one is granted.
+
+        Args:
+            error: The attempt's exception.
+            attempt: Failed attempts so far, including this one.
+            previous: The last delay slept, if any.
+
+        Returns:
+            float | None: The delay before the next attempt, or None to
+                give up.
+        """
+        if attempt > self.max_retries or isinstance(error, CircuitOpenError):
+            return None
+        if not self.retry_on(error):
+            return None
+        if self.breaker is not None and self.breaker.state == "open":
+            return None
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+        return self.next_delay(previous)
+
+    @contextmanager
+    def attempt(self) -> Iterator[None]:
+        """
+        Guard one attempt: check the breaker, then record the outcome.
+
+        Raises:
+            CircuitOpenError: If the breaker does not admit the call.
+        """
+        if self.breaker is not None:
+            self.breaker.before_call()
+        try:
+            yield
+        except BaseException as e:
+            if self.breaker is not None:
+                self.breaker.after_call(e)
+            raise
+        if self.breaker is not None:
+            self.breaker.after_call()
+        if self.budget is not None:
+            self.budget.record_success()
+
+    async def call(
+        self, func: Callable[..., Awaitable[T]], /, *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Await `func(*args, **kwargs)`, retrying under this policy.
+
+        Raises:
+            CircuitOpenError: If the breaker is open.
+            Exception: The last attempt's error, once retries run out.
+        """
+        failures = 0
+        delay = None
+        while True:
+            try:
+                with self.attempt():
+                    return await func(*args, **kwargs)
+            except Exception as e:
+                failures += 1
+                delay = self.backoff(e, failures, delay)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the budget's and breaker's stats."""
+        return {
+            "budget": self.budget.stats() if self.budget else None,
+            "breaker": self.breaker.stats() if self.breaker else None,
+        }
+
+
+_POLICIES: dict[Hashable, RetryPolicy] = {}
+_POLICIES_LOCK = threading.Lock()
+
+
+def get_retry_policy(key: Hashable, /, **kwargs: Any) -> RetryPolicy:
+    """
+    Return the process-wide retry policy for `key`, creating it if needed.
+
+    Everything calling the same endpoint should use the same key, so
+    that its callers share one retry budget and circuit breaker. A new
+    policy gets a default `RetryBudget` and `CircuitBreaker` unless
+    `budget` or `breaker` is passed; options passed for an existing key
+    are ignored.
+
+    Args:
+        key: Identifies the endpoint.
+        **kwargs: `RetryPolicy` options for a new policy.
+    """
+    with _POLICIES_LOCK:
+        policy = _POLICIES.get(key)
+        if policy is None:
+            kwargs.setdefault("budget", RetryBudget())
+            kwargs.setdefault("breaker", CircuitBreaker(name=str(key)))
+            policy = _POLICIES[key] = RetryPolicy(**kwargs)
+        return policy
+
+
+__all__ = [
+    "CircuitOpenError",
+    "is_transient_error",
+    "RetryBudget",
+    "CircuitBreaker",
+    "RetryPolicy",
+    "get_retry_policy",
+]
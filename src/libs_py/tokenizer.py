@@ -0,0 +1,308 @@
+"""
+Copyright 2024 HaiyangLi
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Token counting.
+
+The default tokenizer is a heuristic estimate that needs no vocabulary.
+Exact counts come from local BPE tokenizers (`tiktoken` or Hugging Face
+`tokenizers`), which are imported only when one is created.
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
+from hashlib import blake2b
+from typing import Any
+
+from .package import check_import
+
+
+class Tokenizer(ABC):
+    """
+    Base class for token counters.
+
+    Subclasses implement `_count_batch`. Counts are memoized in an LRU
+    cache keyed by a hash of the text, so recounting the same content
+    (a message sent on every call, a chunk re-embedded) costs a hash.
+
+    Attributes:
+        name: Identifies the tokenizer and its vocabulary.
+    """
+
+    name: str = "tokenizer"
+
+    def __init__(self, cache_size: int = 4096) -> None:
+        self.cache_size = cache_size
+        self._cache: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _count_batch(self, texts: Sequence[str], /) -> list[int]:
+        """Count the tokens of each text, without caching."""
+
+    def count(self, text: str, /) -> int:
+        """Return the number of tokens in `text`."""
+        return self.count_batch([text])[0]
+
+    def count_batch(self, texts: Sequence[str], /) -> list[int]:
+        """
+        Return the number of tokens in each of `texts`.
+
+        Uncached texts are counted in one `_count_batch` call, which
+        exact tokenizers run in parallel.
+        """
+        if not self.cache_size:
+            return self._count_batch(texts)
+
+        keys = [blake2b(t.encode(), digest_size=16).digest() for t in texts]
+        counts: list[int | None] = [None] * len(texts)
+        with self._lock:
+            for i, key in enumerate(keys):
+                if (hit := self._cache.get(key)) is not None:
+                    self._cache.move_to_end(key)
+                    counts[i] = hit
+
+        missing = [i for i, c in enumerate(counts) if c is None]
+        if missing:
+            fresh = self._count_batch([texts[i] for i in missing])
+            with self._lock:
+                for i, count in zip(missing, fresh):
+                    counts[i] = count
+                    self._cache[keys[i]] = count
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return counts
+
+    def cache_clear(self) -> None:
+        """Drop every cached count."""
+        with self._lock:
+            self._cache.clear()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r})"
+
+
+class HeuristicTokenizer(Tokenizer):
+    """
+    Estimate tokens from text length, without a vocabulary.
+
+    ASCII text is counted as one token per `chars_per_token` characters,
+    other text per `chars_per_token` UTF-8 bytes, which keeps CJK and
+    other multi-byte scripts from being undercounted. Estimates are
+    cheaper than a cache lookup, so nothing is cached.
+    """
+
+    def __init__(self, chars_per_token: float = 4.0) -> None:
+        super().__init__(cache_size=0)
+        self.chars_per_token = chars_per_token
+        self.name = f"heuristic/{chars_per_token:g}"
+
+    def _count_batch(self, texts: Sequence[str], /) -> list[int]:
+        per = self.chars_per_token
+        return [
+            -int(-(len(t) if t.isascii() else len(t.encode())) // per) for t in texts
+        ]
+
+
+class TiktokenTokenizer(Tokenizer):
+    """
+    Exact counts for OpenAI models, with `tiktoken`.
+
+    Args:
+        encoding: A tiktoken encoding name, such as "o200k_base".
+        model: A model name to look the encoding up from, instead.
+        cache_size: Maximum number of cached counts.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "o200k_base",
+        *,
+        model: str | None = None,
+        cache_size: int = 4096,
+    ) -> None:
+        super().__init__(cache_size=cache_size)
+        tiktoken = check_import(
+            "tiktoken",
+            attempt_install=False,
+            error_message="tiktoken is required for TiktokenTokenizer.",
+        )
+        if model is not None:
+            self._encoding = tiktoken.encoding_for_model(model)
+        else:
+            self._encoding = tiktoken.get_encoding(encoding)
+        self.name = f"tiktoken/{self._encoding.name}"
+
+    def encode(self, text: str, /) -> list[int]:
+        """Return the token IDs of `text`."""
+        return self._encoding.encode_ordinary(text)
+
+    def _count_batch(self, texts: Sequence[str], /) -> list[int]:
+        if len(texts) == 1:
+            return [len(self._encoding.encode_ordinary(texts[0]))]
+        return [len(ids) for ids in self._encoding.encode_ordinary_batch(texts)]
+
+
+class HFTokenizer(Tokenizer):
+    """
+    Exact counts with a Hugging Face `tokenizers` tokenizer.
+
+    Args:
+        name: A tokenizer on the Hugging Face Hub, or a local
+            `tokenizer.json` path.
+        cache_size: Maximum number of cached counts.
+    """
+
+    def __init__(self, name: str, *, cache_size: int = 4096) -> None:
+        super().__init__(cache_size=cache_size)
+        tokenizers = check_import(
+            "tokenizers",
+            attempt_install=False,
+            error_message="tokenizers is required for HFTokenizer.",
+        )
+        if name.endswith(".json"):
+            self._tokenizer = tokenizers.Tokenizer.from_file(name)
+        else:
+            self._tokenizer = tokenizers.Tokenizer.from_pretrained(name)
+        self.name = f"hf/{name}"
+
+    def encode(self, text: str, /) -> list[int]:
+        """Return the token IDs of `text`."""
+        return self._tokenizer.encode(text, add_special_tokens=False).ids
+
+    def _count_batch(self, texts: Sequence[str], /) -> list[int]:
+        encodings = self._tokenizer.encode_batch(list(texts), add_special_tokens=False)
+        return [len(e.ids) for e in encodings]
+
+
+_default_tokenizer: Tokenizer = HeuristicTokenizer()
+
+
+def get_tokenizer() -> Tokenizer:
+    """Return the process-wide default tokenizer."""
+    return _default_tokenizer
+
+
+def set_tokenizer(tokenizer: Tokenizer) -> None:
+    """
+    Replace the process-wide default tokenizer.
+
+    Token counts already cached on messages are keyed by tokenizer name,
+    so they are recounted with the new tokenizer on next use.
+    """
+    global _default_tokenizer
+    if not isinstance(tokenizer, Tokenizer):
+        raise TypeError(f"Expected a Tokenizer, got {type(tokenizer).__name__}.")
+    _default_tokenizer = tokenizer
+
+
+def count_tokens(text: str, /, tokenizer: Tokenizer | None = None) -> int:
+    """Count the tokens of `text` with `tokenizer` or the default."""
+    return (tokenizer or _default_tokenizer).count(text)
+
+
+def count_tokens_batch(
+    texts: Sequence[str], /, tokenizer: Tokenizer | None = None
+) -> list[int]:
+    """Count the tokens of each of `texts` with `tokenizer` or the default."""
+    return (tokenizer or _default_tokenizer).count_batch(texts)
+
+
+# Rough chat-format costs: the per-message framing tokens OpenAI documents,
+# and the base cost of a low-detail image.
+_MESSAGE_OVERHEAD = 4
+_IMAGE_TOKENS = 85
+
+
+def chat_msg_text(chat_msg: dict[str, Any] | None) -> str:
+    """Return the text of a message in chat format, without images."""
+    if not chat_msg:
+        return ""
+    content = chat_msg.get("content")
+    if isinstance(content, list):
+        return " ".join(
+            str(part.get("text", "")) if isinstance(part, dict) else str(part)
+            for part in content
+        )
+    return content if isinstance(content, str) else str(content)
+
+
+def _image_tokens(chat_msg: dict[str, Any]) -> int:
+    content = chat_msg.get("content")
+    if not isinstance(content, list):
+        return 0
+    return _IMAGE_TOKENS * sum(
+        1
+        for part in content
+        if isinstance(part, dict) and part.get("type") == "image_url"
+    )
+
+
+def count_chat_tokens(
+    chat_msg: dict[str, Any] | None, tokenizer: Tokenizer | None = None
+) -> int:
+    """
+    Count the prompt tokens of a message in chat format.
+
+    Args:
+        chat_msg: The message as returned by `RoledMessage.chat_msg`.
+        tokenizer: Defaults to `get_tokenizer()`.
+
+    Returns:
+        int: Tokens of the text, plus framing and image costs.
+    """
+    if not chat_msg:
+        return 0
+    tokenizer = tokenizer or _default_tokenizer
+    text_tokens = tokenizer.count(chat_msg_text(chat_msg))
+    return _MESSAGE_OVERHEAD + text_tokens + _image_tokens(chat_msg)
+
+
+def count_request_tokens(
+    messages: Sequence[dict[str, Any]], tokenizer: Tokenizer | None = None
+) -> int:
+    """
+    Count the prompt tokens of a chat request, texts counted in one batch.
+
+    Args:
+        messages: The request's messages in chat format.
+        tokenizer: Defaults to `get_tokenizer()`.
+
+    Returns:
+        int: Tokens of every message, as `count_chat_tokens` counts them.
+    """
+    messages = [m for m in messages if m]
+    tokenizer = tokenizer or _default_tokenizer
+    counts = tokenizer.count_batch([chat_msg_text(m) for m in messages])
+    return sum(
+        _MESSAGE_OVERHEAD + count + _image_tokens(m)
+        for m, count in zip(messages, counts)
+    )
+
+
+__all__ = [
+    "Tokenizer",
+    "HeuristicTokenizer",
+    "TiktokenTokenizer",
+    "HFTokenizer",
+    "get_tokenizer",
+    "set_tokenizer",
+    "count_tokens",
+    "count_tokens_batch",
+    "chat_msg_text",
+    "count_chat_tokens",
+    "count_request_tokens",
+]
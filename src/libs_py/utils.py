@@ -3,6 +3,7 @@ import copy as _copy
 import importlib
 import importlib.metadata
 import importlib.util
+import json
 import os
 import random
 import subprocess
@@ -85,6 +86,110 @@ def get_class_file_registry(folder_path, pattern_list):
     return class_file_registry
 
 
+CLASS_MANIFEST_VERSION = 1
+
+
+def _read_class_manifest(cache_files: list[str]) -> dict:
+    for fp in cache_files:
+        try:
+            with open(fp) as f:
+                data = json.load(f)
+            if data.get("version") == CLASS_MANIFEST_VERSION:
+                return data["files"]
+        except Exception:
+            continue
+    return {}
+
+
+def _write_class_manifest(cache_files: list[str], files: dict) -> None:
+    data = {"version": CLASS_MANIFEST_VERSION, "files": files}
+    for fp in cache_files:
+        try:
+            os.makedirs(os.path.dirname(fp), exist_ok=True)
+            tmp = f"{fp}.{os.getpid()}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, fp)
+            return
+        except OSError:
+            continue
+
+
+def get_cached_class_file_registry(
+    folder_path: str,
+    pattern_list: list[str],
+    cache_files: list[str],
+) -> dict[str, str]:
+    """
+    Same result as `get_class_file_registry`, backed by an on-disk manifest.
+
+    The manifest records, per source file, its mtime, size, SHA-256 and
+    class names. A file is only re-parsed when its content changed: an
+    unchanged mtime and size is trusted outright, otherwise the file is
+    hashed and compared. Manifests therefore survive being copied with
+    the package (e.g. one generated at build time).
+
+    Args:
+        folder_path: Root folder to scan.
+        pattern_list: Substrings a directory path must contain.
+        cache_files: Candidate manifest paths, in order of preference.
+            The first readable one is used; an updated manifest is
+            written to the first writable one.
+
+    Returns:
+        A dict mapping class names to source file paths.
+    """
+    manifest = _read_class_manifest(cache_files)
+    files = {}
+    changed = False
+    for root, _, names in os.walk(folder_path):
+        if not any(pattern in root for pattern in pattern_list):
+            continue
+        for name in names:
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, folder_path)
+            stat = os.stat(path)
+            entry = manifest.get(rel)
+            if (
+                entry
+                and entry["mtime"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+            ):
+                files[rel] = entry
+                continue
+
+            with open(path, "rb") as f:
+                source = f.read()
+            digest = sha256(source).hexdigest()
+            if entry and entry["sha256"] == digest:
+                classes = entry["classes"]
+            else:
+                classes = [
+                    node.name
+                    for node in ast.parse(source).body
+                    if isinstance(node, ast.ClassDef)
+                ]
+            files[rel] = {
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": digest,
+                "classes": classes,
+            }
+            changed = True
+
+    if changed or files.keys() != manifest.keys():
+        _write_class_manifest(cache_files, files)
+
+    class_file_registry = {}
+    for rel, entry in files.items():
+        path = os.path.join(folder_path, rel)
+        for class_name in entry["classes"]:
+            class_file_registry[class_name] = path
+    return class_file_registry
+
+
 def get_class_objects(file_path):
     class_objects = {}
     spec = importlib.util.spec_from_file_location("module.name", file_path)
@@ -175,6 +280,36 @@ def copy(obj: T, /, *, deep: bool = True, num: int = 1) -> T | list[T]:
     return [copy_func(obj) for _ in range(num)] if num > 1 else copy_func(obj)
 
 
+def copy_nested(obj: T, /) -> T:
+    """
+    Copy the containers of a nested structure, sharing the leaves.
+
+    Dicts, lists, tuples and sets are rebuilt recursively and subclasses
+    of them are deep-copied; every other value (strings, numbers, models,
+    arbitrary objects) is shared with the original. This is enough to make
+    JSON-like content independent of its source at a fraction of the cost
+    of `copy.deepcopy`.
+
+    Args:
+        obj: The structure to copy.
+
+    Returns:
+        A structure equal to `obj` that shares no containers with it.
+    """
+    cls = type(obj)
+    if cls is dict:
+        return {k: copy_nested(v) for k, v in obj.items()}
+    if cls is list:
+        return [copy_nested(i) for i in obj]
+    if cls is tuple:
+        return tuple(copy_nested(i) for i in obj)
+    if cls is set:
+        return set(obj)
+    if isinstance(obj, dict | list | set):
+        return _copy.deepcopy(obj)
+    return obj
+
+
 def run_pip_command(
     args: Sequence[str],
 ) -> subprocess.CompletedProcess[bytes]:
@@ -245,6 +380,7 @@ __all__ = [
     "get_class_objects",
     "time",
     "copy",
+    "copy_nested",
     "run_pip_command",
     "format_deprecation_msg",
     "get_bins",
@@ -15,6 +15,8 @@ class JsonAdapter(Adapter):
 
     @classmethod
     def to_obj(cls, subj: T) -> str:
+        if hasattr(subj, "to_json"):  # components cache their encoding
+            return subj.to_json()
         return json.dumps(subj.to_dict())
 
 
@@ -35,5 +37,5 @@ class JsonFileAdapter(Adapter):
         fp: str | Path,
     ) -> None:
         with open(fp, "w") as f:
-            json.dump(subj.to_dict(), f)
+            f.write(JsonAdapter.to_obj(subj))
         logging.info(f"Successfully saved data to {fp}")
@@ -1,11 +1,33 @@
+"""
+Pandas-backed adapters.
+
+The adapters are registered on every Pile and Component, so pandas and
+`lion.integrations.pandas_` are only imported when one of them is used.
+"""
+
+from __future__ import annotations
+
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
-
-from lion.integrations.pandas_ import to_df
 from lion.protocols.adapters.adapter import Adapter, T
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _pandas():
+    import pandas
+
+    return pandas
+
+
+def _to_df(*args, **kwargs) -> pd.DataFrame:
+    from lion.integrations.pandas_ import to_df
+
+    return to_df(*args, **kwargs)
+
 
 class PandasSeriesAdapter(Adapter):
 
@@ -18,7 +40,7 @@ class PandasSeriesAdapter(Adapter):
 
     @classmethod
     def to_obj(cls, subj: T, /, **kwargs) -> pd.Series:
-        return pd.Series(subj.to_dict(), **kwargs)
+        return _pandas().Series(subj.to_dict(), **kwargs)
 
 
 class PandasDataFrameAdapter(Adapter):
@@ -39,9 +61,9 @@ class PandasDataFrameAdapter(Adapter):
             _dict = i.to_dict()
             _dict["timestamp"] = i.created_datetime
             out_.append(_dict)
-        df = to_df(out_, **kwargs)
+        df = _to_df(out_, **kwargs)
         if "timestamp" in df.columns:
-            df["timestamp"] = pd.to_datetime(df["timestamp"])
+            df["timestamp"] = _pandas().to_datetime(df["timestamp"])
         return df
 
 
@@ -53,7 +75,7 @@ class CSVFileAdapter(Adapter):
     @classmethod
     def from_obj(cls, subj_cls: type[T], obj: str | Path, /, **kwargs) -> list[dict]:
         """kwargs for pd.read_csv"""
-        df = pd.read_csv(obj, **kwargs)
+        df = _pandas().read_csv(obj, **kwargs)
         return df.to_dict(orient="records")
 
     @classmethod
@@ -66,7 +88,7 @@ class CSVFileAdapter(Adapter):
     ) -> None:
         """kwargs for pd.DataFrame.to_csv"""
         kwargs["index"] = False
-        to_df([i.to_dict() for i in subj]).to_csv(fp, **kwargs)
+        _to_df([i.to_dict() for i in subj]).to_csv(fp, **kwargs)
         logging.info(f"Successfully saved data to {fp}")
 
 
@@ -77,10 +99,10 @@ class ExcelFileAdapter(Adapter):
 
     @classmethod
     def from_obj(cls, subj_cls: type[T], obj: str | Path, /, **kwargs) -> list[dict]:
-        return pd.read_excel(obj, **kwargs).to_dict(orient="records")
+        return _pandas().read_excel(obj, **kwargs).to_dict(orient="records")
 
     @classmethod
     def to_obj(cls, subj: list[T], /, fp: str | Path, **kwargs) -> None:
         kwargs["index"] = False
-        to_df([i.to_dict() for i in subj]).to_excel(fp, **kwargs)
+        _to_df([i.to_dict() for i in subj]).to_excel(fp, **kwargs)
         logging.info(f"Saved {subj.class_name()} to {fp}")
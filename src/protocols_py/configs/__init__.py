@@ -1,4 +1,4 @@
-from .branch_config import BranchConfig, MessageConfig
+from .branch_config import BranchConfig, ContextWindowConfig, MessageConfig
 from .id_config import LionIDConfig
 from .imodel_config import iModelConfig
 from .log_config import LogConfig
@@ -12,4 +12,5 @@ __all__ = [
     "iModelConfig",
     "BranchConfig",
     "MessageConfig",
+    "ContextWindowConfig",
 ]
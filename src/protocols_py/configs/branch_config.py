@@ -30,6 +30,41 @@ class MessageConfig(SchemaModel):
     )
 
 
+class ContextWindowConfig(SchemaModel):
+    """Configuration for the message window sent to the model.
+
+    With the defaults no limit applies and the whole conversation is
+    sent. A turn is an instruction and the messages that follow it up to
+    the next instruction, so action requests stay with their responses.
+    """
+
+    max_tokens: int | None = Field(
+        default=None,
+        ge=1,
+        description="Token budget for the messages sent, including the new one",
+    )
+    max_turns: int | None = Field(
+        default=None, ge=0, description="Maximum number of recent turns to send"
+    )
+    keep_last_turns: int = Field(
+        default=1,
+        ge=0,
+        description="Recent turns sent even when they exceed the token budget",
+    )
+    keep_system: bool = Field(
+        default=True, description="Whether to always send the system message"
+    )
+    overflow: Literal["drop", "summarize"] = Field(
+        default="drop",
+        description="What to do with turns that do not fit the window",
+    )
+    summary_max_tokens: int = Field(
+        default=256,
+        ge=1,
+        description="Budget reserved for the summary of older turns",
+    )
+
+
 class BranchConfig(SchemaModel):
     """Main configuration for Branch class.
 
@@ -51,6 +86,10 @@ class BranchConfig(SchemaModel):
         default_factory=MessageConfig,
         description="Configuration for message handling",
     )
+    context_window_config: ContextWindowConfig = Field(
+        default_factory=ContextWindowConfig,
+        description="Configuration for the message window sent to the model",
+    )
     auto_register_tools: bool = Field(
         default=True,
         description="Whether to automatically register tools when needed",
@@ -72,6 +111,7 @@ class BranchConfig(SchemaModel):
 
 
 __all__ = [
+    "ContextWindowConfig",
     "MessageConfig",
     "BranchConfig",
 ]
@@ -9,3 +9,4 @@ class LionIDConfig(SchemaModel):
     hyphen_end_index: int
     prefix: str = "ln"
     postfix: str = ""
+    sortable: bool = False
@@ -0,0 +1,25 @@
+import asyncio
+import os
+
+import pytest
+
+from lion.libs.func import alcall, ucall
+
+
+def _pid(_: object = None) -> int:
+    return os.getpid()
+
+
+def test_ucall_runs_sync_func_in_named_pool():
+    assert asyncio.run(ucall(_pid)) == os.getpid()
+    assert asyncio.run(ucall(_pid, pool="cpu")) != os.getpid()
+
+
+def test_alcall_passes_pool_through():
+    pids = asyncio.run(alcall([1, 2], _pid, pool="cpu"))
+    assert os.getpid() not in pids
+
+
+def test_alcall_rejects_unknown_pool():
+    with pytest.raises(KeyError):
+        asyncio.run(alcall([1], _pid, pool="missing"))
@@ -0,0 +1,52 @@
+import json
+
+from lion.core.communication import Instruction
+
+
+def _instruction() -> Instruction:
+    return Instruction(
+        instruction="Summarize the report",
+        context=["page 1"],
+        sender="user",
+        recipient="user",
+    )
+
+
+def test_to_dict_sees_in_place_content_edit():
+    msg = _instruction()
+    assert msg.to_dict()["content"]["context"] == ["page 1"]
+    assert json.loads(msg.to_json())["content"]["context"] == ["page 1"]
+
+    msg.content["context"].append("page 2")
+    assert msg.to_dict()["content"]["context"] == ["page 1", "page 2"]
+    assert json.loads(msg.to_json())["content"]["context"] == ["page 1", "page 2"]
+
+    msg.content["context"][0] = "cover"
+    assert msg.to_dict()["content"]["context"] == ["cover", "page 2"]
+
+
+def test_to_dict_sees_in_place_metadata_edit():
+    msg = _instruction()
+    msg.metadata.content["tags"] = ["draft"]
+    assert msg.to_dict()["metadata"]["tags"] == ["draft"]
+
+    msg.metadata.content["tags"].append("final")
+    assert msg.to_dict()["metadata"]["tags"] == ["draft", "final"]
+
+
+def test_cached_to_dict_is_not_shared():
+    msg = _instruction()
+    msg.to_dict()["content"]["context"].append("leaked")
+    assert msg.to_dict()["content"]["context"] == ["page 1"]
+
+
+def test_chat_msg_sees_in_place_content_edit():
+    msg = _instruction()
+    assert "page 2" not in msg.chat_msg["content"]
+
+    msg.content["context"].append("page 2")
+    assert "page 2" in msg.chat_msg["content"]
+
+    msg.content["context"][0] = "cover"
+    assert "cover" in msg.chat_msg["content"]
+    assert "page 1" not in msg.chat_msg["content"]
@@ -0,0 +1,30 @@
+import asyncio
+
+from lion.libs.retry import RetryPolicy
+
+
+class _Status(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(status_code)
+        self.status_code = status_code
+
+
+def test_default_retries_only_transient_errors():
+    policy = RetryPolicy(max_retries=3)
+    for error in (
+        TimeoutError(),
+        asyncio.TimeoutError(),
+        ConnectionResetError(),
+        _Status(429),
+        _Status(502),
+    ):
+        assert policy.backoff(error, 1) is not None, error
+
+    for error in (ValueError("bad input"), KeyError("x"), _Status(400)):
+        assert policy.backoff(error, 1) is None, error
+
+
+def test_retry_on_can_widen_the_default():
+    policy = RetryPolicy(max_retries=3, retry_on=lambda e: True)
+    assert policy.backoff(ValueError("bad input"), 1) is not None
+    assert policy.backoff(ValueError("bad input"), 4) is None